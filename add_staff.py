@@ -1,298 +1,250 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.common.keys import Keys
-import json
-import time
 import argparse
 import sys
+from anime_record import as_anime_record, load_anime_record
+from role_resolver import ROLE_MAPPING, ROLE_RESOLVER, normalize_role
+from tag_catalog import TagCatalog
+from staff_id_cache import StaffIdCache
+from wait_engine import WAITS, field_value_changes, parse_budgets, visible_links
+from session_store import DEFAULT_SESSION_PATH, SessionStore
+from browser_profile import BROWSER_PROFILES, BROWSER_STATS, create_browser
+
+# Class attribute of every [id^='t_'] element, read in one round trip
+TAG_STATES_SCRIPT = """
+var states = {};
+document.querySelectorAll("[id^='t_']").forEach(function (element) {
+    states[element.id] = element.getAttribute("class") || "";
+});
+return states;
+"""
+
+# Clicks the given tag ids in one round trip
+CLICK_TAGS_SCRIPT = """
+arguments[0].forEach(function (tagId) {
+    var element = document.getElementById(tagId);
+    if (element) {
+        element.click();
+    }
+});
+"""
+
+# Fills the business name and its hidden ID like an autocomplete selection would
+SET_BUSINESS_SCRIPT = """
+document.getElementById("name_business").value = arguments[0];
+var idField = document.getElementById("id_business");
+idField.value = arguments[1];
+idField.dispatchEvent(new Event("change", {bubbles: true}));
+"""
+
+CLEAR_BUSINESS_ID_SCRIPT = 'document.getElementById("id_business").value = "";'
 
-# Role mapping dictionary: maps roles from JSON to roles in the form
-ROLE_MAPPING = {
-    # Director/Réalisateur roles
-    "Director": "Réalisation",
-    "Réalisateur": "Réalisation",
-    "Chief Director": "Directeur exécutif",
-    "Assistant Director": "Assistance à la réalisation",
-    "Episode Director": "Directeur d'épisode",
-    "Series Director": "Supervision",
-    
-    # Producer/Production roles
-    "Producer": "Producteur (staff)",
-    "Production": "Production",
-    "Executive Producer": "Producteur délégué",
-    "Line Producer": "Producteur exécutif",
-    "Production Manager": "Production manager",
-    
-    # Animation roles
-    "Animation": "Animation",
-    "Key Animation": "Animation clé",
-    "Animateur clé": "Animation clé",
-    "Chef animateur": "Chef animateur",
-    "Chief animator": "Chef animateur",
-    "Animation Director": "Directeur de l'animation",
-    "In-Between Animation": "Intervaliste",
-    "CGI Director": "Réalisateur 3D",
-    "3D Director": "Réalisateur 3D",
-    "CG Director": "Réalisateur 3D",
-    "CGI": "CGI",
-    "Animation CGI": "Animation CGI",
-    "3D Animation": "Animation CGI",
-    
-    # Design roles
-    "Character Design": "Chara-design",
-    "Character designer": "Chara-design",
-    "Chara-Design": "Chara-design",
-    "Original Character Design": "Chara-design original",
-    "Original character designer": "Chara-design original",
-    "Art Design": "Art design",
-    "Design Work": "Design work",
-    "Mecha Design": "Mecha-design",
-    "Monster Design": "Monster-design",
-    "Prop Design": "Prop-design",
-    "Set Design": "Set design",
-    "Scene Design": "Scene-design",
-    "Background": "Décors",
-    "Décors": "Décors",
-    "Chargé des décors": "Décors",
-    "Layout": "Layout",
-    "Color Design": "Couleurs",
-    "Couleurs": "Couleurs",
-    "Color design": "Couleurs",
-    "Colors": "Couleurs",
-    "Title Design": "Title Design",
-    
-    # Sound/Music roles
-    "Sound Director": "Directeur du son",
-    "Directeur du son": "Directeur du son",
-    "Music": "Musique",
-    "Musique": "Musique",
-    "Composer": "Musique",
-    "Sound Production": "Production du son",
-    "Music Production": "Production de la musique",
-    
-    # Story roles
-    "Original creator": "Auteur",
-    "Créateur original": "Créateur original",
-    "Original Work": "Auteur",
-    "Scenario": "Scénario",
-    "Scénariste": "Scénario",
-    "Screenplay": "Scénario",
-    "Script": "Script",
-    "Series Composition": "Composition de la série",
-    "Story": "Scénario",
-    "Original Story": "Idée originale",
-    "Concept original": "Idée originale",
-    "Original Concept": "Idée originale",
-    "Planning": "Planning",
-    "Storyboard": "Storyboard",
-    
-    # Technical roles
-    "Art Director": "Directeur artistique",
-    "Directeur artistique": "Directeur artistique",
-    "Photography Director": "Directeur de la photographie",
-    "Directeur de la photo": "Directeur de la photographie",
-    "FX Production": "Effets spéciaux",
-    "VFX Supervisor": "Effets spéciaux",
-    "FX": "Effets spéciaux",
-    "Special Effects": "Effets spéciaux",
-    "Effets spéciaux": "Effets spéciaux",
-    "Editing": "Montage",
-    "Montage": "Montage",
-    "Editor": "Montage",
-    
-    # Studio roles
-    "Studio": "Studio d'animation",
-    "Animation Studio": "Studio d'animation",
-    "Animation Production": "Studio d'animation",
-    "Animation Assistance": "Studio d'animation (sous-traitance)",
-    
-    # Other roles
-    "Supervision": "Supervision",
-    "Illustrations originales": "Illustrations originales",
-    "Original Arts": "Illustrations originales",
-    "Original Illustrations": "Illustrations originales",
-    "Distribution": "Distribution",
-    "Broadcaster": "Diffuseur",
-    "Diffuseur": "Diffuseur",
-    "Motion Design": "Motion Design"
-}
 
 class TagSelector:
-    def __init__(self, driver):
+    # Curated terms (FR/EN synonyms and special mappings) -> tag, based on the
+    # actual HTML structure; the harvested catalog covers the other labels
+    TAG_SYNONYMS = {
+        # === GENRES (from your HTML) ===
+        "Action": {"id": "t_9", "name": "action"},
+        "Aventure": {"id": "t_10", "name": "aventure"},
+        "Adventure": {"id": "t_10", "name": "aventure"},
+        "Comédie": {"id": "t_15", "name": "comédie"},
+        "Comedy": {"id": "t_15", "name": "comédie"},
+        "Drame": {"id": "t_11", "name": "drame"},
+        "Drama": {"id": "t_11", "name": "drame"},
+        "Ecchi": {"id": "t_77", "name": "ecchi"},
+        "Guerre": {"id": "t_16", "name": "guerre"},
+        "War": {"id": "t_16", "name": "guerre"},
+        "Historique": {"id": "t_38", "name": "historique"},
+        "Historical": {"id": "t_38", "name": "historique"},
+        "Horreur": {"id": "t_19", "name": "horreur"},
+        "Horreur / Épouvante": {"id": "t_19", "name": "horreur"},
+        "Horror": {"id": "t_19", "name": "horreur"},
+        "Policier": {"id": "t_14", "name": "policier"},
+        "Psychologique": {"id": "t_18", "name": "psychologique"},
+        "Psychological": {"id": "t_18", "name": "psychologique"},
+        "Romance": {"id": "t_13", "name": "romance"},
+        "Sport": {"id": "t_17", "name": "sport"},
+        "Sports": {"id": "t_17", "name": "sport"},
+        "Thriller": {"id": "t_12", "name": "thriller"},
+        "Slice of Life": {"id": "t_45", "name": "tranches de vie"},
+        "Slice of life": {"id": "t_45", "name": "tranches de vie"},
+        "Western": {"id": "t_112", "name": "western"},
+        "Jeux vidéo": {"id": "t_72", "name": "jeu vidéo"},
+        
+        # === CLASSIFICATION ===
+        "Josei": {"id": "t_85", "name": "josei"},
+        "Kodomo": {"id": "t_8", "name": "kodomo"},
+        "Seinen": {"id": "t_5", "name": "seinen"},
+        "Shôjo": {"id": "t_3", "name": "shôjo"},
+        "Shoujo": {"id": "t_3", "name": "shôjo"},
+        "Shônen": {"id": "t_1", "name": "shônen"},
+        "Shounen": {"id": "t_1", "name": "shônen"},
+        "Yaoi": {"id": "t_7", "name": "yaoi"},
+        "Yuri": {"id": "t_6", "name": "yuri"},
+        
+        # === UNIVERS ===
+        "Cyberpunk": {"id": "t_41", "name": "cyberpunk"},
+        "Fantastique": {"id": "t_37", "name": "fantastique"},
+        "Fantasy": {"id": "t_35", "name": "fantasy"},
+        "Gothique": {"id": "t_111", "name": "gothique"},
+        "Post-apocalyptique": {"id": "t_39", "name": "post-apocalyptique"},
+        "Réaliste": {"id": "t_34", "name": "réaliste"},
+        "Science-fiction": {"id": "t_36", "name": "sci-fi"},
+        "Sci-Fi": {"id": "t_36", "name": "sci-fi"},
+        "Space opera": {"id": "t_22", "name": "space opera"},
+        "Space Opera": {"id": "t_22", "name": "space opera"},
+        "Steampunk": {"id": "t_40", "name": "steampunk"},
+        "Surréaliste": {"id": "t_133", "name": "surréaliste"},
+        
+        # === ÉPOQUE ET LIEU ===
+        "École": {"id": "t_33", "name": "école"},
+        "Ecole": {"id": "t_33", "name": "école"},
+        "School": {"id": "t_33", "name": "école"},
+        "School Life": {"id": "t_33", "name": "école"},
+        "Époque Edo": {"id": "t_43", "name": "époque Edo"},
+        "Ère Taishō": {"id": "t_188", "name": "ère Taishō"},
+        "Meiji": {"id": "t_167", "name": "meiji"},
+        "Monde parallèle": {"id": "t_121", "name": "monde parallèle"},
+        "Univers alternatif": {"id": "t_121", "name": "monde parallèle"},
+        "Moyen Age": {"id": "t_44", "name": "Moyen Age"},
+        "Prison": {"id": "t_145", "name": "prison"},
+        "Seconde guerre mondiale": {"id": "t_42", "name": "seconde guerre mondiale"},
+        
+        # === SOUS-GENRE ===
+        "Arts martiaux": {"id": "t_31", "name": "arts martiaux"},
+        "Combat": {"id": "t_20", "name": "combat"},
+        "Combats": {"id": "t_20", "name": "combat"},
+        "Harem": {"id": "t_26", "name": "harem"},
+        "Isekai": {"id": "t_186", "name": "isekai"},
+        "Magical girl": {"id": "t_24", "name": "magical girl"},
+        "Mahou Shoujo": {"id": "t_24", "name": "magical girl"},
+        "Magie": {"id": "t_25", "name": "magie"},
+        "Magic": {"id": "t_25", "name": "magie"},
+        "Mecha": {"id": "t_23", "name": "mecha"},
+        "Mechas": {"id": "t_23", "name": "mecha"},
+        "Mystère": {"id": "t_104", "name": "mystère"},
+        "Mystery": {"id": "t_104", "name": "mystère"},
+        "Parodie": {"id": "t_30", "name": "parodie"},
+        "Super-pouvoirs": {"id": "t_32", "name": "super-pouvoirs"},
+        "Surnaturel": {"id": "t_80", "name": "surnaturel"},
+        "Supernatural": {"id": "t_80", "name": "surnaturel"},
+        "Voyage temporel": {"id": "t_158", "name": "voyage temporel"},
+        "Time Travel": {"id": "t_158", "name": "voyage temporel"},
+        
+        # === PERSONNAGES ===
+        "Aliens / Extra-terrestres": {"id": "t_102", "name": "extra-terrestre"},
+        "Extra-terrestre": {"id": "t_102", "name": "extra-terrestre"},
+        "Ange": {"id": "t_88", "name": "ange"},
+        "Animal": {"id": "t_114", "name": "animal"},
+        "Assassin": {"id": "t_179", "name": "assassin"},
+        "Catgirl": {"id": "t_98", "name": "catgirl"},
+        "Chasseur de prime": {"id": "t_49", "name": "chasseur de prime"},
+        "Cyborg": {"id": "t_53", "name": "cyborg"},
+        "Démon": {"id": "t_56", "name": "démon"},
+        "Démons": {"id": "t_56", "name": "démon"},
+        "Détective": {"id": "t_134", "name": "détective"},
+        "Dieu/déesse": {"id": "t_78", "name": "dieu/déesse"},
+        "Enfant": {"id": "t_119", "name": "enfant"},
+        "Espion": {"id": "t_182", "name": "espion"},
+        "Fantôme": {"id": "t_107", "name": "fantôme"},
+        "Fantômes": {"id": "t_107", "name": "fantôme"},
+        "Guerrier": {"id": "t_108", "name": "guerrier"},
+        "Idol": {"id": "t_175", "name": "idol"},
+        "Idols": {"id": "t_175", "name": "idol"},
+        "Magicien": {"id": "t_52", "name": "magicien"},
+        "Militaire": {"id": "t_93", "name": "militaire"},
+        "Monstre": {"id": "t_110", "name": "monstre"},
+        "Monstres": {"id": "t_110", "name": "monstre"},
+        "Ninja": {"id": "t_89", "name": "ninja"},
+        "Pirate": {"id": "t_87", "name": "pirate"},
+        "Robot": {"id": "t_92", "name": "robot"},
+        "Robots": {"id": "t_92", "name": "robot"},
+        "Samouraï": {"id": "t_51", "name": "samouraï"},
+        "Samouraïs": {"id": "t_51", "name": "samouraï"},
+        "Sorcière": {"id": "t_127", "name": "sorcière"},
+        "Super-héros": {"id": "t_101", "name": "super-héros"},
+        "Vampire": {"id": "t_55", "name": "vampire"},
+        "Vampires": {"id": "t_55", "name": "vampire"},
+        "Yakuza": {"id": "t_100", "name": "yakuza"},
+        "Yōkai": {"id": "t_168", "name": "yôkai"},
+        "Zombie": {"id": "t_170", "name": "zombie"},
+        "Zombies": {"id": "t_170", "name": "zombie"},
+        
+        # === ACTIVITÉS ===
+        "Cosplay": {"id": "t_74", "name": "cosplay"},
+        "Cuisine": {"id": "t_105", "name": "cuisine"},
+        "Gastronomie": {"id": "t_105", "name": "cuisine"},
+        "Musique": {"id": "t_73", "name": "musique"},
+        "Music": {"id": "t_73", "name": "musique"},
+        
+        # === ARCHÉTYPE ===
+        "Otaku": {"id": "t_59", "name": "otaku"},
+        "Otaku Culture": {"id": "t_59", "name": "otaku"},
+        
+        # === ÉLEMENT NARRATIF/THÈME ===
+        "Compétition": {"id": "t_128", "name": "compétition"},
+        "Religion": {"id": "t_150", "name": "religion"},
+        "Triangle amoureux": {"id": "t_27", "name": "triangle amoureux"},
+        "Vengeance": {"id": "t_148", "name": "vengeance"},
+        "Violence": {"id": "t_126", "name": "violence"},
+        
+        # === MOTS-CLÉ DIVERS ===
+        "Moe": {"id": "t_165", "name": "moe"},
+        "Mythologie": {"id": "t_172", "name": "mythologie"},
+        "Transformation": {"id": "t_194", "name": "transformation"},
+        
+        # === SPECIAL MAPPINGS FOR YOUR DATA ===
+        "Adolescence": {"id": "t_45", "name": "tranches de vie"},  # Life themes
+        "Amour": {"id": "t_13", "name": "romance"},
+        "Couture": {"id": "t_45", "name": "tranches de vie"},  # Lifestyle
+        "Dystopie": {"id": "t_39", "name": "post-apocalyptique"},  # Often overlaps
+    }
+
+    def __init__(self, driver, catalog=None, debug=False, reconcile=True):
+        """
+        Args:
+            driver: Logged-in WebDriver
+            catalog (TagCatalog, optional): Tag catalog (default: the one in the current directory)
+            debug (bool): List the tags available on the page before selecting
+            reconcile (bool): Read, click and verify all tags in three script calls
+                              instead of clicking them one by one
+        """
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
-        
-        # Tag mapping based on your actual HTML structure
-        self.tag_mapping = {
-            # === GENRES (from your HTML) ===
-            "Action": {"id": "t_9", "name": "action"},
-            "Aventure": {"id": "t_10", "name": "aventure"},
-            "Adventure": {"id": "t_10", "name": "aventure"},
-            "Comédie": {"id": "t_15", "name": "comédie"},
-            "Comedy": {"id": "t_15", "name": "comédie"},
-            "Drame": {"id": "t_11", "name": "drame"},
-            "Drama": {"id": "t_11", "name": "drame"},
-            "Ecchi": {"id": "t_77", "name": "ecchi"},
-            "Guerre": {"id": "t_16", "name": "guerre"},
-            "War": {"id": "t_16", "name": "guerre"},
-            "Historique": {"id": "t_38", "name": "historique"},
-            "Historical": {"id": "t_38", "name": "historique"},
-            "Horreur": {"id": "t_19", "name": "horreur"},
-            "Horreur / Épouvante": {"id": "t_19", "name": "horreur"},
-            "Horror": {"id": "t_19", "name": "horreur"},
-            "Policier": {"id": "t_14", "name": "policier"},
-            "Psychologique": {"id": "t_18", "name": "psychologique"},
-            "Psychological": {"id": "t_18", "name": "psychologique"},
-            "Romance": {"id": "t_13", "name": "romance"},
-            "Sport": {"id": "t_17", "name": "sport"},
-            "Sports": {"id": "t_17", "name": "sport"},
-            "Thriller": {"id": "t_12", "name": "thriller"},
-            "Slice of Life": {"id": "t_45", "name": "tranches de vie"},
-            "Slice of life": {"id": "t_45", "name": "tranches de vie"},
-            "Western": {"id": "t_112", "name": "western"},
-            "Jeux vidéo": {"id": "t_72", "name": "jeu vidéo"},
-            
-            # === CLASSIFICATION ===
-            "Josei": {"id": "t_85", "name": "josei"},
-            "Kodomo": {"id": "t_8", "name": "kodomo"},
-            "Seinen": {"id": "t_5", "name": "seinen"},
-            "Shôjo": {"id": "t_3", "name": "shôjo"},
-            "Shoujo": {"id": "t_3", "name": "shôjo"},
-            "Shônen": {"id": "t_1", "name": "shônen"},
-            "Shounen": {"id": "t_1", "name": "shônen"},
-            "Yaoi": {"id": "t_7", "name": "yaoi"},
-            "Yuri": {"id": "t_6", "name": "yuri"},
-            
-            # === UNIVERS ===
-            "Cyberpunk": {"id": "t_41", "name": "cyberpunk"},
-            "Fantastique": {"id": "t_37", "name": "fantastique"},
-            "Fantasy": {"id": "t_35", "name": "fantasy"},
-            "Gothique": {"id": "t_111", "name": "gothique"},
-            "Post-apocalyptique": {"id": "t_39", "name": "post-apocalyptique"},
-            "Réaliste": {"id": "t_34", "name": "réaliste"},
-            "Science-fiction": {"id": "t_36", "name": "sci-fi"},
-            "Sci-Fi": {"id": "t_36", "name": "sci-fi"},
-            "Space opera": {"id": "t_22", "name": "space opera"},
-            "Space Opera": {"id": "t_22", "name": "space opera"},
-            "Steampunk": {"id": "t_40", "name": "steampunk"},
-            "Surréaliste": {"id": "t_133", "name": "surréaliste"},
-            
-            # === ÉPOQUE ET LIEU ===
-            "École": {"id": "t_33", "name": "école"},
-            "Ecole": {"id": "t_33", "name": "école"},
-            "School": {"id": "t_33", "name": "école"},
-            "School Life": {"id": "t_33", "name": "école"},
-            "Époque Edo": {"id": "t_43", "name": "époque Edo"},
-            "Ère Taishō": {"id": "t_188", "name": "ère Taishō"},
-            "Meiji": {"id": "t_167", "name": "meiji"},
-            "Monde parallèle": {"id": "t_121", "name": "monde parallèle"},
-            "Univers alternatif": {"id": "t_121", "name": "monde parallèle"},
-            "Moyen Age": {"id": "t_44", "name": "Moyen Age"},
-            "Prison": {"id": "t_145", "name": "prison"},
-            "Seconde guerre mondiale": {"id": "t_42", "name": "seconde guerre mondiale"},
-            
-            # === SOUS-GENRE ===
-            "Arts martiaux": {"id": "t_31", "name": "arts martiaux"},
-            "Combat": {"id": "t_20", "name": "combat"},
-            "Combats": {"id": "t_20", "name": "combat"},
-            "Harem": {"id": "t_26", "name": "harem"},
-            "Isekai": {"id": "t_186", "name": "isekai"},
-            "Magical girl": {"id": "t_24", "name": "magical girl"},
-            "Mahou Shoujo": {"id": "t_24", "name": "magical girl"},
-            "Magie": {"id": "t_25", "name": "magie"},
-            "Magic": {"id": "t_25", "name": "magie"},
-            "Mecha": {"id": "t_23", "name": "mecha"},
-            "Mechas": {"id": "t_23", "name": "mecha"},
-            "Mystère": {"id": "t_104", "name": "mystère"},
-            "Mystery": {"id": "t_104", "name": "mystère"},
-            "Parodie": {"id": "t_30", "name": "parodie"},
-            "Super-pouvoirs": {"id": "t_32", "name": "super-pouvoirs"},
-            "Surnaturel": {"id": "t_80", "name": "surnaturel"},
-            "Supernatural": {"id": "t_80", "name": "surnaturel"},
-            "Voyage temporel": {"id": "t_158", "name": "voyage temporel"},
-            "Time Travel": {"id": "t_158", "name": "voyage temporel"},
-            
-            # === PERSONNAGES ===
-            "Aliens / Extra-terrestres": {"id": "t_102", "name": "extra-terrestre"},
-            "Extra-terrestre": {"id": "t_102", "name": "extra-terrestre"},
-            "Ange": {"id": "t_88", "name": "ange"},
-            "Animal": {"id": "t_114", "name": "animal"},
-            "Assassin": {"id": "t_179", "name": "assassin"},
-            "Catgirl": {"id": "t_98", "name": "catgirl"},
-            "Chasseur de prime": {"id": "t_49", "name": "chasseur de prime"},
-            "Cyborg": {"id": "t_53", "name": "cyborg"},
-            "Démon": {"id": "t_56", "name": "démon"},
-            "Démons": {"id": "t_56", "name": "démon"},
-            "Détective": {"id": "t_134", "name": "détective"},
-            "Dieu/déesse": {"id": "t_78", "name": "dieu/déesse"},
-            "Enfant": {"id": "t_119", "name": "enfant"},
-            "Espion": {"id": "t_182", "name": "espion"},
-            "Fantôme": {"id": "t_107", "name": "fantôme"},
-            "Fantômes": {"id": "t_107", "name": "fantôme"},
-            "Guerrier": {"id": "t_108", "name": "guerrier"},
-            "Idol": {"id": "t_175", "name": "idol"},
-            "Idols": {"id": "t_175", "name": "idol"},
-            "Magicien": {"id": "t_52", "name": "magicien"},
-            "Militaire": {"id": "t_93", "name": "militaire"},
-            "Monstre": {"id": "t_110", "name": "monstre"},
-            "Monstres": {"id": "t_110", "name": "monstre"},
-            "Ninja": {"id": "t_89", "name": "ninja"},
-            "Pirate": {"id": "t_87", "name": "pirate"},
-            "Robot": {"id": "t_92", "name": "robot"},
-            "Robots": {"id": "t_92", "name": "robot"},
-            "Samouraï": {"id": "t_51", "name": "samouraï"},
-            "Samouraïs": {"id": "t_51", "name": "samouraï"},
-            "Sorcière": {"id": "t_127", "name": "sorcière"},
-            "Super-héros": {"id": "t_101", "name": "super-héros"},
-            "Vampire": {"id": "t_55", "name": "vampire"},
-            "Vampires": {"id": "t_55", "name": "vampire"},
-            "Yakuza": {"id": "t_100", "name": "yakuza"},
-            "Yōkai": {"id": "t_168", "name": "yôkai"},
-            "Zombie": {"id": "t_170", "name": "zombie"},
-            "Zombies": {"id": "t_170", "name": "zombie"},
-            
-            # === ACTIVITÉS ===
-            "Cosplay": {"id": "t_74", "name": "cosplay"},
-            "Cuisine": {"id": "t_105", "name": "cuisine"},
-            "Gastronomie": {"id": "t_105", "name": "cuisine"},
-            "Musique": {"id": "t_73", "name": "musique"},
-            "Music": {"id": "t_73", "name": "musique"},
-            
-            # === ARCHÉTYPE ===
-            "Otaku": {"id": "t_59", "name": "otaku"},
-            "Otaku Culture": {"id": "t_59", "name": "otaku"},
-            
-            # === ÉLEMENT NARRATIF/THÈME ===
-            "Compétition": {"id": "t_128", "name": "compétition"},
-            "Religion": {"id": "t_150", "name": "religion"},
-            "Triangle amoureux": {"id": "t_27", "name": "triangle amoureux"},
-            "Vengeance": {"id": "t_148", "name": "vengeance"},
-            "Violence": {"id": "t_126", "name": "violence"},
-            
-            # === MOTS-CLÉ DIVERS ===
-            "Moe": {"id": "t_165", "name": "moe"},
-            "Mythologie": {"id": "t_172", "name": "mythologie"},
-            "Transformation": {"id": "t_194", "name": "transformation"},
-            
-            # === SPECIAL MAPPINGS FOR YOUR DATA ===
-            "Adolescence": {"id": "t_45", "name": "tranches de vie"},  # Life themes
-            "Amour": {"id": "t_13", "name": "romance"},
-            "Couture": {"id": "t_45", "name": "tranches de vie"},  # Lifestyle
-            "Dystopie": {"id": "t_39", "name": "post-apocalyptique"},  # Often overlaps
-        }
+        self.debug = debug
+        self.reconcile = reconcile
+        self.tag_mapping = self.TAG_SYNONYMS
+        self.catalog = catalog if catalog is not None else TagCatalog()
     
     def wait_for_page_load(self):
         """Wait for the tag elements to be present on the page"""
         try:
-            self.wait.until(EC.presence_of_element_located((By.ID, "t_1")))
+            WAITS.until(self.driver, "page_load", EC.presence_of_element_located((By.ID, "t_1")))
             print("✓ Page with tags loaded successfully")
-            return True
         except TimeoutException:
             print("✗ Timeout waiting for tags to load")
             return False
+        
+        # The catalog is only harvested again when stale or when the tag count changed
+        try:
+            self.catalog.ensure(self.driver)
+        except Exception as e:
+            print(f"⚠ Could not harvest the tag catalog, using the cached one: {e}")
+        self.catalog.build_index(self.tag_mapping)
+        return True
+    
+    def find_tag(self, term):
+        """
+        Return (tag id, tag name) for a genre or theme, or None
+        
+        Curated terms first, then the normalized catalog index.
+        """
+        if term in self.tag_mapping:
+            return self.tag_mapping[term]["id"], self.tag_mapping[term]["name"]
+        return self.catalog.lookup(term)
     
     def find_tag_element(self, tag_id):
         """Find a tag element by ID"""
@@ -305,18 +257,20 @@ class TagSelector:
     def is_tag_selected(self, element):
         """Check if a tag is already selected - FIXED LOGIC"""
         try:
-            classes = element.get_attribute("class") or ""
-            # FIXED: Check for "selected" class and NOT "notselected"
-            return "selected" in classes and "notselected" not in classes
+            return self.is_selected_class(element.get_attribute("class") or "")
         except:
             return False
     
+    @staticmethod
+    def is_selected_class(classes):
+        # FIXED: Check for "selected" class and NOT "notselected"
+        return "selected" in classes and "notselected" not in classes
+    
     def click_tag(self, element, tag_name, original_term):
         """Click on a tag element with verification"""
         try:
             # Scroll the element into view
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-            time.sleep(0.3)
             
             # Check if already selected
             if self.is_tag_selected(element):
@@ -329,11 +283,15 @@ class TagSelector:
             
             # Try clicking
             element.click()
-            time.sleep(0.5)
             
             # Verify the click worked
+            try:
+                WAITS.until(self.driver, "tag_click", lambda driver: self.is_tag_selected(element))
+                selected = True
+            except TimeoutException:
+                selected = False
             updated_classes = element.get_attribute("class") or ""
-            if self.is_tag_selected(element):
+            if selected:
                 print(f"  ✓ Successfully selected '{tag_name}' for '{original_term}' (new classes: '{updated_classes}')")
                 return True
             else:
@@ -348,16 +306,14 @@ class TagSelector:
         """Debug function to show what tags are available on the page"""
         print("\n=== DEBUG: Available tags on page ===")
         try:
-            tag_elements = self.driver.find_elements(By.CSS_SELECTOR, "[id^='t_']")
-            print(f"Found {len(tag_elements)} potential tag elements")
+            states = self.driver.execute_script(TAG_STATES_SCRIPT) or {}
+            print(f"Found {len(states)} potential tag elements")
             
             # Show first few with their current selection status
-            for element in tag_elements[:10]:
-                tag_id = element.get_attribute("id")
-                tag_text = element.text[:30] if element.text else "No text"
-                tag_classes = element.get_attribute("class") or "No classes"
-                is_selected = self.is_tag_selected(element)
-                print(f"  ID: {tag_id}, Text: '{tag_text}', Classes: '{tag_classes}', Selected: {is_selected}")
+            for tag_id, tag_classes in list(states.items())[:10]:
+                tag_text = self.catalog.tags.get(tag_id, "")[:30] or "No text"
+                is_selected = self.is_selected_class(tag_classes)
+                print(f"  ID: {tag_id}, Text: '{tag_text}', Classes: '{tag_classes or 'No classes'}', Selected: {is_selected}")
                 
         except Exception as e:
             print(f"Error during debug: {e}")
@@ -372,20 +328,26 @@ class TagSelector:
         print(f"\n=== Processing {len(terms_list)} {category_name} ===")
         print(f"{category_name.capitalize()}: {terms_list}")
         
-        # Debug: show available tags for first few terms
-        if len(terms_list) > 0:
+        if self.debug:
             self.debug_available_tags()
         
+        if self.reconcile:
+            try:
+                successful, failed = self.reconcile_tags(terms_list, category_name)
+            except Exception as e:
+                print(f"  ⚠ Batched tag selection failed, selecting one by one: {e}")
+            else:
+                return self._print_selection_summary(successful, failed, category_name)
+        
         successful = 0
         failed = []
         
         for term in terms_list:
             print(f"\nProcessing {category_name[:-1]}: '{term}'")
             
-            if term in self.tag_mapping:
-                tag_info = self.tag_mapping[term]
-                tag_id = tag_info["id"]
-                tag_name = tag_info["name"]
+            match = self.find_tag(term)
+            if match:
+                tag_id, tag_name = match
                 
                 element = self.find_tag_element(tag_id)
                 if element:
@@ -397,102 +359,92 @@ class TagSelector:
                     print(f"  ✗ Element with ID '{tag_id}' not found")
                     failed.append(term)
             else:
-                print(f"  ⚠ '{term}' not found in mapping")
+                print(f"  ⚠ '{term}' not found in mapping or tag catalog")
                 failed.append(term)
         
-        # Summary
-        print(f"\n{category_name.capitalize()} selection summary:")
-        print(f"  ✓ Successfully selected: {successful}")
-        print(f"  ✗ Failed to select: {len(failed)}")
-        
-        if failed:
-            print(f"  Failed {category_name}: {failed}")
+        return self._print_selection_summary(successful, failed, category_name)
+    
+    def reconcile_tags(self, terms_list, category_name="tags"):
+        """
+        Select the tags of terms_list with three script calls: read the state
+        of every tag, click the ones that are not selected yet, verify
         
-        return successful, failed
-
-
-def load_json_data(file_path):
-    """Load JSON data from file"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
-    except FileNotFoundError:
-        print(f"Error: The file {file_path} was not found.")
-        return None
-    except json.JSONDecodeError:
-        print(f"Error: The file {file_path} does not contain valid JSON.")
-        return None
-    except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-        return None
-
-
-def login_to_site(driver, username, password):
-    """Handle login to the site"""
-    try:
-        driver.get("http://www.anime-kun.net/")
-        print("Navigated to the main site")
+        Returns:
+            tuple: (number of terms selected, list of failed terms)
+        """
+        resolved = []
+        failed = []
+        for term in terms_list:
+            match = self.find_tag(term)
+            if match:
+                resolved.append((term, match[0], match[1]))
+            else:
+                print(f"  ⚠ '{term}' not found in mapping or tag catalog")
+                failed.append(term)
         
-        wait = WebDriverWait(driver, 10)
-        username_field = wait.until(EC.presence_of_element_located((By.ID, "user")))
+        states = self.driver.execute_script(TAG_STATES_SCRIPT) or {}
         
-        username_field.send_keys(username)
-        password_field = driver.find_element(By.ID, "passwrd")
-        password_field.send_keys(password)
-        print("Entered login credentials")
+        successful = 0
+        pending = []
+        to_click = []
+        for term, tag_id, tag_name in resolved:
+            if tag_id not in states:
+                print(f"  ✗ Element with ID '{tag_id}' not found for '{term}'")
+                failed.append(term)
+            elif self.is_selected_class(states[tag_id]):
+                print(f"  ⚠ Tag '{tag_name}' already selected for '{term}'")
+                successful += 1
+            else:
+                pending.append((term, tag_id, tag_name))
+                # Several terms can share a tag; a second click would unselect it
+                if tag_id not in to_click:
+                    to_click.append(tag_id)
         
-        submit_button = driver.find_element(By.ID, "llsubmit")
-        submit_button.click()
-        print("Submitted login form")
+        if to_click:
+            print(f"  🎯 Clicking {len(to_click)} {category_name}: {', '.join(to_click)}")
+            self.driver.execute_script(CLICK_TAGS_SCRIPT, to_click)
+            try:
+                states = WAITS.until(self.driver, "tag_click", lambda driver: self._states_if_selected(to_click))
+            except TimeoutException:
+                states = self.driver.execute_script(TAG_STATES_SCRIPT) or {}
         
-        time.sleep(3)
+        for term, tag_id, tag_name in pending:
+            if self.is_selected_class(states.get(tag_id, "")):
+                print(f"  ✓ Successfully selected '{tag_name}' for '{term}'")
+                successful += 1
+            else:
+                print(f"  ⚠ Click may have failed for '{tag_name}' ('{term}') - classes: '{states.get(tag_id, '')}'")
+                failed.append(term)
         
-        if "forums" in driver.current_url:
-            print("Successfully logged in")
-            return True
-        else:
-            print("Login might have failed")
-            return False
+        return successful, failed
     
-    except Exception as e:
-        print(f"An error occurred during login: {e}")
+    def _states_if_selected(self, tag_ids):
+        """Wait condition: the tag states once every tag of tag_ids is selected"""
+        states = self.driver.execute_script(TAG_STATES_SCRIPT) or {}
+        if all(self.is_selected_class(states.get(tag_id, "")) for tag_id in tag_ids):
+            return states
         return False
+    
+    def _print_selection_summary(self, successful, failed, category_name):
+        print(f"\n{category_name.capitalize()} selection summary:")
+        print(f"  ✓ Successfully selected: {successful}")
+        print(f"  ✗ Failed to select: {len(failed)}")
+        
+        if failed:
+            print(f"  Failed {category_name}: {failed}")
+        
+        return successful, failed
 
 
 def extract_genres_and_themes(anime_data):
-    """Extract genres and themes from various possible locations in JSON"""
-    genres = []
-    themes = []
-    
-    # Extract genres
-    if "genres" in anime_data:
-        genres = anime_data["genres"]
-        print(f"Found genres in top-level: {genres}")
-    elif "sources" in anime_data:
-        if "myanimelist" in anime_data["sources"] and "genres" in anime_data["sources"]["myanimelist"]:
-            genres = anime_data["sources"]["myanimelist"]["genres"]
-            print(f"Found genres in MyAnimeList source: {genres}")
-        elif "nautiljon" in anime_data["sources"] and "genres" in anime_data["sources"]["nautiljon"]:
-            genres = anime_data["sources"]["nautiljon"]["genres"]
-            print(f"Found genres in Nautiljon source: {genres}")
-    
-    # Extract themes
-    if "themes" in anime_data:
-        themes = anime_data["themes"]
-        print(f"Found themes in top-level: {themes}")
-    elif "sources" in anime_data:
-        if "myanimelist" in anime_data["sources"] and "themes" in anime_data["sources"]["myanimelist"]:
-            themes.extend(anime_data["sources"]["myanimelist"]["themes"])
-        if "nautiljon" in anime_data["sources"] and "themes" in anime_data["sources"]["nautiljon"]:
-            themes.extend(anime_data["sources"]["nautiljon"]["themes"])
-        
-        themes = list(dict.fromkeys(themes))
-        print(f"Found combined themes: {themes}")
-    
-    return genres, themes
+    """Extract genres and themes from an AnimeRecord or loaded JSON data"""
+    record = as_anime_record(anime_data)
+    print(f"Found genres: {record.genres}")
+    print(f"Found themes: {record.themes}")
+    return record.genres, record.themes
 
 
-def process_genres_and_themes(driver, anime_data, anime_id):
+def process_genres_and_themes(driver, anime_data, anime_id, debug=False):
     """Process and apply both genres and themes to the anime"""
     print("\n" + "="*60)
     print("PROCESSING GENRES AND THEMES")
@@ -504,7 +456,7 @@ def process_genres_and_themes(driver, anime_data, anime_id):
     print(f"Navigated to modification page for anime ID: {anime_id}")
     
     # Initialize tag selector
-    tag_selector = TagSelector(driver)
+    tag_selector = TagSelector(driver, debug=debug)
     
     # Wait for page to load
     if not tag_selector.wait_for_page_load():
@@ -536,109 +488,80 @@ def process_genres_and_themes(driver, anime_data, anime_id):
 
 
 def extract_staff_info(anime_data):
-    """Extract staff information from JSON data"""
-    staff_list = []
-    
-    if "staff" in anime_data:
-        staff_list.extend(anime_data["staff"])
-    
-    if "sources" in anime_data:
-        if "myanimelist" in anime_data["sources"] and "staff" in anime_data["sources"]["myanimelist"]:
-            staff_list.extend(anime_data["sources"]["myanimelist"]["staff"])
-        if "nautiljon" in anime_data["sources"] and "staff" in anime_data["sources"]["nautiljon"]:
-            staff_list.extend(anime_data["sources"]["nautiljon"]["staff"])
-    
-    # Add studios
-    studios = []
-    if "studios" in anime_data and anime_data["studios"]:
-        studios.extend(anime_data["studios"])
-    
-    if "sources" in anime_data:
-        if "myanimelist" in anime_data["sources"] and "studios" in anime_data["sources"]["myanimelist"]:
-            studios.extend(anime_data["sources"]["myanimelist"]["studios"])
-        if "nautiljon" in anime_data["sources"] and "studio" in anime_data["sources"]["nautiljon"]:
-            studio = anime_data["sources"]["nautiljon"]["studio"]
-            if studio:
-                studios.append(studio)
-    
-    for studio in studios:
-        staff_list.append({
-            "name": studio,
-            "role": "Studio d'animation"
-        })
-    
-    # Normalize staff info
-    normalized_staff = []
-    seen_entries = set()
-    
-    for staff_member in staff_list:
-        if not staff_member.get("name") or not staff_member.get("role"):
-            continue
-        
-        name = staff_member["name"].replace(",", "").strip()
-        role = staff_member["role"].strip()
-        mapped_role = ROLE_MAPPING.get(role, role)
-        
-        unique_key = f"{name.lower()}|{mapped_role.lower()}"
-        
-        if unique_key not in seen_entries:
-            normalized_staff.append({
-                "name": name,
-                "role": mapped_role
-            })
-            seen_entries.add(unique_key)
-    
-    return normalized_staff
+    """
+    Extract staff information from an AnimeRecord or loaded JSON data
+
+    Staff and studios from every source, roles resolved with role_resolver
+    and duplicates removed (see anime_record).
+    """
+    return as_anime_record(anime_data).staff
 
 
-def add_staff_member(driver, name, role, wait, auto_submit=False):
-    """Add a staff member"""
+def add_staff_member(driver, name, role, wait, auto_submit=False, id_cache=None):
+    """
+    Add a staff member
+    
+    With an id_cache, a name whose id_business is already known skips the
+    autocomplete; IDs confirmed by a successful addition are remembered.
+    
+    Returns:
+        bool: True if the member was added, None if the name has no business
+              entry on the site (trying again will not help), False on error
+    """
     try:
         business_field = wait.until(EC.presence_of_element_located((By.ID, "name_business")))
-        business_field.clear()
-        business_field.send_keys(name)
-        print(f"Searching for staff member: {name}")
-        
-        time.sleep(2)
-        
-        try:
-            autocomplete_items = wait.until(EC.presence_of_element_located(
-                (By.CSS_SELECTOR, "ul.ui-autocomplete li.ui-menu-item")
-            ))
-            autocomplete_items.click()
-            print(f"Selected autocomplete result for: {name}")
-        except (TimeoutException, NoSuchElementException):
-            print(f"No autocomplete results found for {name}, may need to create this business entry")
-            business_field.send_keys(Keys.RETURN)
+        cached_id = id_cache.lookup(name) if id_cache else None
+        selected_item = False
+        saved = False
         
-        time.sleep(2)
+        if cached_id:
+            driver.execute_script(SET_BUSINESS_SCRIPT, name, cached_id)
+            print(f"✓ Using cached business ID {cached_id} for: {name}")
+        else:
+            # The previous member's ID may still be there (manual review, a
+            # form that did not reset): it must not be taken for this name
+            driver.execute_script(CLEAR_BUSINESS_ID_SCRIPT)
+            business_field.clear()
+            business_field.send_keys(name)
+            print(f"Searching for staff member: {name}")
+            
+            try:
+                autocomplete_items = WAITS.until(driver, "autocomplete", EC.visibility_of_element_located(
+                    (By.CSS_SELECTOR, "ul.ui-autocomplete li.ui-menu-item")
+                ))
+                autocomplete_items.click()
+                selected_item = True
+                print(f"Selected autocomplete result for: {name}")
+            except (TimeoutException, NoSuchElementException):
+                print(f"No autocomplete results found for {name}, may need to create this business entry")
+                business_field.send_keys(Keys.RETURN)
+            
+            # The selection fills the hidden business ID
+            try:
+                WAITS.until(driver, "business_id", field_value_changes("id_business", ""))
+            except TimeoutException:
+                pass
         
         custom_field = wait.until(EC.presence_of_element_located((By.ID, "custom")))
         custom_field.clear()
         custom_field.send_keys(role)
         print(f"Entered role: {role}")
         
-        time.sleep(2)
-        
         try:
-            function_box = wait.until(EC.presence_of_element_located((By.ID, "fonction_box")))
+            role_options = WAITS.until(driver, "role_options", visible_links("fonction_box"))
+            selected = False
             
-            if function_box.is_displayed():
-                role_options = function_box.find_elements(By.TAG_NAME, "a")
-                selected = False
-                
-                for option in role_options:
-                    if option.text.lower() == role.lower():
-                        option.click()
-                        selected = True
-                        print(f"Selected exact role match: {role}")
-                        break
-                
-                if not selected and role_options:
-                    role_options[0].click()
-                    print(f"Selected first role option: {role_options[0].text}")
-            else:
-                print("Role autocomplete not displayed, continuing with entered role")
+            role_key = normalize_role(role)
+            for option in role_options:
+                if normalize_role(option.text) == role_key:
+                    option.click()
+                    selected = True
+                    print(f"Selected exact role match: {role}")
+                    break
+            
+            if not selected:
+                role_options[0].click()
+                print(f"Selected first role option: {role_options[0].text}")
         except (TimeoutException, NoSuchElementException):
             print(f"No role autocomplete results found for {role}, continuing with entered role")
         
@@ -647,17 +570,32 @@ def add_staff_member(driver, name, role, wait, auto_submit=False):
         
         if not id_value or id_value.strip() == "":
             print(f"Warning: No business ID found for {name}")
-            return False
+            return None
         
         if auto_submit:
             submit_button = driver.find_element(By.XPATH, "//form[@id='ajout_staff']//input[@type='submit']")
             submit_button.click()
             print(f"Submitted staff entry for {name} with role {role}")
-            time.sleep(2)
+            # The form is reset (or the page reloaded) once the entry is saved
+            try:
+                WAITS.until(driver, "staff_submit", field_value_changes("id_business", id_value))
+                saved = True
+            except TimeoutException:
+                print(f"⚠ Staff form did not reset after submitting {name}")
         else:
             print(f"Ready to submit staff entry for {name} with role {role}")
             print("Please review and manually submit the form.")
             input("Press Enter to continue to the next staff member...")
+            try:
+                saved = field_value_changes("id_business", id_value)(driver)
+            except WebDriverException:
+                saved = False
+        
+        # Only an ID picked from the autocomplete, or a looked-up one, that the
+        # site accepted is remembered; IDs already in the persistent cache are
+        # left as they are, pre-resolved ones are saved there
+        if id_cache and saved and (selected_item or cached_id):
+            id_cache.record(name, id_value.strip())
         
         return True
     
@@ -675,21 +613,34 @@ def main():
     parser.add_argument('--username', default="******", help='Username for login (default: test)')
     parser.add_argument('--password', default="******", help='Password for login (default: test)')
     parser.add_argument('--auto-submit', action='store_true', help='Automatically submit each staff entry')
-    parser.add_argument('--wait-time', type=int, default=5, help='Time in seconds to wait between actions (default: 5)')
+    parser.add_argument('--wait-time', type=float, default=0, help='Extra pause in seconds between staff members (default: 0)')
     parser.add_argument('--skip-genres', action='store_true', help='Skip genre processing and go directly to staff')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode with extra logging')
     parser.add_argument('--tags-only', action='store_true', help='Only process tags, skip staff completely')
+    parser.add_argument('--no-staff-cache', action='store_true', help='Always use the autocomplete instead of the cached business IDs')
+    parser.add_argument('--poll-interval', type=float, help='Seconds between two checks of a wait condition (default: 0.1)')
+    parser.add_argument('--wait-budget', action='append', default=[], metavar='STEP=SECONDS',
+                        help='Timeout of a wait step, e.g. autocomplete=8 (can be repeated)')
+    parser.add_argument('--browser-profile', choices=BROWSER_PROFILES, default='lean',
+                        help='lean: block images, media, fonts and third-party hosts, eager page loads; full: load everything (default: lean)')
+    parser.add_argument('--headless', action='store_true', help='Run Chrome without a window')
+    parser.add_argument('--session-file', default=DEFAULT_SESSION_PATH,
+                        help=f'Saved login session shared with the other scripts (default: {DEFAULT_SESSION_PATH})')
+    parser.add_argument('--fresh-login', action='store_true', help='Ignore the saved login session and log in with the form')
     
     args = parser.parse_args()
+    if args.headless and not args.auto_submit and not args.tags_only:
+        parser.error("--headless needs --auto-submit (staff entries are reviewed in the browser)")
+    WAITS.configure(parse_budgets(args.wait_budget), args.poll_interval)
     
     # Load JSON data
-    anime_data = load_json_data(args.json_file)
-    if not anime_data:
+    record = load_anime_record(args.json_file)
+    if not record:
         print(f"Failed to load JSON data from {args.json_file}. Exiting script.")
         sys.exit(1)
     
     # Extract staff information
-    staff_list = extract_staff_info(anime_data)
+    staff_list = extract_staff_info(record)
     
     if not staff_list and not args.tags_only:
         print("No staff information found in the JSON data. Will only process genres/themes.")
@@ -697,25 +648,21 @@ def main():
         print("Tags-only mode: Will only process genres and themes.")
     else:
         print(f"Found {len(staff_list)} staff members to add")
+    ROLE_RESOLVER.print_report()
     
     # Initialize webdriver
-    options = webdriver.ChromeOptions()
-    options.add_argument("--start-maximized")
-    if not args.debug:
-        options.add_argument("--disable-logging")
-        options.add_argument("--log-level=3")
-    
-    driver = webdriver.Chrome(options=options)
+    driver = create_browser(args.browser_profile, args.headless, args.debug)
     
     try:
         # Login
-        login_success = login_to_site(driver, args.username, args.password)
+        session_store = SessionStore(args.username, args.password, args.session_file, reuse=not args.fresh_login)
+        login_success = session_store.login_driver(driver)
         if not login_success:
             print("Could not verify successful login. Continuing anyway...")
         
         # Process genres and themes (unless skipped)
         if not args.skip_genres:
-            success = process_genres_and_themes(driver, anime_data, args.anime_id)
+            success = process_genres_and_themes(driver, record, args.anime_id, debug=args.debug)
             if not success:
                 print("Genre/theme processing failed, but continuing...")
         
@@ -730,9 +677,10 @@ def main():
             print(f"Navigated to staff management page for anime ID: {args.anime_id}")
             
             wait = WebDriverWait(driver, 10)
-            wait.until(EC.presence_of_element_located((By.ID, "name_business")))
+            WAITS.until(driver, "page_load", EC.presence_of_element_located((By.ID, "name_business")))
             print("Staff management form loaded successfully")
             
+            id_cache = None if args.no_staff_cache else StaffIdCache()
             successful_additions = 0
             for i, staff_member in enumerate(staff_list):
                 print(f"\nProcessing staff member {i+1}/{len(staff_list)}: {staff_member['name']} - {staff_member['role']}")
@@ -742,23 +690,28 @@ def main():
                     name=staff_member["name"],
                     role=staff_member["role"],
                     wait=wait,
-                    auto_submit=args.auto_submit
+                    auto_submit=args.auto_submit,
+                    id_cache=id_cache
                 )
                 
                 if success:
                     successful_additions += 1
                 
-                time.sleep(args.wait_time)
+                WAITS.sleep("pause", args.wait_time)
             
             print(f"\nCompleted processing {len(staff_list)} staff members")
             print(f"Successfully added: {successful_additions}")
             print(f"Failed: {len(staff_list) - successful_additions}")
+            if id_cache:
+                id_cache.print_stats()
         
         print("\n" + "="*60)
         print("SCRIPT COMPLETED")
         print("="*60)
+        BROWSER_STATS.print_stats()
+        WAITS.print_report()
         
-        if not args.auto_submit or args.debug:
+        if (not args.auto_submit or args.debug) and not args.headless:
             print("You can review the changes in the browser before closing.")
             input("Press Enter to close the browser...")
     
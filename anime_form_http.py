@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Browser-less backend for the anime creation form.
+
+The Ajout page is a plain HTML form, so a new anime can be created by
+fetching the page once, keeping its hidden fields, filling in the same
+fields the Selenium flow types (titre, format, annee, titre_orig,
+titres_alternatifs, licence, nb_episodes, site_officiel, doubleurs) and
+posting it through a pooled requests session that logged in with the same
+login form. The new id_anime is read from the result page the same way as
+in the browser.
+
+    python anime_form_http.py spring_anime/Uchuujin_MuuMuu.json --username me --password secret
+    python anime_form_http.py anime.json --base-url http://localhost:8000/
+"""
+
+import argparse
+import sys
+import threading
+import time
+from urllib.parse import urljoin
+
+import requests
+from bs4 import BeautifulSoup
+
+from anime_record import load_anime_record
+from nautiljon_http_scraper import create_session
+
+SITE_URL = "http://www.anime-kun.net/"
+ADD_PAGE = "__zone-admin__/anime.php?page=Ajout"
+
+# Input types that are never part of the submitted payload
+SKIPPED_INPUT_TYPES = ("button", "reset", "image", "file")
+
+
+def build_form_values(record):
+    """
+    Values of the anime form, keyed by field id, as the Selenium flow fills them
+
+    Optional fields are left out when the record has no value for them.
+    """
+    values = {
+        "titre": record.title,
+        "format": "Série TV",
+        "annee": "2025",
+        "titre_orig": record.title,
+        "licence": "0",
+        "nb_episodes": record.episode_count,
+    }
+    if record.alt_titles:
+        values["titres_alternatifs"] = record.alt_titles
+    if record.official_site:
+        values["site_officiel"] = record.official_site
+    if record.voice_actors:
+        values["doubleurs"] = record.voice_actors
+    return values
+
+
+class HtmlForm:
+    """
+    Fields of an HTML form as the browser would submit them
+
+    Attributes:
+        action (str): Absolute URL the form posts to
+        method (str): "get" or "post"
+        multipart (bool): The form is sent as multipart/form-data
+        fields (list): (name, value) pairs in document order, hidden fields included
+        ids (dict): Field id -> field name
+        submit (tuple): (name, value) of the first named submit button, or None
+    """
+
+    def __init__(self, form, page_url):
+        self.action = urljoin(page_url, form.get("action") or page_url)
+        self.method = (form.get("method") or "get").lower()
+        self.multipart = (form.get("enctype") or "").lower() == "multipart/form-data"
+        self.fields = []
+        self.ids = {}
+        self.submit = None
+
+        for element in form.find_all(["input", "select", "textarea"]):
+            name = element.get("name")
+            if not name or element.has_attr("disabled"):
+                continue
+            if element.get("id"):
+                self.ids[element["id"]] = name
+
+            if element.name == "select":
+                option = element.find("option", selected=True) or element.find("option")
+                if option is not None:
+                    self.fields.append((name, option.get("value", option.get_text())))
+            elif element.name == "textarea":
+                self.fields.append((name, element.get_text()))
+            else:
+                input_type = (element.get("type") or "text").lower()
+                if input_type == "submit":
+                    if self.submit is None:
+                        self.submit = (name, element.get("value", ""))
+                elif input_type in ("checkbox", "radio"):
+                    if element.has_attr("checked"):
+                        self.fields.append((name, element.get("value", "on")))
+                elif input_type not in SKIPPED_INPUT_TYPES:
+                    self.fields.append((name, element.get("value", "")))
+
+    @classmethod
+    def find(cls, html, page_url, containing_id):
+        """
+        Parse the form that contains (or is) the element with id containing_id
+
+        Returns:
+            HtmlForm: The form, or None if the page has no such form
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        element = soup.find(id=containing_id)
+        if element is None:
+            return None
+        form = element if element.name == "form" else element.find_parent("form")
+        return cls(form, page_url) if form is not None else None
+
+    def fill(self, values_by_id):
+        """
+        Set field values by field id
+
+        Returns:
+            list: Ids that are not fields of the form
+        """
+        missing = []
+        for field_id, value in values_by_id.items():
+            name = self.ids.get(field_id)
+            if name is None:
+                missing.append(field_id)
+                continue
+            self.fields = [(field, old) for field, old in self.fields if field != name]
+            self.fields.append((name, value))
+        return missing
+
+    def payload(self):
+        fields = list(self.fields)
+        if self.submit:
+            fields.append(self.submit)
+        return fields
+
+
+def parse_anime_id(html, url=""):
+    """
+    Read the new anime ID from the page shown after the form submission
+
+    Same lookups as the Selenium flow: the #id_anime element, the id_anime
+    hidden input, then the id_fiche parameter of the URL.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    id_element = soup.find(id="id_anime")
+    if id_element is not None and id_element.name != "input":
+        anime_id = id_element.get_text().strip()
+        if anime_id:
+            return anime_id
+
+    hidden_input = soup.find("input", attrs={"name": "id_anime"})
+    if hidden_input is not None and hidden_input.get("value"):
+        return hidden_input["value"]
+
+    if "id_fiche=" in url:
+        return url.split("id_fiche=")[1].split("&")[0]
+
+    return None
+
+
+class HttpFormBackend:
+    def __init__(self, username, password, session=None, base_url=SITE_URL, timeout=15, rate_limiter=None):
+        """
+        Args:
+            username (str): Site username
+            password (str): Site password
+            session (requests.Session, optional): Pooled session, created if not given
+            base_url (str): Site root; point it at a local stand-in for testing
+            timeout (float): Request timeout in seconds
+            rate_limiter (RateLimiter, optional): Shared cap on the requests sent to the site
+        """
+        self.username = username
+        self.password = password
+        self.session = session or create_session()
+        self.base_url = base_url
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.created = 0
+        self.failed = 0
+        self.total_time = 0.0
+        # The backend can be shared by several publishing sessions
+        self._lock = threading.Lock()
+
+    def _request(self, method, url, **kwargs):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return self.session.request(method, url, timeout=self.timeout, **kwargs)
+
+    def _submit(self, form):
+        if form.method == "post":
+            if form.multipart:
+                files = [(name, (None, value)) for name, value in form.payload()]
+                return self._request("POST", form.action, files=files)
+            return self._request("POST", form.action, data=form.payload())
+        return self._request("GET", form.action, params=form.payload())
+
+    def get_page(self, path):
+        """
+        GET a page of the site with the logged-in session
+
+        Args:
+            path (str): URL, relative to base_url
+
+        Raises:
+            requests.RequestException: On connection errors and HTTP error statuses
+        """
+        response = self._request("GET", urljoin(self.base_url, path))
+        response.raise_for_status()
+        return response
+
+    def login(self):
+        """
+        Log the session in with the login form of the site root
+
+        Returns:
+            bool: True if the site redirected to the forums, like after a browser login
+        """
+        try:
+            response = self._request("GET", self.base_url)
+            response.raise_for_status()
+            form = HtmlForm.find(response.text, response.url, "user")
+            if form is None:
+                print("✗ Login form not found")
+                return False
+            form.fill({"user": self.username, "passwrd": self.password})
+            response = self._submit(form)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"✗ Error during HTTP login: {e}")
+            return False
+
+        if "forums" in response.url:
+            print("✓ Successfully logged in (HTTP)")
+            return True
+        print("⚠ HTTP login might have failed")
+        return False
+
+    def create_anime(self, record):
+        """
+        Create an anime from an AnimeRecord
+
+        Returns:
+            str: The new anime ID, or None on failure
+        """
+        start = time.perf_counter()
+        anime_id = self._create(record)
+        with self._lock:
+            self.total_time += time.perf_counter() - start
+            if anime_id:
+                self.created += 1
+            else:
+                self.failed += 1
+        return anime_id
+
+    def _create(self, record):
+        try:
+            add_url = urljoin(self.base_url, ADD_PAGE)
+            response = self._request("GET", add_url)
+            response.raise_for_status()
+            form = HtmlForm.find(response.text, response.url, "informations_principales")
+            if form is None:
+                print("✗ Anime form not found (session logged out?)")
+                return None
+
+            missing = form.fill(build_form_values(record))
+            if missing:
+                print(f"⚠ Fields not found in the form: {', '.join(missing)}")
+
+            response = self._submit(form)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"✗ Error submitting the form over HTTP: {e}")
+            return None
+
+        anime_id = parse_anime_id(response.text, response.url)
+        if anime_id:
+            print(f"✓ Form submitted over HTTP: {record.title}")
+        else:
+            print(f"⚠ Form submitted but no anime ID found for {record.title}")
+        return anime_id
+
+    def print_stats(self):
+        submitted = self.created + self.failed
+        average = self.total_time / submitted * 1000 if submitted else 0.0
+        print(f"HTTP form backend: {self.created} created, {self.failed} failed, {average:.0f} ms per form")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create anime entries over HTTP, without a browser")
+    parser.add_argument("json_files", nargs="+", help="Anime JSON files")
+    parser.add_argument("--username", default="*****", help="Username for login")
+    parser.add_argument("--password", default="*****", help="Password for login")
+    parser.add_argument("--base-url", default=SITE_URL, help=f"Site root (default: {SITE_URL})")
+    parser.add_argument("--session-file", help="Saved login session shared with the other scripts (default: .site_session.json)")
+    parser.add_argument("--fresh-login", action="store_true", help="Ignore the saved login session and log in with the form")
+    args = parser.parse_args()
+
+    # Imported here: run_anime_automation and session_store pull in selenium
+    from run_anime_automation import save_anime_id_to_file
+    from session_store import DEFAULT_SESSION_PATH, SessionStore
+
+    backend = HttpFormBackend(args.username, args.password, base_url=args.base_url)
+    session_store = SessionStore(args.username, args.password, args.session_file or DEFAULT_SESSION_PATH,
+                                 args.base_url, reuse=not args.fresh_login)
+    if not session_store.login_http(backend):
+        print("⚠ Could not verify successful login. Continuing anyway...")
+
+    for json_file_path in args.json_files:
+        record = load_anime_record(json_file_path)
+        if not record:
+            continue
+        anime_id = backend.create_anime(record)
+        if anime_id:
+            save_anime_id_to_file(anime_id, json_file_path)
+        else:
+            print(f"× {json_file_path}: no anime ID")
+
+    backend.print_stats()
+    if backend.failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
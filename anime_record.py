@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Compact, parse-once view of an anime JSON file for the publishing scripts.
+
+The scraper writes either the merged layout (merged fields at the top level
+plus the raw `sources`) or a `sources`-only layout. AnimeRecord normalizes
+both in a single pass: every value the form, tag and staff steps need is
+resolved once, so the scripts no longer probe the nested dicts themselves.
+"""
+
+import json
+
+from merge_engine import is_social_media_url
+from role_resolver import resolve_role
+
+# Social media names skipped when choosing the official site
+SOCIAL_MEDIA_NAMES = ["twitter", "facebook", "instagram", "youtube", "tiktok", "weibo"]
+
+
+def prioritize_official_sites(websites):
+    """
+    Filter out social media sites and prioritize official websites
+    """
+    # First try to find a site that doesn't contain any social media names
+    for site in websites:
+        if site and all(social not in site.lower() for social in SOCIAL_MEDIA_NAMES):
+            return site
+
+    # If no non-social media site is found, return the first available site
+    if websites:
+        return websites[0]
+
+    return ""
+
+
+class AnimeRecord:
+    """
+    Attributes:
+        title (str): Main title
+        alt_titles (str): Alternative titles, one per line
+        alt_titles_source (str): Where the alternative titles came from (for logs)
+        episode_count (str): Episode count, "NC" when unknown
+        official_site (str): Official website, "" when none
+        voice_actors (str): "Actor (Character), ..." text of the Japanese cast
+        staff (list): {"name", "role"} dicts, role already resolved to the site's labels
+        genres (list): Genre tag terms
+        themes (list): Theme tag terms
+    """
+    __slots__ = ("title", "alt_titles", "alt_titles_source", "episode_count", "official_site",
+                 "voice_actors", "staff", "genres", "themes")
+
+    def __init__(self, title="", alt_titles="", alt_titles_source="", episode_count="NC", official_site="",
+                 voice_actors="", staff=None, genres=None, themes=None):
+        self.title = title
+        self.alt_titles = alt_titles
+        self.alt_titles_source = alt_titles_source
+        self.episode_count = episode_count
+        self.official_site = official_site
+        self.voice_actors = voice_actors
+        self.staff = staff or []
+        self.genres = genres or []
+        self.themes = themes or []
+
+    @classmethod
+    def from_data(cls, data):
+        """
+        Build a record from a loaded JSON dict (merged or `sources`-only layout)
+        """
+        sources = data.get("sources") or {}
+        nautiljon = sources.get("nautiljon") or {}
+        myanimelist = sources.get("myanimelist") or {}
+
+        alt_titles, alt_titles_source = _resolve_alt_titles(data, nautiljon, myanimelist)
+        genres, themes = _resolve_tags(data, nautiljon, myanimelist)
+
+        episode_count = "NC"
+        if data.get("episode_count"):
+            episode_count = str(data["episode_count"])
+
+        return cls(
+            title=data.get("title", ""),
+            alt_titles=alt_titles,
+            alt_titles_source=alt_titles_source,
+            episode_count=episode_count,
+            official_site=_resolve_official_site(data, nautiljon, myanimelist),
+            voice_actors=_resolve_voice_actors(data.get("characters") if "characters" in data
+                                               else myanimelist.get("characters")),
+            staff=_resolve_staff(data, nautiljon, myanimelist),
+            genres=genres,
+            themes=themes
+        )
+
+
+def _resolve_alt_titles(data, nautiljon, myanimelist):
+    if "sources" in data:
+        # Nautiljon first, then MyAnimeList
+        if nautiljon.get("alternative_titles"):
+            return "\n".join(nautiljon["alternative_titles"]), "Nautiljon"
+        if myanimelist.get("alt_titles") and myanimelist["alt_titles"].strip():
+            return myanimelist["alt_titles"], "MyAnimeList"
+    elif data.get("alternative_titles"):
+        return "\n".join(data["alternative_titles"]), "merged data"
+    elif data.get("alt_titles"):
+        return data["alt_titles"], "original alt_titles field"
+    return "", ""
+
+
+def _first_official_site(sites):
+    """First site that is neither a placeholder nor a social media page, or an empty string"""
+    for site in sites:
+        if site and site != "No official site found" and not is_social_media_url(site):
+            return site
+    return ""
+
+
+def _resolve_official_site(data, nautiljon, myanimelist):
+    # Only explicit official links: source_urls are the scraped MyAnimeList
+    # and Nautiljon pages, not the anime's site
+    if "official_websites" in data:
+        # Merged layout: the merge already dropped the social media links, an
+        # empty list means there is no official site
+        return prioritize_official_sites(data["official_websites"])
+    if "sources" in data:
+        return _first_official_site([myanimelist.get("official_site")] + (nautiljon.get("official_website") or []))
+    return _first_official_site([data.get("official_site")])
+
+
+def _resolve_voice_actors(characters):
+    parts = []
+    for character in characters or []:
+        character_name = None
+        for va in character.get("voice_actors") or []:
+            if va.get("language") == "Japanese":
+                if character_name is None:
+                    character_name = character['name'].replace(", ", " ")
+                parts.append(f"{va['name'].replace(', ', ' ')} ({character_name})")
+    return ", ".join(parts)
+
+
+def _resolve_tags(data, nautiljon, myanimelist):
+    if "genres" in data:
+        genres = data["genres"]
+    elif "genres" in myanimelist:
+        genres = myanimelist["genres"]
+    else:
+        genres = nautiljon.get("genres", [])
+
+    if "themes" in data:
+        themes = data["themes"]
+    else:
+        themes = list(dict.fromkeys(myanimelist.get("themes", []) + nautiljon.get("themes", [])))
+
+    return genres, themes
+
+
+def _resolve_staff(data, nautiljon, myanimelist):
+    entries = list(data.get("staff") or [])
+    entries.extend(myanimelist.get("staff") or [])
+    entries.extend(nautiljon.get("staff") or [])
+
+    studios = list(data.get("studios") or [])
+    studios.extend(myanimelist.get("studios") or [])
+    if nautiljon.get("studio"):
+        studios.append(nautiljon["studio"])
+    entries.extend({"name": studio, "role": "Studio d'animation"} for studio in studios)
+
+    staff = []
+    seen_entries = set()
+    for entry in entries:
+        if not entry.get("name") or not entry.get("role"):
+            continue
+
+        name = entry["name"].replace(",", "").strip()
+        role = entry["role"].strip()
+        mapped_role = resolve_role(role)
+
+        unique_key = (name.lower(), mapped_role.lower())
+        if unique_key not in seen_entries:
+            seen_entries.add(unique_key)
+            staff.append({"name": name, "role": mapped_role})
+
+    return staff
+
+
+def as_anime_record(anime_data):
+    """Return anime_data as an AnimeRecord, converting a loaded JSON dict if needed"""
+    if isinstance(anime_data, AnimeRecord):
+        return anime_data
+    return AnimeRecord.from_data(anime_data)
+
+
+def load_anime_record(file_path):
+    """
+    Load a JSON file as an AnimeRecord
+
+    Returns:
+        AnimeRecord: The record, or None if the file cannot be read
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return AnimeRecord.from_data(json.load(file))
+    except FileNotFoundError:
+        print(f"Error: The file {file_path} was not found.")
+    except json.JSONDecodeError:
+        print(f"Error: The file {file_path} does not contain valid JSON.")
+    except Exception as e:
+        print(f"Error loading JSON data: {e}")
+    return None
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Page-load benchmark of the lean and full browser profiles against a local stand-in.
+
+A small http.server serves an admin-like page: the anime form the scripts
+wait for, plus images, a web font, a video and a script from another host
+(standing in for ads and analytics), each answered after a simulated network
+latency. Every profile loads the page several times and the time until the
+form is usable is reported, with the requests and bytes the stand-in served.
+Needs Chrome and ChromeDriver.
+
+    python benchmarks/bench_browser_profile.py --loads 20
+    python benchmarks/bench_browser_profile.py --latency 80 --images 30 --visible
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from browser_profile import BROWSER_PROFILES, BlockedRequestStats, create_browser
+
+# Served size of each kind of resource, in bytes
+ASSET_SIZES = {"png": 40000, "woff2": 60000, "mp4": 500000, "js": 80000, "css": 4000}
+CONTENT_TYPES = {"png": "image/png", "woff2": "font/woff2", "mp4": "video/mp4",
+                 "js": "application/javascript", "css": "text/css"}
+
+ADMIN_PAGE = """<html><head>
+<link rel="stylesheet" href="/static/admin.css">
+<script src="{third_party}/tracker.js"></script>
+</head><body>
+<div id="banner">{images}</div>
+<video src="/static/trailer.mp4" autoplay muted></video>
+<form action="anime.php?page=Ajout" method="post">
+  <fieldset id="informations_principales">
+    <input type="text" id="titre" name="titre">
+    <input type="text" id="annee" name="annee">
+    <textarea id="doubleurs" name="doubleurs"></textarea>
+  </fieldset>
+  <input type="submit" value="Ajouter">
+</form>
+</body></html>"""
+
+STYLESHEET = """@font-face {{ font-family: Site; src: url("/static/site.woff2") format("woff2"); }}
+body {{ font-family: Site, sans-serif; }}
+{padding}"""
+
+
+class StandInAdmin:
+    """Local stand-in of an admin page with its subresources"""
+
+    def __init__(self, latency, images):
+        self.latency = latency
+        self.images = images
+        self.requests = 0
+        self.bytes_served = 0
+        self.lock = threading.Lock()
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def send(self, body, content_type):
+                with site.lock:
+                    site.requests += 1
+                    site.bytes_served += len(body)
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Cache-Control", "no-store")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                path = urlparse(self.path).path
+                if path == "/admin":
+                    images = "".join(f'<img src="/static/cover{i}.png">' for i in range(site.images))
+                    page = ADMIN_PAGE.format(third_party=site.third_party_url, images=images)
+                    self.send(page.encode("utf-8"), "text/html; charset=utf-8")
+                    return
+                extension = path.rsplit(".", 1)[-1]
+                if extension not in ASSET_SIZES:
+                    self.send_error(404)
+                    return
+                time.sleep(site.latency)
+                if extension == "css":
+                    body = STYLESHEET.format(padding="/*" + "x" * ASSET_SIZES["css"] + "*/").encode()
+                else:
+                    body = b"\0" * ASSET_SIZES[extension]
+                self.send(body, CONTENT_TYPES[extension])
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        port = self.server.server_port
+        self.url = f"http://127.0.0.1:{port}/admin"
+        # Same server under another host name, standing in for third-party hosts
+        self.third_party_url = f"http://localhost:{port}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def reset(self):
+        with self.lock:
+            self.requests = 0
+            self.bytes_served = 0
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def time_profile(site, profile, loads, headless):
+    """
+    Load the stand-in page loads times with a profile
+
+    Returns:
+        dict: "timings" (seconds until the form is usable), "requests" and
+              "bytes" served per load, and the profile's "stats"
+    """
+    stats = BlockedRequestStats()
+    driver = create_browser(profile, headless=headless, stats=stats,
+                            blocked_patterns=[f"{site.third_party_url}/*"])
+    try:
+        # Warm-up: browser start and first connection
+        driver.get(site.url)
+        site.reset()
+        timings = []
+        for _ in range(loads):
+            start = time.perf_counter()
+            driver.get(site.url)
+            WebDriverWait(driver, 30, poll_frequency=0.01).until(
+                EC.presence_of_element_located((By.ID, "informations_principales")))
+            timings.append(time.perf_counter() - start)
+        # Let the subresources a lean page did not wait for reach the server
+        time.sleep(site.latency * 2)
+        return {"timings": timings, "requests": site.requests / loads,
+                "bytes": site.bytes_served / loads, "stats": stats}
+    finally:
+        driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare page loads of the lean and full browser profiles on a local stand-in")
+    parser.add_argument("--loads", type=int, default=10, help="Page loads per profile (default: 10)")
+    parser.add_argument("--latency", type=float, default=50, help="Simulated latency of each subresource in ms (default: 50)")
+    parser.add_argument("--images", type=int, default=12, help="Images on the page (default: 12)")
+    parser.add_argument("--visible", action="store_true", help="Run Chrome with a window instead of headless")
+    args = parser.parse_args()
+
+    results = {}
+    with StandInAdmin(args.latency / 1000, args.images) as site:
+        for profile in reversed(BROWSER_PROFILES):
+            try:
+                results[profile] = time_profile(site, profile, args.loads, headless=not args.visible)
+            except WebDriverException as e:
+                sys.exit(f"× Could not run Chrome: {e}")
+
+    print(f"\n{'Profile':<8} {'Median':>9} {'Mean':>9} {'Max':>9} {'Requests':>9} {'Served':>10}")
+    for profile, result in results.items():
+        timings = result["timings"]
+        print(f"{profile:<8} {statistics.median(timings) * 1000:>7.0f}ms {statistics.mean(timings) * 1000:>7.0f}ms "
+              f"{max(timings) * 1000:>7.0f}ms {result['requests']:>9.1f} {result['bytes'] / 1000:>8.0f}kB")
+
+    lean, full = results["lean"], results["full"]
+    print(f"\nLean profile: {lean['stats'].total_blocked() / args.loads:.1f} requests blocked per load, "
+          f"{(full['bytes'] - lean['bytes']) / 1000:.0f} kB less served per load")
+    speedup = statistics.median(full["timings"]) / statistics.median(lean["timings"])
+    print(f"✓ Lean page loads are {speedup:.1f}x faster than the full profile" if speedup > 1
+          else f"⚠ Lean page loads are not faster ({speedup:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark of the scrape-merge and publish-extraction data paths.
+
+Builds a corpus of anime records in both JSON layouts (the raw `sources`
+layout and the merged layout written by get_all_anime_from_json.py), either
+synthetically or by replicating real scraped files, and times:
+
+    - CombinedAnimeScraper._merge_info
+    - CombinedAnimeScraper._is_social_media_url
+    - add_staff.extract_staff_info
+    - add_staff.extract_genres_and_themes
+    - fill_form_combined.extract_voice_actors
+    - anime_record.AnimeRecord.from_data (everything the publishing scripts read)
+
+Each case reports ops/sec and peak memory. Results are written as JSON so two
+runs can be compared mechanically:
+
+    python benchmarks/bench_data_paths.py --records 10000 --output bench_before.json
+    python benchmarks/bench_data_paths.py --records 10000 --output bench_after.json --compare bench_before.json
+"""
+
+import argparse
+import copy
+import glob
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from get_all_anime_from_json import CombinedAnimeScraper
+from add_staff import extract_staff_info, extract_genres_and_themes
+from fill_form_combined import extract_voice_actors
+from anime_record import AnimeRecord
+
+GENRES = ["Action", "Aventure", "Comédie", "Drame", "Fantasy", "Romance", "Sci-Fi",
+          "Slice of Life", "Sports", "Mystery", "Horror", "Psychological", "Thriller"]
+THEMES = ["École", "Magie", "Mecha", "Isekai", "Idols", "Vampire", "Militaire",
+          "Musique", "Samouraï", "Voyage temporel", "Harem", "Super-pouvoirs"]
+ROLES = ["Director", "Character Design", "Music", "Series Composition", "Sound Director",
+         "Art Director", "Photography Director", "Original creator", "Key Animation",
+         "Animation Director", "Directeur de la photographie", "Storyboard"]
+STUDIOS = ["Madhouse", "MAPPA", "Bones", "Kyoto Animation", "Production I.G",
+           "WIT Studio", "Sunrise", "Trigger", "CloverWorks", "A-1 Pictures"]
+SITES = ["https://{slug}-anime.jp/", "https://twitter.com/{slug}_anime",
+         "https://www.youtube.com/@{slug}", "https://x.com/{slug}", "https://{slug}.com/"]
+
+
+def make_person(rng):
+    return f"{rng.choice(['Sato', 'Suzuki', 'Takahashi', 'Tanaka', 'Ito', 'Watanabe'])}, " \
+           f"{rng.choice(['Hiroshi', 'Yuki', 'Akira', 'Kenji', 'Mai', 'Rin', 'Sora'])}"
+
+
+def make_sources_record(rng, index):
+    """Build one synthetic record in the raw `sources` layout"""
+    slug = f"anime{index}"
+    title = f"Anime Title {index}"
+    nautiljon = {
+        "title": title,
+        "url": f"https://www.nautiljon.com/animes/{slug}.html",
+        "alternative_titles": [f"{title} alt {n}" for n in range(rng.randint(0, 4))],
+        "synopsis": "Lorem ipsum " * rng.randint(10, 60),
+        "genres": rng.sample(GENRES, rng.randint(1, 4)),
+        "themes": rng.sample(THEMES, rng.randint(0, 4)),
+        "studio": rng.choice(STUDIOS),
+        "staff": [{"name": make_person(rng), "role": rng.choice(ROLES)} for _ in range(rng.randint(3, 15))],
+        "episodes_count": str(rng.randint(1, 26)),
+        "airing_dates": "01/04/2025",
+        "season": "Printemps 2025",
+        "streaming": rng.sample(["Crunchyroll", "ADN", "Netflix"], rng.randint(0, 2)),
+        "official_website": [site.format(slug=slug) for site in rng.sample(SITES, rng.randint(1, 3))],
+        "popularity": rng.randint(1, 5000),
+    }
+    myanimelist = {
+        "title": title,
+        "url": f"https://myanimelist.net/anime/{index}/{slug}",
+        "alt_titles": ", ".join(f"{title} MAL {n}" for n in range(rng.randint(0, 3))),
+        "synopsis": "Lorem ipsum " * rng.randint(10, 60),
+        "genres": rng.sample(GENRES, rng.randint(1, 4)),
+        "themes": rng.sample(THEMES, rng.randint(0, 3)),
+        "studios": rng.sample(STUDIOS, rng.randint(1, 2)),
+        "staff": [{"name": make_person(rng), "role": rng.choice(ROLES)} for _ in range(rng.randint(3, 15))],
+        "episodes": rng.randint(1, 26),
+        "status": "Currently Airing",
+        "aired": "Apr 1, 2025 to ?",
+        "official_site": SITES[0].format(slug=slug),
+        "score": round(rng.uniform(5, 9), 2),
+        "rank": rng.randint(1, 10000),
+        "popularity": rng.randint(1, 10000),
+        "characters": [
+            {
+                "name": make_person(rng),
+                "voice_actors": [
+                    {"name": make_person(rng), "language": rng.choice(["Japanese", "Japanese", "English", "French"])}
+                    for _ in range(rng.randint(1, 3))
+                ]
+            }
+            for _ in range(rng.randint(2, 20))
+        ],
+    }
+    return {"title": title, "sources": {"nautiljon": nautiljon, "myanimelist": myanimelist}}
+
+
+def build_corpus(record_count, fixture_dir=None, seed=42):
+    """
+    Return (sources_records, merged_records) with record_count entries each
+
+    With fixture_dir, the scraped JSON files found there are replicated to
+    reach record_count; otherwise synthetic records are generated.
+    """
+    scraper = CombinedAnimeScraper()
+    sources_records = []
+
+    if fixture_dir:
+        fixtures = []
+        for path in sorted(glob.glob(os.path.join(fixture_dir, "*.json"))):
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if "sources" in data:
+                fixtures.append({"title": data.get("title", ""), "sources": data["sources"]})
+        if not fixtures:
+            raise SystemExit(f"No JSON files with a 'sources' key in {fixture_dir}")
+        sources_records = [copy.deepcopy(fixtures[i % len(fixtures)]) for i in range(record_count)]
+    else:
+        rng = random.Random(seed)
+        sources_records = [make_sources_record(rng, i) for i in range(record_count)]
+
+    merged_records = []
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        for record in sources_records:
+            merged = {"title": record["title"], "sources": record["sources"]}
+            merged.update(scraper._merge_info(record["sources"]))
+            merged_records.append(merged)
+
+    return sources_records, merged_records
+
+
+def build_cases(sources_records, merged_records):
+    """Return {case name: (function, inputs)}"""
+    scraper = CombinedAnimeScraper()
+    urls = []
+    for record in sources_records:
+        urls.extend(record["sources"]["nautiljon"].get("official_website", []))
+        urls.append(record["sources"]["myanimelist"].get("official_site", ""))
+    sources_only = [{"title": r["title"], "sources": r["sources"]} for r in sources_records]
+
+    return {
+        "merge_info": (scraper._merge_info, [r["sources"] for r in sources_records]),
+        "is_social_media_url": (scraper._is_social_media_url, urls),
+        "extract_staff_info[sources]": (extract_staff_info, sources_only),
+        "extract_staff_info[merged]": (extract_staff_info, merged_records),
+        "extract_genres_and_themes[sources]": (extract_genres_and_themes, sources_only),
+        "extract_genres_and_themes[merged]": (extract_genres_and_themes, merged_records),
+        "voice_actors[sources]": (extract_voice_actors, sources_only),
+        "voice_actors[merged]": (extract_voice_actors, merged_records),
+        "anime_record[sources]": (AnimeRecord.from_data, sources_only),
+        "anime_record[merged]": (AnimeRecord.from_data, merged_records),
+    }
+
+
+def run_case(func, inputs, repeat):
+    """
+    Time func over every input (best of `repeat` passes) and measure the
+    peak memory of one extra traced pass
+
+    Returns:
+        dict: ops_per_sec, seconds (best pass), ops and peak_kb
+    """
+    best = None
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for item in inputs:
+                func(item)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        tracemalloc.start()
+        for item in inputs:
+            func(item)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "ops": len(inputs),
+        "seconds": best,
+        "ops_per_sec": len(inputs) / best if best else 0.0,
+        "peak_kb": peak / 1024,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_results(current, baseline_path, threshold):
+    """Print the change of every case against a previous results file"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    print(f"\n=== Comparison with {baseline_path} ({baseline['meta'].get('revision')}) ===")
+    regressions = 0
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if not previous or not previous["ops_per_sec"]:
+            print(f"  {name:<40} (new)")
+            continue
+        ratio = result["ops_per_sec"] / previous["ops_per_sec"]
+        marker = "✓"
+        if ratio < 1 - threshold:
+            marker = "✗"
+            regressions += 1
+        print(f"  {marker} {name:<38} {ratio:6.2f}x ops/sec   "
+              f"peak {previous['peak_kb']:9.1f} KB -> {result['peak_kb']:9.1f} KB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the merge and extraction data paths")
+    parser.add_argument("--records", type=int, default=10000, help="Number of records in the corpus (default: 10000)")
+    parser.add_argument("--fixtures", help="Directory of scraped JSON files to replicate instead of synthetic records")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes per case, best one is kept (default: 3)")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the synthetic corpus (default: 42)")
+    parser.add_argument("--output", "-o", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Previous results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Slowdown ratio reported as a regression (default: 0.10)")
+    args = parser.parse_args()
+
+    print(f"Building corpus of {args.records} records...")
+    sources_records, merged_records = build_corpus(args.records, args.fixtures, args.seed)
+
+    results = {}
+    print(f"\n{'case':<40} {'ops/sec':>12} {'best pass':>11} {'peak mem':>12}")
+    for name, (func, inputs) in build_cases(sources_records, merged_records).items():
+        result = run_case(func, inputs, args.repeat)
+        results[name] = result
+        print(f"{name:<40} {result['ops_per_sec']:>12,.0f} {result['seconds'] * 1000:>9.1f}ms "
+              f"{result['peak_kb']:>9.1f} KB")
+
+    output = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": time.time(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "records": args.records,
+            "corpus": args.fixtures or f"synthetic (seed {args.seed})",
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2)
+        print(f"\n✓ Results saved to {args.output}")
+
+    if args.compare:
+        regressions = compare_results(output, args.compare, args.threshold)
+        if regressions:
+            print(f"\n✗ {regressions} case(s) slower than the baseline by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Benchmark and check of the HTTP anime form backend against a local stand-in.
+
+A small http.server plays the parts of the site the backend talks to: the
+login form of the site root, the redirection to the forums, and the Ajout
+admin page with a multipart form (hidden token, file input, field names that
+differ from their ids). Every created anime is checked field by field against
+what the Selenium flow would have typed, and the time per form is reported.
+
+    python benchmarks/bench_form_backend.py --records 200
+    python benchmarks/bench_form_backend.py spring_anime/*.json
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from anime_form_http import HttpFormBackend, build_form_values
+from anime_record import AnimeRecord, load_anime_record
+
+USERNAME = "bench"
+PASSWORD = "secret"
+SESSION_COOKIE = "PHPSESSID=standin"
+FORM_TOKEN = "f3a9c1"
+
+LOGIN_PAGE = """<html><body>
+<form action="/index.php?action=login2" method="post" accept-charset="UTF-8">
+  <input type="text" name="user" id="user" size="10">
+  <input type="password" name="passwrd" id="passwrd" size="10">
+  <input type="hidden" name="cookielength" value="-1">
+  <input type="hidden" name="hash_passwrd" value="">
+  <input type="submit" id="llsubmit" value="Connexion">
+</form>
+</body></html>"""
+
+ADD_PAGE = """<html><body>
+<form action="anime.php?page=Ajout" method="post" enctype="multipart/form-data">
+  <input type="hidden" name="token" value="{token}">
+  <fieldset id="informations_principales">
+    <input type="text" id="titre" name="titre">
+    <select id="format" name="format">
+      <option value="">--</option><option value="Film">Film</option><option value="Série TV">Série TV</option>
+    </select>
+    <input type="text" id="annee" name="annee">
+    <input type="text" id="titre_orig" name="titre_orig">
+    <textarea id="titres_alternatifs" name="titres_alt"></textarea>
+    <select id="licence" name="licence"><option value="1" selected>Oui</option><option value="0">Non</option></select>
+    <input type="text" id="nb_episodes" name="nb_ep" value="">
+    <input type="text" id="site_officiel" name="site">
+    <textarea id="doubleurs" name="doubleurs"></textarea>
+    <textarea id="synopsis" name="synopsis"></textarea>
+    <input type="checkbox" name="visible" value="1" checked>
+    <input type="file" name="image">
+  </fieldset>
+  <input type="submit" name="valider" value="Ajouter">
+</form>
+</body></html>"""
+
+CREATED_PAGE = """<html><body>
+<p>Fiche ajoutée</p>
+<form action="anime.php?page=Modification" method="post">
+  Identifiant : <span id="id_anime">{anime_id}</span>
+</form>
+</body></html>"""
+
+
+class StandInSite:
+    """Local stand-in of the login and anime admin pages"""
+
+    def __init__(self):
+        self.created = []
+        self.lock = threading.Lock()
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def send_html(self, html, status=200, headers=None):
+                body = html.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def redirect(self, location, headers=None):
+                headers = dict(headers or {}, Location=location)
+                self.send_html("", 302, headers)
+
+            def logged_in(self):
+                return SESSION_COOKIE in (self.headers.get("Cookie") or "")
+
+            def read_form(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                content_type = self.headers.get("Content-Type", "")
+                if content_type.startswith("multipart/form-data"):
+                    message = BytesParser(policy=HTTP).parsebytes(
+                        f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+                    # Parts carry no charset; browsers use the page encoding
+                    return {part.get_param("name", header="content-disposition"):
+                            part.get_payload(decode=True).decode("utf-8")
+                            for part in message.iter_parts()}
+                return {name: values[-1] for name, values in parse_qs(body.decode("utf-8")).items()}
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path == "/":
+                    # Like the site, the login form is only shown to visitors
+                    self.send_html(LOGIN_PAGE if not self.logged_in() else "<html><body>Accueil</body></html>")
+                elif url.path.startswith("/forums"):
+                    self.send_html("<html><body>Forums</body></html>")
+                elif url.path == "/__zone-admin__/anime.php":
+                    if not self.logged_in():
+                        self.redirect("/")
+                    else:
+                        self.send_html(ADD_PAGE.format(token=FORM_TOKEN))
+                else:
+                    self.send_html("Not found", 404)
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                form = self.read_form()
+                if url.path == "/index.php":
+                    if form.get("user") == USERNAME and form.get("passwrd") == PASSWORD:
+                        self.redirect("/forums/index.php", {"Set-Cookie": f"{SESSION_COOKIE}; Path=/"})
+                    else:
+                        self.redirect("/index.php?action=login")
+                elif url.path == "/__zone-admin__/anime.php" and self.logged_in():
+                    if form.get("token") != FORM_TOKEN or "valider" not in form:
+                        self.send_html("Formulaire invalide", 400)
+                        return
+                    with site.lock:
+                        site.created.append(form)
+                        anime_id = str(10000 + len(site.created))
+                    self.send_html(CREATED_PAGE.format(anime_id=anime_id))
+                else:
+                    self.send_html("Forbidden", 403)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+# Form field id -> name used by the stand-in page
+FIELD_NAMES = {"titres_alternatifs": "titres_alt", "nb_episodes": "nb_ep", "site_officiel": "site"}
+
+
+def check_submission(record, submitted):
+    """Return the fields whose submitted value differs from what the Selenium flow types"""
+    mismatches = []
+    for field_id, value in build_form_values(record).items():
+        name = FIELD_NAMES.get(field_id, field_id)
+        # Browsers send textarea line breaks as CRLF
+        if submitted.get(name, "").replace("\r\n", "\n") != str(value):
+            mismatches.append(field_id)
+    if submitted.get("visible") != "1":
+        mismatches.append("visible (checked checkbox)")
+    return mismatches
+
+
+def synthetic_records(count, seed):
+    from bench_data_paths import make_sources_record
+
+    rng = random.Random(seed)
+    return [AnimeRecord.from_data(make_sources_record(rng, i)) for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time the HTTP form backend against a local stand-in")
+    parser.add_argument("json_files", nargs="*", help="Anime JSON files (default: synthetic records)")
+    parser.add_argument("--records", type=int, default=100, help="Number of synthetic records (default: 100)")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the synthetic records (default: 42)")
+    args = parser.parse_args()
+
+    if args.json_files:
+        records = [record for record in map(load_anime_record, args.json_files) if record]
+    else:
+        records = synthetic_records(args.records, args.seed)
+
+    with StandInSite() as site:
+        backend = HttpFormBackend(USERNAME, PASSWORD, base_url=site.url)
+        start = time.perf_counter()
+        if not backend.login():
+            sys.exit("× Login against the stand-in failed")
+        login_time = time.perf_counter() - start
+
+        timings = []
+        ids = []
+        for record in records:
+            start = time.perf_counter()
+            ids.append(backend.create_anime(record))
+            timings.append(time.perf_counter() - start)
+
+        failures = 0
+        for record, anime_id, submitted in zip(records, ids, site.created):
+            mismatches = check_submission(record, submitted)
+            if not anime_id or mismatches:
+                failures += 1
+                print(f"× {record.title}: id={anime_id}, mismatched fields: {mismatches}")
+        failures += len(records) - len(site.created)
+
+    print(f"\nLogin: {login_time * 1000:.1f} ms")
+    print(f"Forms: {len(records)} created in {sum(timings):.2f}s, "
+          f"median {statistics.median(timings) * 1000:.1f} ms, max {max(timings) * 1000:.1f} ms")
+    print(f"✓ All submissions match the Selenium field values" if not failures else f"✗ {failures} bad submissions")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
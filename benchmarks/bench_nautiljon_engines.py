@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Side-by-side benchmark of the Nautiljon scraping engines.
+
+Each page (a Nautiljon URL or a saved page under benchmarks/fixtures) is
+scraped with the HTTP engine and with the Selenium engine. The script prints
+the time per page for each engine and the fields where the two disagree.
+
+    python benchmarks/bench_nautiljon_engines.py benchmarks/fixtures/*.html
+    python benchmarks/bench_nautiljon_engines.py https://www.nautiljon.com/animes/frieren.html --repeat 3
+"""
+
+import argparse
+import glob
+import os
+import pathlib
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nautiljon_http_scraper import NautiljonHttpScraper, parse_anime_page
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+COMPARED_FIELDS = ("title", "alternative_titles", "genres", "themes", "studio", "staff",
+                   "episodes_count", "streaming", "official_website")
+
+
+def run_http(sources, repeat):
+    scraper = NautiljonHttpScraper()
+    timings, results = [], {}
+    for source in sources:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            if source.startswith("http"):
+                results[source] = scraper.scrape(source)
+            else:
+                with open(source, 'r', encoding='utf-8') as f:
+                    results[source] = parse_anime_page(f.read(), source)
+            timings.append(time.perf_counter() - start)
+    return timings, results
+
+
+def run_selenium(sources, repeat, webdriver_path=None, headless=True):
+    import nautiljon_scraper
+
+    timings, results = [], {}
+    for source in sources:
+        url = source if source.startswith("http") else pathlib.Path(source).resolve().as_uri()
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results[source] = nautiljon_scraper.scrape_nautiljon_with_selenium(
+                url, webdriver_path=webdriver_path, headless=headless
+            )
+            timings.append(time.perf_counter() - start)
+    return timings, results
+
+
+def report(name, timings):
+    if not timings:
+        return
+    print(f"{name:<10} pages={len(timings):<4} mean={statistics.mean(timings) * 1000:9.1f} ms  "
+          f"median={statistics.median(timings) * 1000:9.1f} ms  max={max(timings) * 1000:9.1f} ms")
+
+
+def compare(http_results, selenium_results):
+    print("\n=== Field comparison (HTTP vs Selenium) ===")
+    for source, http_info in http_results.items():
+        selenium_info = selenium_results.get(source) or {}
+        differences = [field for field in COMPARED_FIELDS
+                       if (http_info or {}).get(field) != selenium_info.get(field)]
+        if differences:
+            print(f"⚠ {os.path.basename(source)}: differs on {', '.join(differences)}")
+        else:
+            print(f"✓ {os.path.basename(source)}: identical")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the HTTP and Selenium Nautiljon engines")
+    parser.add_argument("sources", nargs="*", help="Nautiljon URLs or saved pages (default: all fixtures)")
+    parser.add_argument("--repeat", type=int, default=5, help="Scrapes per page and engine (default: 5)")
+    parser.add_argument("--engines", default="http,selenium", help="Comma separated engines to run (default: http,selenium)")
+    parser.add_argument("--webdriver-path", "-w", help="Path to ChromeDriver executable")
+    args = parser.parse_args()
+
+    sources = args.sources or sorted(glob.glob(os.path.join(FIXTURES_DIR, "nautiljon_*.html")))
+    if not sources:
+        print("No pages to benchmark")
+        sys.exit(1)
+    engines = [engine.strip() for engine in args.engines.split(",")]
+
+    http_timings, http_results = ([], {})
+    selenium_timings, selenium_results = ([], {})
+    if "http" in engines:
+        http_timings, http_results = run_http(sources, args.repeat)
+    if "selenium" in engines:
+        selenium_timings, selenium_results = run_selenium(sources, args.repeat, args.webdriver_path)
+
+    print("\n=== Time per page ===")
+    report("http", http_timings)
+    report("selenium", selenium_timings)
+    if http_timings and selenium_timings:
+        speedup = statistics.mean(selenium_timings) / statistics.mean(http_timings)
+        print(f"HTTP engine is {speedup:.1f}x faster than Selenium")
+        compare(http_results, selenium_results)
+
+
+if __name__ == "__main__":
+    main()
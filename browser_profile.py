@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Chrome profiles of the publishing scripts.
+
+The admin pages carry images, web fonts, media and third-party scripts (ads,
+analytics, social widgets) that the automation never looks at, and every
+anime loads several admin pages. The "lean" profile:
+
+- blocks images, media, fonts and known third-party hosts with
+  Network.setBlockedURLs, so the browser never sends those requests
+- uses the "eager" page-load strategy: get() returns once the DOM is ready
+  instead of after every subresource
+- can run headless
+
+Stylesheets are still loaded: the staff and tag steps rely on element
+visibility. Blocked requests are counted from the browser's performance log,
+with an estimated size per resource type, and reported at the end of the run.
+The "full" profile is the previous behaviour (everything loaded), kept for
+comparison and for debugging page rendering.
+"""
+
+import json
+import threading
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.event_firing_webdriver import EventFiringWebDriver
+
+from rate_limiter import RateLimiter, RateLimitListener, rate_limited_driver
+
+BROWSER_PROFILES = ("lean", "full")
+
+BLOCKED_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp",   # images
+    "mp4", "webm", "mp3", "ogg", "wav",                                 # media
+    "woff", "woff2", "ttf", "otf", "eot",                               # fonts
+)
+
+# Ads, analytics, social widgets and web font hosts
+THIRD_PARTY_PATTERNS = (
+    "*googletagmanager.com/*", "*google-analytics.com/*", "*googlesyndication.com/*",
+    "*doubleclick.net/*", "*adservice.google.*", "*amazon-adsystem.com/*", "*criteo.com/*",
+    "*criteo.net/*", "*facebook.net/*", "*connect.facebook.com/*", "*platform.twitter.com/*",
+    "*addthis.com/*", "*sharethis.com/*", "*disqus.com/*", "*fonts.googleapis.com/*",
+    "*fonts.gstatic.com/*",
+)
+
+# Rough transfer size of a blocked request, by CDP resource type
+ESTIMATED_BYTES = {"Image": 40000, "Media": 500000, "Font": 60000, "Script": 80000, "Stylesheet": 20000}
+DEFAULT_ESTIMATED_BYTES = 20000
+
+
+def blocked_url_patterns(extra_patterns=None):
+    """URL patterns blocked by the lean profile, plus extra_patterns"""
+    patterns = []
+    for extension in BLOCKED_EXTENSIONS:
+        patterns.extend((f"*.{extension}", f"*.{extension}?*"))
+    patterns.extend(THIRD_PARTY_PATTERNS)
+    patterns.extend(extra_patterns or [])
+    return patterns
+
+
+class BlockedRequestStats:
+    """Requests blocked (and bytes loaded) by the lean browsers of a run"""
+
+    def __init__(self):
+        self.pages = 0
+        self.blocked = {}
+        self.bytes_saved = 0
+        self.bytes_loaded = 0
+        self._lock = threading.Lock()
+
+    def page_loaded(self):
+        with self._lock:
+            self.pages += 1
+
+    def record_log(self, entries):
+        """Count the blocked and finished requests of performance log entries"""
+        blocked = {}
+        saved = 0
+        loaded = 0
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            params = message.get("params") or {}
+            if message.get("method") == "Network.loadingFailed" and params.get("blockedReason"):
+                resource_type = params.get("type", "Other")
+                blocked[resource_type] = blocked.get(resource_type, 0) + 1
+                saved += ESTIMATED_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+            elif message.get("method") == "Network.loadingFinished":
+                loaded += params.get("encodedDataLength", 0)
+
+        with self._lock:
+            for resource_type, count in blocked.items():
+                self.blocked[resource_type] = self.blocked.get(resource_type, 0) + count
+            self.bytes_saved += saved
+            self.bytes_loaded += loaded
+
+    def total_blocked(self):
+        with self._lock:
+            return sum(self.blocked.values())
+
+    def print_stats(self):
+        if not self.pages:
+            return
+        with self._lock:
+            by_type = sorted(self.blocked.items(), key=lambda item: -item[1])
+        details = ", ".join(f"{count} {resource_type.lower()}" for resource_type, count in by_type) or "none"
+        print(f"Lean browser profile: {self.total_blocked()} requests blocked over {self.pages} page loads "
+              f"({details}), ~{self.bytes_saved / 1e6:.1f} MB saved, {self.bytes_loaded / 1e6:.1f} MB loaded")
+
+
+# Shared by every lean browser of the process
+BROWSER_STATS = BlockedRequestStats()
+
+
+class ProfileListener(RateLimitListener):
+    """Rate limits like RateLimitListener and counts the requests of each page from the performance log"""
+
+    def __init__(self, limiter, stats):
+        super().__init__(limiter)
+        self.stats = stats
+
+    def _collect(self, driver):
+        try:
+            self.stats.record_log(driver.get_log("performance"))
+        except WebDriverException:
+            pass
+
+    def after_navigate_to(self, url, driver):
+        self.stats.page_loaded()
+        self._collect(driver)
+
+    def after_click(self, element, driver):
+        self._collect(driver)
+
+    def before_quit(self, driver):
+        self._collect(driver)
+
+
+def create_browser(profile="lean", headless=False, debug=False, rate_limiter=None, webdriver_path=None,
+                   blocked_patterns=None, stats=BROWSER_STATS):
+    """
+    Start Chrome with a browser profile
+
+    Args:
+        profile (str): "lean" (resources blocked, eager page loads) or "full" (everything loaded)
+        headless (bool): Run without a window
+        debug (bool): Keep Chrome's own logging
+        rate_limiter (RateLimiter, optional): Shared cap on navigations and clicks
+        webdriver_path (str, optional): Path to ChromeDriver executable
+        blocked_patterns (list, optional): More URL patterns to block in the lean profile
+        stats (BlockedRequestStats): Counters of the lean profile
+
+    Returns:
+        WebDriver: The driver, wrapped in an EventFiringWebDriver when it is lean or rate limited
+    """
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    else:
+        options.add_argument("--start-maximized")
+    if not debug:
+        options.add_argument("--disable-logging")
+        options.add_argument("--log-level=3")
+
+    lean = profile == "lean"
+    if lean:
+        options.page_load_strategy = "eager"
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    service = Service(webdriver_path) if webdriver_path else None
+    driver = webdriver.Chrome(options=options, service=service)
+
+    if lean:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_url_patterns(blocked_patterns)})
+        return EventFiringWebDriver(driver, ProfileListener(rate_limiter or RateLimiter(), stats))
+    if rate_limiter is not None:
+        return rate_limited_driver(driver, rate_limiter)
+    return driver
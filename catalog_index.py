@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Local index of the anime fiches that already exist on the site.
+
+The index (id, title, original title, alternative titles of every fiche) is
+built from the admin listing and refreshed incrementally: listing pages are
+read until one brings no unknown fiche, and only the new fiches have their
+Modification page fetched for the original and alternative titles.
+
+Before publishing, the titles of each JSON file are checked against it:
+exact match on the normalized titles, then on a romanization key (long
+vowels folded, so "Kaijuu", "Kaijû" and "Kaiju" agree), then a fuzzy match
+that never pairs titles with different numbers ("Saison 2" vs "Saison 3").
+A matching file is routed to its existing fiche instead of creating a new one.
+
+    python catalog_index.py --refresh --username me --password secret
+    python catalog_index.py --lookup "Kaijuu 8-gou"
+    python catalog_index.py --check spring_anime
+"""
+
+import argparse
+import difflib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+from bs4 import BeautifulSoup
+
+from title_keys import title_key
+
+DEFAULT_CATALOG_PATH = ".anime_catalog.json"
+
+# Admin listing of the fiches; "{page}" is replaced by the page number
+DEFAULT_LISTING_PAGE = "__zone-admin__/anime.php?page=Liste&p={page}"
+DETAIL_PAGE = "__zone-admin__/anime.php?page=Modification&id_fiche={anime_id}"
+
+DEFAULT_FUZZY_CUTOFF = 0.9
+
+# Form fields of the Modification page holding the titles of a fiche
+TITLE_FIELDS = ("titre", "titre_orig", "titres_alternatifs")
+
+FICHE_ID_PATTERN = re.compile(r"id_fiche=(\d+)")
+LONG_VOWEL_PATTERN = re.compile(r"ou|oo|uu|aa|ii|ee")
+
+
+def romanization_key(title):
+    """title_key with long vowels folded and spaces dropped ("Kaijuu 8 gou" -> "kaiju8go")"""
+    key = re.sub(r"\bwo\b", "o", title_key(title))
+    key = LONG_VOWEL_PATTERN.sub(lambda match: match.group(0)[0], key)
+    return key.replace(" ", "")
+
+
+def parse_listing(html):
+    """
+    Read the fiches of an admin listing page
+
+    Returns:
+        dict: Anime ID -> title (the text of the first non-empty link to the fiche)
+    """
+    fiches = {}
+    soup = BeautifulSoup(html, "html.parser")
+    for link in soup.find_all("a", href=FICHE_ID_PATTERN):
+        anime_id = FICHE_ID_PATTERN.search(link["href"]).group(1)
+        title = link.get_text(" ", strip=True)
+        if title or anime_id not in fiches:
+            fiches[anime_id] = fiches.get(anime_id) or title
+    return fiches
+
+
+def parse_fiche_titles(html):
+    """
+    Read the title fields of a fiche's Modification page
+
+    Returns:
+        dict: {"title", "original_title", "alt_titles" (list)}; missing fields are empty
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    values = {}
+    for field_id in TITLE_FIELDS:
+        element = soup.find(id=field_id)
+        if element is None:
+            values[field_id] = ""
+        elif element.name == "textarea":
+            values[field_id] = element.get_text()
+        else:
+            values[field_id] = element.get("value", "")
+    return {
+        "title": values["titre"].strip(),
+        "original_title": values["titre_orig"].strip(),
+        "alt_titles": [line.strip() for line in values["titres_alternatifs"].splitlines() if line.strip()],
+    }
+
+
+def record_titles(record):
+    """Titles of an AnimeRecord to look up: main title then alternative titles"""
+    titles = [record.title] if record.title else []
+    titles.extend(line.strip() for line in (record.alt_titles or "").splitlines() if line.strip())
+    return titles
+
+
+class AnimeCatalog:
+    def __init__(self, path=DEFAULT_CATALOG_PATH, fuzzy_cutoff=DEFAULT_FUZZY_CUTOFF):
+        """
+        Args:
+            path (str): Index file
+            fuzzy_cutoff (float): Minimum similarity (0-1) of a fuzzy match
+        """
+        self.path = path
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.fiches = {}
+        self.refreshed_at = 0
+        self.checks = 0
+        self.matches = {"exact": 0, "romanization": 0, "fuzzy": 0}
+        self._lock = threading.Lock()
+        self._load()
+        self._build_keys()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠ Could not read anime catalog {self.path}: {e}")
+            return
+        self.fiches = data.get("fiches", {})
+        self.refreshed_at = data.get("refreshed_at", 0)
+
+    def _save(self):
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".anime_catalog_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"refreshed_at": self.refreshed_at, "fiches": self.fiches}, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠ Could not save anime catalog: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def fiche_titles(fiche):
+        titles = [fiche.get("title"), fiche.get("original_title")] + list(fiche.get("alt_titles") or [])
+        return [title for title in titles if title]
+
+    def _build_keys(self):
+        self.exact_keys = {}
+        self.romanization_keys = {}
+        for anime_id, fiche in self.fiches.items():
+            self._index_fiche(anime_id, fiche)
+
+    def _index_fiche(self, anime_id, fiche):
+        for title in self.fiche_titles(fiche):
+            self.exact_keys.setdefault(title_key(title), {})[anime_id] = title
+            self.romanization_keys.setdefault(romanization_key(title), {})[anime_id] = title
+
+    def _unindex_fiche(self, anime_id, fiche):
+        for title in self.fiche_titles(fiche):
+            for keys, key in ((self.exact_keys, title_key(title)), (self.romanization_keys, romanization_key(title))):
+                candidates = keys.get(key, {})
+                candidates.pop(anime_id, None)
+                if not candidates:
+                    keys.pop(key, None)
+
+    def __len__(self):
+        return len(self.fiches)
+
+    def add(self, anime_id, title, original_title="", alt_titles=None, save=True):
+        """Index a fiche (e.g. one just created by the publishing scripts)"""
+        fiche = {
+            "title": title,
+            "original_title": original_title,
+            "alt_titles": list(alt_titles or []),
+            "indexed_at": time.time(),
+        }
+        with self._lock:
+            if str(anime_id) in self.fiches:
+                self._unindex_fiche(str(anime_id), self.fiches[str(anime_id)])
+            self.fiches[str(anime_id)] = fiche
+            self._index_fiche(str(anime_id), fiche)
+            if save:
+                self._save()
+
+    def add_record(self, anime_id, record):
+        """Index the fiche created from an AnimeRecord"""
+        titles = record_titles(record)
+        self.add(anime_id, record.title, record.title, titles[1:])
+
+    def refresh(self, get_page, listing_page=DEFAULT_LISTING_PAGE, full=False, details=True, max_pages=500):
+        """
+        Read the admin listing and index the fiches that are not known yet
+
+        Without full, paging stops at the first page that has no unknown fiche.
+
+        Args:
+            get_page (callable): Takes a site path and returns a response with .text
+                                 (HttpFormBackend.get_page of a logged-in backend)
+            listing_page (str): Listing path; "{page}" is replaced by 1, 2, ...
+                                (without it, a single page is read)
+            full (bool): Read every listing page, and fetch the titles of every fiche again
+            details (bool): Fetch the Modification page of new fiches for their other titles
+            max_pages (int): Safety limit on the listing pages read
+
+        Returns:
+            int: Number of fiches added
+        """
+        paged = "{page}" in listing_page
+        added = 0
+        try:
+            for page in range(1, max_pages + 1 if paged else 2):
+                path = listing_page.format(page=page) if paged else listing_page
+                listed = parse_listing(get_page(path).text)
+                new = {anime_id: title for anime_id, title in listed.items()
+                       if full or anime_id not in self.fiches}
+                print(f"Listing page {page}: {len(listed)} fiches, {len(new)} new")
+
+                for anime_id, title in new.items():
+                    titles = {"title": title, "original_title": "", "alt_titles": []}
+                    if details:
+                        try:
+                            titles = parse_fiche_titles(get_page(DETAIL_PAGE.format(anime_id=anime_id)).text)
+                            titles["title"] = titles["title"] or title
+                        except Exception as e:
+                            print(f"⚠ Could not read the titles of fiche {anime_id}: {e}")
+                    self.add(anime_id, titles["title"], titles["original_title"], titles["alt_titles"], save=False)
+                    added += 1
+
+                if not listed or (not new and not full):
+                    break
+            self.refreshed_at = time.time()
+        finally:
+            # Keep what was indexed even if the refresh was interrupted
+            with self._lock:
+                self._save()
+        print(f"✓ Anime catalog: {added} fiches added, {len(self.fiches)} indexed")
+        return added
+
+    def match(self, titles):
+        """
+        Find the existing fiche of an anime
+
+        Args:
+            titles (list): Titles of the anime, main title first
+
+        Returns:
+            dict: {"anime_id", "title" (of the fiche), "query", "method", "score"},
+                  or None if no fiche matches
+        """
+        titles = [title for title in titles if title]
+        with self._lock:
+            self.checks += 1
+            found = self._match(titles)
+            if found:
+                self.matches[found["method"]] += 1
+        return found
+
+    def _match(self, titles):
+        for method, keys, key_func in (("exact", self.exact_keys, title_key),
+                                       ("romanization", self.romanization_keys, romanization_key)):
+            for title in titles:
+                candidates = keys.get(key_func(title))
+                if candidates:
+                    # Several fiches with the same title: the oldest is the original
+                    anime_id = min(candidates, key=int)
+                    return {"anime_id": anime_id, "title": candidates[anime_id], "query": title,
+                            "method": method, "score": 1.0}
+
+        best = None
+        for title in titles:
+            key = romanization_key(title)
+            if not key:
+                continue
+            numbers = re.findall(r"\d+", key)
+            for other in difflib.get_close_matches(key, self.romanization_keys, n=3, cutoff=self.fuzzy_cutoff):
+                # "Titre 2" and "Titre 3" are close but different fiches
+                if re.findall(r"\d+", other) != numbers:
+                    continue
+                score = difflib.SequenceMatcher(None, key, other).ratio()
+                if best is None or score > best["score"]:
+                    candidates = self.romanization_keys[other]
+                    anime_id = min(candidates, key=int)
+                    best = {"anime_id": anime_id, "title": candidates[anime_id], "query": title,
+                            "method": "fuzzy", "score": score}
+        return best
+
+    def match_record(self, record):
+        """match() on the main and alternative titles of an AnimeRecord"""
+        return self.match(record_titles(record))
+
+    def print_stats(self):
+        matched = sum(self.matches.values())
+        print(f"Anime catalog: {matched}/{self.checks} titles already on the site "
+              f"({self.matches['exact']} exact, {self.matches['romanization']} romanization, "
+              f"{self.matches['fuzzy']} fuzzy), {len(self.fiches)} fiches indexed")
+
+
+def describe_match(found):
+    return (f"fiche {found['anime_id']} '{found['title']}' "
+            f"({found['method']} match on '{found['query']}', {found['score']:.2f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index the anime fiches of the site and check titles against it")
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG_PATH, help=f"Index file (default: {DEFAULT_CATALOG_PATH})")
+    parser.add_argument("--refresh", action="store_true", help="Index the fiches added to the site since the last refresh")
+    parser.add_argument("--full", action="store_true", help="With --refresh, read every listing page and fiche again")
+    parser.add_argument("--no-details", action="store_true", help="With --refresh, only index the listing titles (no Modification page per fiche)")
+    parser.add_argument("--listing-url", default=DEFAULT_LISTING_PAGE,
+                        help=f"Admin listing path, {{page}} is the page number (default: {DEFAULT_LISTING_PAGE})")
+    parser.add_argument("--username", default="*****", help="Username for login")
+    parser.add_argument("--password", default="*****", help="Password for login")
+    parser.add_argument("--base-url", help="Site root (default: the live site)")
+    parser.add_argument("--session-file", help="Saved login session shared with the other scripts (default: .site_session.json)")
+    parser.add_argument("--fresh-login", action="store_true", help="Ignore the saved login session and log in with the form")
+    parser.add_argument("--max-rps", type=float, default=2, help="Cap on requests per second during --refresh, 0 for no cap (default: 2)")
+    parser.add_argument("--fuzzy-cutoff", type=float, default=DEFAULT_FUZZY_CUTOFF,
+                        help=f"Minimum similarity of a fuzzy match (default: {DEFAULT_FUZZY_CUTOFF})")
+    parser.add_argument("--lookup", metavar="TITLE", help="Print the fiche matching TITLE")
+    parser.add_argument("--check", metavar="PATH", help="Print the route (create or existing fiche) of every anime of a JSON file, JSONL file or directory")
+    args = parser.parse_args()
+
+    catalog = AnimeCatalog(args.catalog, args.fuzzy_cutoff)
+
+    if args.refresh:
+        # Imported here: only the refresh needs the HTTP session
+        from anime_form_http import SITE_URL, HttpFormBackend
+        from rate_limiter import RateLimiter
+        from session_store import DEFAULT_SESSION_PATH, SessionStore
+
+        backend = HttpFormBackend(args.username, args.password, base_url=args.base_url or SITE_URL,
+                                  rate_limiter=RateLimiter(args.max_rps))
+        session_store = SessionStore(args.username, args.password, args.session_file or DEFAULT_SESSION_PATH,
+                                     backend.base_url, reuse=not args.fresh_login)
+        if not session_store.login_http(backend):
+            print("⚠ Could not verify successful login. Continuing anyway...")
+        catalog.refresh(backend.get_page, args.listing_url, full=args.full, details=not args.no_details)
+
+    if args.lookup:
+        found = catalog.match([args.lookup])
+        print(f"✓ {describe_match(found)}" if found else f"× No fiche matches '{args.lookup}'")
+
+    if args.check:
+        from run_anime_automation import get_json_files, iter_anime_items
+
+        for json_file_path, record in iter_anime_items(get_json_files(args.check)):
+            if not record:
+                continue
+            found = catalog.match_record(record)
+            if found:
+                print(f"⚠ {record.title}: update {describe_match(found)}")
+            else:
+                print(f"✓ {record.title}: create")
+        catalog.print_stats()
+
+    if not (args.refresh or args.lookup or args.check):
+        age = (time.time() - catalog.refreshed_at) / 86400 if catalog.refreshed_at else None
+        refreshed = f"refreshed {age:.1f} days ago" if age is not None else "never refreshed"
+        print(f"{len(catalog)} fiches indexed in {catalog.path} ({refreshed})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Filling of the anime form in the browser.
+
+send_keys types one character at a time, which makes large fields (the
+doubleurs cast list, multi-line titres_alternatifs) slow to fill. In script
+mode every field and select is set in a single execute_script call that
+fires the input/change events the page listens to, and all values are read
+back in a second call. Fields whose value did not stick are typed the usual
+way, so the result is the same as in typing mode.
+"""
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import Select
+
+FILL_MODES = ("script", "type")
+
+# Sets every field of arguments[0] ({id: value}) and fires input/change like
+# typing would; returns the ids that are not on the page
+FILL_FORM_SCRIPT = """
+var values = arguments[0];
+var missing = [];
+Object.keys(values).forEach(function (id) {
+    var element = document.getElementById(id);
+    if (!element) {
+        missing.push(id);
+        return;
+    }
+    element.focus();
+    element.value = values[id];
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+    element.blur();
+});
+return missing;
+"""
+
+READ_FORM_SCRIPT = """
+var values = {};
+arguments[0].forEach(function (id) {
+    var element = document.getElementById(id);
+    values[id] = element ? element.value : null;
+});
+return values;
+"""
+
+
+def _same_value(actual, expected):
+    # Textareas may report line breaks as CRLF
+    return actual is not None and actual.replace("\r\n", "\n") == str(expected).replace("\r\n", "\n")
+
+
+def type_field(driver, field_id, value):
+    """Fill one field the way a user would (select option or typing)"""
+    element = driver.find_element(By.ID, field_id)
+    if element.tag_name.lower() == "select":
+        Select(element).select_by_value(value)
+    else:
+        element.clear()
+        element.send_keys(value)
+
+
+def type_form_values(driver, values):
+    """Fill the fields of values ({field id: value}) one by one with send_keys"""
+    for field_id, value in values.items():
+        type_field(driver, field_id, value)
+
+
+def fill_form_by_script(driver, values):
+    """
+    Fill the fields of values ({field id: value}) in one script call
+
+    Every value is read back; fields that do not hold the expected value are
+    typed with send_keys instead.
+
+    Returns:
+        list: Ids of the fields that had to be typed
+    """
+    missing = driver.execute_script(FILL_FORM_SCRIPT, values) or []
+    actual = driver.execute_script(READ_FORM_SCRIPT, list(values)) or {}
+
+    mismatched = [field_id for field_id, value in values.items() if not _same_value(actual.get(field_id), value)]
+    for field_id in mismatched:
+        reason = "not found" if field_id in missing else f"holds '{actual.get(field_id)}'"
+        print(f"⚠ Field {field_id} {reason} after the scripted fill, typing it instead")
+        type_field(driver, field_id, values[field_id])
+    return mismatched
+
+
+def fill_form(driver, values, mode="script"):
+    """
+    Fill the form fields of values ({field id: value})
+
+    Args:
+        mode (str): "script" (one execute_script call, typing as fallback) or "type"
+    """
+    if mode == "script":
+        fill_form_by_script(driver, values)
+    else:
+        type_form_values(driver, values)
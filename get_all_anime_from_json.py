@@ -1,25 +1,170 @@
 #!/usr/bin/env python3
 import argparse
+import inspect
 import json
 import sys
 import time
 import os
 import re
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 # Import the individual scrapers
 from get_info_json_myanime import MyAnimeListScraper
 import nautiljon_scraper
+from scrape_cache import ScrapeCache
+from scrape_manifest import ScrapeManifest
+from webdriver_pool import WebDriverPool
+from nautiljon_http_scraper import NautiljonHttpScraper
+from season_ingest import ingest_season
+from jsonl_stream import JsonlWriter, record_file_path, sanitize_filename
+from mal_title_index import TitleResolutionIndex
+from merge_engine import MergeEngine, is_social_media_url
+
+# Pooled drivers can only be used if the Nautiljon scraper accepts an existing
+# driver; otherwise it starts its own browser for every page
+NAUTILJON_ACCEPTS_DRIVER = "driver" in inspect.signature(
+    nautiljon_scraper.scrape_nautiljon_with_selenium
+).parameters
+
+# Compiled once and shared by every scraper
+MERGE_ENGINE = MergeEngine()
 
 class CombinedAnimeScraper:
-    def __init__(self, webdriver_path=None, headless=True):
+    def __init__(self, webdriver_path=None, headless=True, concurrent_sources=False, source_timeout=None, cache=None, driver_pool=None, engine="selenium", title_index=None):
         self.mal_scraper = MyAnimeListScraper()
         self.webdriver_path = webdriver_path
         self.headless = headless
+        self.concurrent_sources = concurrent_sources
+        self.source_timeout = source_timeout
+        self.cache = cache
+        self.title_index = title_index
+        self.driver_pool = driver_pool if NAUTILJON_ACCEPTS_DRIVER else None
+        self.http_scraper = None
+        if engine == "http":
+            # HTTP first; Selenium only for pages missing required fields
+            self.http_scraper = NautiljonHttpScraper(selenium_fallback=self._fetch_nautiljon_page)
+    
+    def _cached(self, namespace, key, fetch_func):
+        """
+        Serve a scraper call from the on-disk cache when one is configured
+        """
+        if self.cache is None:
+            return fetch_func()
+        return self.cache.fetch(namespace, key, fetch_func)
+    
+    def _scrape_nautiljon(self, anime_name, nautiljon_url=None):
+        """
+        Scrape the Nautiljon page for an anime
+        
+        Args:
+            anime_name (str): Name of the anime, used to guess the URL
+            nautiljon_url (str, optional): Direct URL for Nautiljon page
+        
+        Returns:
+            dict: Nautiljon information, or None on failure
+        """
+        # Get the URL or format it
+        if not nautiljon_url:
+            nautiljon_url = nautiljon_scraper.format_anime_url(anime_name)
+        
+        print(f"Using Nautiljon URL: {nautiljon_url}")
+        fetch_page = self.http_scraper.scrape if self.http_scraper else self._fetch_nautiljon_page
+        return self._cached("nautiljon", nautiljon_url, lambda: fetch_page(nautiljon_url))
+    
+    def _fetch_nautiljon_page(self, nautiljon_url):
+        """
+        Run the Selenium scrape, on a pooled driver when a pool is available
+        """
+        if self.driver_pool is not None:
+            with self.driver_pool.driver() as driver:
+                return nautiljon_scraper.scrape_nautiljon_with_selenium(nautiljon_url, driver=driver)
+        
+        return nautiljon_scraper.scrape_nautiljon_with_selenium(
+            nautiljon_url,
+            webdriver_path=self.webdriver_path,
+            headless=self.headless
+        )
+    
+    def close(self):
+        """Close the HTTP session and the MyAnimeList scraper's browser, if it keeps one open"""
+        if self.http_scraper is not None:
+            self.http_scraper.session.close()
+        close = getattr(self.mal_scraper, "close", None) or getattr(self.mal_scraper, "quit", None)
+        if close is None:
+            return
+        try:
+            close()
+        except Exception as e:
+            print(f"⚠ Could not close the MyAnimeList scraper: {e}")
+    
+    def _scrape_myanimelist(self, anime_name):
+        """
+        Search MyAnimeList for an anime and scrape its page
+        
+        Args:
+            anime_name (str): Name of the anime to search
+        
+        Returns:
+            dict: MyAnimeList information, or None on failure
+        """
+        def search():
+            return self._cached("mal_search", anime_name, lambda: self.mal_scraper.search_anime(anime_name))
+        
+        if self.title_index is not None:
+            mal_url = self.title_index.resolve(anime_name, search)
+        else:
+            mal_url = search()
+        if mal_url:
+            return self._cached("mal_info", mal_url, lambda: self.mal_scraper.get_anime_info(mal_url))
+        return None
+    
+    def _scrape_sources_concurrently(self, anime_name, nautiljon_url=None):
+        """
+        Run the Nautiljon and MyAnimeList scrapes at the same time
+        
+        Each source is given self.source_timeout seconds (counted from the
+        start of the call); a source that is still running after that is
+        treated as a failure and its result is discarded.
+        
+        Returns:
+            tuple: (nautiljon_info, mal_info), either of which may be None
+        """
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="source")
+        start_time = time.time()
+        futures = {
+            "nautiljon": executor.submit(self._scrape_nautiljon, anime_name, nautiljon_url),
+            "myanimelist": executor.submit(self._scrape_myanimelist, anime_name)
+        }
+        
+        results = {}
+        try:
+            for source_name, future in futures.items():
+                remaining = None
+                if self.source_timeout is not None:
+                    remaining = max(0, self.source_timeout - (time.time() - start_time))
+                try:
+                    results[source_name] = future.result(timeout=remaining)
+                except FutureTimeoutError:
+                    print(f"× {source_name} timed out after {self.source_timeout}s")
+                    results[source_name] = None
+                except Exception as e:
+                    print(f"× Error while scraping {source_name}: {e}")
+                    results[source_name] = None
+        finally:
+            # Do not block on a source that timed out
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return results["nautiljon"], results["myanimelist"]
     
     def scrape_anime(self, anime_name, nautiljon_url=None, nautiljon_only=False):
         """
         Scrape anime information from both MyAnimeList and Nautiljon, or just Nautiljon
         
+        When concurrent_sources is enabled both sources are fetched at the same
+        time; the merge still gives Nautiljon priority.
+        
         Args:
             anime_name (str): Name of the anime to search
             nautiljon_url (str, optional): Direct URL for Nautiljon page
@@ -33,19 +178,14 @@ class CombinedAnimeScraper:
             "sources": {}
         }
         
-        # Step 1: Scrape Nautiljon (now first priority)
-        print("\n=== Scraping Nautiljon ===")
-        
-        # Get the URL or format it
-        if not nautiljon_url:
-            nautiljon_url = nautiljon_scraper.format_anime_url(anime_name)
-        
-        print(f"Using Nautiljon URL: {nautiljon_url}")
-        nautiljon_info = nautiljon_scraper.scrape_nautiljon_with_selenium(
-            nautiljon_url,
-            webdriver_path=self.webdriver_path,
-            headless=self.headless
-        )
+        if self.concurrent_sources and not nautiljon_only:
+            print("\n=== Scraping Nautiljon and MyAnimeList concurrently ===")
+            nautiljon_info, mal_info = self._scrape_sources_concurrently(anime_name, nautiljon_url)
+        else:
+            # Step 1: Scrape Nautiljon (now first priority)
+            print("\n=== Scraping Nautiljon ===")
+            nautiljon_info = self._scrape_nautiljon(anime_name, nautiljon_url)
+            mal_info = None
         
         if nautiljon_info:
             combined_info["title"] = nautiljon_info.get("title", "")
@@ -69,13 +209,9 @@ class CombinedAnimeScraper:
                 return None
         
         # Step 2: Scrape MyAnimeList (only if not nautiljon_only)
-        print("\n=== Scraping MyAnimeList ===")
-        
-        mal_url = self.mal_scraper.search_anime(anime_name)
-        if mal_url:
-            mal_info = self.mal_scraper.get_anime_info(mal_url)
-        else:
-            mal_info = None
+        if not self.concurrent_sources:
+            print("\n=== Scraping MyAnimeList ===")
+            mal_info = self._scrape_myanimelist(anime_name)
         
         if mal_info:
             # Only set title from MAL if we don't have one from Nautiljon
@@ -104,262 +240,356 @@ class CombinedAnimeScraper:
         Returns:
             bool: True if the URL is from a social media platform, False otherwise
         """
-        if not url:
-            return False
-        
-        # List of social media domains to exclude
-        social_media_domains = [
-            'twitter.com',
-            'x.com',
-            'facebook.com',
-            'instagram.com',
-            'youtube.com',
-            'tiktok.com',
-            'weibo.com',
-            'linkedin.com',
-            'discord.gg',
-            'discord.com'
-        ]
-        
-        url_lower = url.lower()
-        return any(domain in url_lower for domain in social_media_domains)
+        return is_social_media_url(url)
     
     def _merge_info(self, sources):
         """
         Merge information from different sources with Nautiljon priority
         
+        The per-field priority, combination and filtering rules live in
+        merge_engine.MERGE_RULES.
+        
         Args:
             sources (dict): Dictionary with keys as source names and values as source data
         
         Returns:
             dict: Merged anime information with Nautiljon taking priority
         """
-        merged = {
-            "title": "",
-            "alternative_titles": [],
-            "synopsis": "",
-            "genres": [],
-            "themes": [],
-            "studios": [],
-            "staff": [],
-            "episodes": [],
-            "airing_info": {},
-            "streaming": [],
-            "official_websites": [],
-            "scores": {},
-            "source_urls": {}
-        }
-        
-        # Add source URLs
-        for source_name, source_data in sources.items():
-            if source_name == "myanimelist" and source_data.get("url"):
-                merged["source_urls"]["myanimelist"] = source_data["url"]
-            elif source_name == "nautiljon":
-                if source_data.get("url"):
-                    merged["source_urls"]["nautiljon"] = source_data["url"]
-        
-        # Title: Prefer Nautiljon (changed priority)
-        if sources.get("nautiljon", {}).get("title"):
-            merged["title"] = sources["nautiljon"]["title"]
-        elif sources.get("myanimelist", {}).get("title"):
-            merged["title"] = sources["myanimelist"]["title"]
-        
-        # Alternative Titles: Combine from both sources
-        alt_titles = set()
-        
-        # From Nautiljon first
-        if sources.get("nautiljon", {}).get("alternative_titles"):
-            for title in sources["nautiljon"]["alternative_titles"]:
-                if title:
-                    alt_titles.add(title)
-        
-        # From MAL
-        if sources.get("myanimelist", {}).get("alt_titles"):
-            for title in sources["myanimelist"]["alt_titles"].split(","):
-                title = title.strip()
-                if title:
-                    alt_titles.add(title)
-        
-        merged["alternative_titles"] = list(alt_titles)
-        
-        # Synopsis: Prefer Nautiljon (changed priority)
-        if sources.get("nautiljon", {}).get("synopsis"):
-            merged["synopsis"] = sources["nautiljon"]["synopsis"]
-        elif sources.get("myanimelist", {}).get("synopsis") and sources["myanimelist"]["synopsis"] != "No synopsis available":
-            merged["synopsis"] = sources["myanimelist"]["synopsis"]
-        
-        # Genres, Themes: Combine from both sources (Nautiljon first)
-        genres_set = set()
-        themes_set = set()
-        
-        # Nautiljon first
-        if sources.get("nautiljon"):
-            for genre in sources["nautiljon"].get("genres", []):
-                genres_set.add(genre)
-            for theme in sources["nautiljon"].get("themes", []):
-                themes_set.add(theme)
-        
-        # Then MAL
-        if sources.get("myanimelist"):
-            for genre in sources["myanimelist"].get("genres", []):
-                genres_set.add(genre)
-            for theme in sources["myanimelist"].get("themes", []):
-                themes_set.add(theme)
-        
-        merged["genres"] = list(genres_set)
-        merged["themes"] = list(themes_set)
-        
-        # Studios: Prefer Nautiljon, then combine
-        studios_set = set()
-        
-        if sources.get("nautiljon", {}).get("studio"):
-            studios_set.add(sources["nautiljon"]["studio"])
-        
-        if sources.get("myanimelist"):
-            for studio in sources["myanimelist"].get("studios", []):
-                studios_set.add(studio)
-        
-        merged["studios"] = list(studios_set)
-        
-        # Staff: Prefer Nautiljon (changed priority)
-        if sources.get("nautiljon", {}).get("staff"):
-            merged["staff"] = sources["nautiljon"]["staff"]
-        elif sources.get("myanimelist", {}).get("staff"):
-            merged["staff"] = sources["myanimelist"]["staff"]
-        
-        # Episodes: Prefer Nautiljon's episode details
-        if sources.get("nautiljon", {}).get("episodes"):
-            merged["episodes"] = sources["nautiljon"]["episodes"]
-        
-        # Episode count: Prefer Nautiljon
-        if sources.get("nautiljon", {}).get("episodes_count"):
-            merged["episode_count"] = sources["nautiljon"]["episodes_count"]
-        elif sources.get("myanimelist", {}).get("episodes"):
-            merged["episode_count"] = sources["myanimelist"]["episodes"]
-        
-        # Airing Information: Prefer Nautiljon data
-        merged["airing_info"] = {}
-        
-        # Nautiljon first
-        if sources.get("nautiljon"):
-            if sources["nautiljon"].get("airing_dates"):
-                merged["airing_info"]["dates"] = sources["nautiljon"]["airing_dates"]
-            if sources["nautiljon"].get("season"):
-                merged["airing_info"]["season"] = sources["nautiljon"]["season"]
-        
-        # MAL as backup/supplement
-        if sources.get("myanimelist"):
-            if sources["myanimelist"].get("status"):
-                merged["airing_info"]["status"] = sources["myanimelist"]["status"]
-            if sources["myanimelist"].get("aired") and not merged["airing_info"].get("dates"):
-                merged["airing_info"]["aired"] = sources["myanimelist"]["aired"]
-            if sources["myanimelist"].get("season") and not merged["airing_info"].get("season"):
-                merged["airing_info"]["season"] = sources["myanimelist"]["season"]
-        
-        # Streaming platforms: From Nautiljon (MAL doesn't have this)
-        if sources.get("nautiljon", {}).get("streaming"):
-            merged["streaming"] = sources["nautiljon"]["streaming"]
-        
-        # Official Websites: Combine from both (Nautiljon first) - EXCLUDE SOCIAL MEDIA
-        websites = set()
-        
-        if sources.get("nautiljon", {}).get("official_website"):
-            for site in sources["nautiljon"]["official_website"]:
-                if site and not self._is_social_media_url(site):
-                    websites.add(site)
-                elif site and self._is_social_media_url(site):
-                    print(f"Excluding social media URL: {site}")
-        
-        if sources.get("myanimelist", {}).get("official_site"):
-            site = sources["myanimelist"]["official_site"]
-            if site and not self._is_social_media_url(site):
-                websites.add(site)
-            elif site and self._is_social_media_url(site):
-                print(f"Excluding social media URL: {site}")
-        
-        merged["official_websites"] = list(websites)
-        
-        # Scores: From both sources (keeping both for comparison)
-        if sources.get("nautiljon"):
-            if sources["nautiljon"].get("popularity"):
-                merged["scores"]["nautiljon_popularity"] = sources["nautiljon"]["popularity"]
-            if sources["nautiljon"].get("trend"):
-                merged["scores"]["nautiljon_trend"] = sources["nautiljon"]["trend"]
-        
-        if sources.get("myanimelist"):
-            if sources["myanimelist"].get("score"):
-                merged["scores"]["myanimelist"] = sources["myanimelist"]["score"]
-            if sources["myanimelist"].get("rank"):
-                merged["scores"]["mal_rank"] = sources["myanimelist"]["rank"]
-            if sources["myanimelist"].get("popularity"):
-                merged["scores"]["mal_popularity"] = sources["myanimelist"]["popularity"]
-        
-        return merged
+        return MERGE_ENGINE.merge(sources)
+
+def load_anime_list(file_path):
+    """
+    Read a list of anime names from a text file, stripping leading numbering
+    such as "12. " or "3) " copied from the season extractor.
+    """
+    anime_list = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            # Remove leading numbers and punctuation
+            cleaned_title = re.sub(r'^\s*\d+\s*[\.\)\:\-\s]*', '', line)
+            if cleaned_title:
+                anime_list.append(cleaned_title)
+    return anime_list
 
-def sanitize_filename(name):
+def save_result(result, anime_name, output_dir):
     """
-    Remove invalid filename characters and replace spaces with underscores.
+    Write one scrape result to its per-title JSON file and return the path.
     """
-    return re.sub(r'[\\/*?:"<>|]', '', name).replace(' ', '_')
+    output_path = os.path.join(output_dir, f"{sanitize_filename(anime_name)}.json")
+    with open(output_path, 'w', encoding='utf-8') as f_out:
+        json.dump(result, f_out, indent=2, ensure_ascii=False)
+    return output_path
+
+def scrape_batch(anime_list, output_dir, scraper_factory, workers=1, nautiljon_only=False, manifest=None, max_age=None, resume=True, nautiljon_urls=None, jsonl_writer=None, job_store=None):
+    """
+    Scrape a list of anime with a bounded pool of worker threads.
+    
+    Each worker builds its own scraper (and therefore its own browser) through
+    scraper_factory and pulls titles from a shared queue until it is empty.
+    
+    Args:
+        anime_list (list): Anime names to scrape
+        output_dir (str): Directory receiving the per-title JSON files
+        scraper_factory (callable): Returns a new CombinedAnimeScraper
+        workers (int): Number of concurrent workers
+        nautiljon_only (bool): If True, only scrape from Nautiljon
+        manifest (ScrapeManifest, optional): Checkpoint used to skip finished titles
+        max_age (float, optional): Seconds after which a finished title is scraped again
+        resume (bool): If False, scrape every title but still update the manifest
+        nautiljon_urls (dict, optional): Exact Nautiljon URL for each title,
+                                         as found by the season ingester
+        jsonl_writer (JsonlWriter, optional): Append results to one JSONL file
+                                              instead of writing a file per title
+        job_store (JobStore, optional): Publishing queue receiving each result
+                                        as soon as it is saved
+    
+    Returns:
+        dict: Summary with "succeeded" (name -> output path), "failed"
+              (name -> reason), "skipped" titles, "elapsed" seconds and
+              "workers" used
+    """
+    nautiljon_urls = nautiljon_urls or {}
+    skipped = []
+    if manifest is not None and resume:
+        pending = manifest.pending(anime_list, max_age)
+        skipped = [anime_name for anime_name in anime_list if anime_name not in pending]
+        if skipped:
+            print(f"Skipping {len(skipped)} titles already completed in {manifest.path}")
+        anime_list = pending
+    
+    workers = max(1, min(workers, len(anime_list))) if anime_list else 1
+    titles = queue.Queue()
+    for anime_name in anime_list:
+        titles.put(anime_name)
+    
+    succeeded = {}
+    failed = {}
+    startup_errors = []
+    results_lock = threading.Lock()
+    
+    def worker(worker_id):
+        try:
+            scraper = scraper_factory()
+        except Exception as e:
+            # Its titles stay in the queue for the other workers
+            with results_lock:
+                startup_errors.append(str(e))
+            print(f"× [worker {worker_id}] Could not start the scraper: {e}")
+            return
+        try:
+            scrape_titles(worker_id, scraper)
+        finally:
+            scraper.close()
+    
+    def scrape_titles(worker_id, scraper):
+        while True:
+            try:
+                anime_name = titles.get_nowait()
+            except queue.Empty:
+                return
+            print(f"\n--- [worker {worker_id}] Processing: {anime_name} ---")
+            try:
+                result = scraper.scrape_anime(
+                    anime_name,
+                    nautiljon_url=nautiljon_urls.get(anime_name),
+                    nautiljon_only=nautiljon_only
+                )
+                if result:
+                    if jsonl_writer is not None:
+                        jsonl_writer.write(result)
+                        output_path = jsonl_writer.path
+                    else:
+                        output_path = save_result(result, anime_name, output_dir)
+                    with results_lock:
+                        succeeded[anime_name] = output_path
+                    if manifest is not None:
+                        source_urls = result.get("source_urls") or {result.get("source", "nautiljon"): result.get("url")}
+                        manifest.record_success(anime_name, output_path, source_urls)
+                    print(f"✓ Saved to {output_path}")
+                    if job_store is not None:
+                        job_key = record_file_path(output_path, result) if jsonl_writer is not None else output_path
+                        job_store.add(job_key, result)
+                else:
+                    with results_lock:
+                        failed[anime_name] = "no data from any source"
+                    if manifest is not None:
+                        manifest.record_failure(anime_name, "no data from any source")
+                    print(f"× Failed to retrieve information for: {anime_name}")
+            except Exception as e:
+                with results_lock:
+                    failed[anime_name] = str(e)
+                if manifest is not None:
+                    manifest.record_failure(anime_name, str(e))
+                print(f"× Error while processing {anime_name}: {e}")
+            finally:
+                titles.task_done()
+    
+    start_time = time.time()
+    threads = [
+        threading.Thread(target=worker, args=(i + 1,), name=f"scrape-worker-{i + 1}")
+        for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    # Titles left behind when no worker could start a scraper
+    while True:
+        try:
+            anime_name = titles.get_nowait()
+        except queue.Empty:
+            break
+        reason = f"scraper could not start: {startup_errors[-1]}"
+        failed[anime_name] = reason
+        if manifest is not None:
+            manifest.record_failure(anime_name, reason)
+    
+    return {
+        "succeeded": succeeded,
+        "failed": failed,
+        "skipped": skipped,
+        "elapsed": time.time() - start_time,
+        "workers": workers
+    }
+
+def print_batch_summary(summary, total):
+    """
+    Print the batch results and a titles/minute throughput figure.
+    """
+    elapsed = summary["elapsed"]
+    processed = len(summary["succeeded"]) + len(summary["failed"])
+    per_minute = processed / (elapsed / 60) if elapsed > 0 else 0.0
+    
+    print("\n" + "="*80)
+    print("BATCH SUMMARY")
+    print("="*80)
+    print(f"Total titles: {total}")
+    print(f"Skipped (already done): {len(summary['skipped'])}")
+    print(f"Successful: {len(summary['succeeded'])}")
+    print(f"Failed: {len(summary['failed'])}")
+    for anime_name, reason in summary["failed"].items():
+        print(f"  × {anime_name}: {reason}")
+    print(f"Workers: {summary['workers']}")
+    print(f"Elapsed: {elapsed:.1f}s")
+    print(f"Throughput: {per_minute:.2f} titles/minute "
+          f"({per_minute / summary['workers']:.2f} per worker)")
+    print("="*80)
 
 def main():
     parser = argparse.ArgumentParser(description="Combined anime scraper from MyAnimeList and Nautiljon")
-    parser.add_argument("input", help="Anime name or path to text file with list of anime names")
+    parser.add_argument("input", help="Anime name, path to text file with list of anime names, or season page with --season")
+    parser.add_argument("--output-format", choices=["json", "jsonl"], default="json", help="One pretty-printed JSON file per title, or one JSONL file appended as titles finish (default: json)")
+    parser.add_argument("--jsonl-path", help="JSONL file for --output-format jsonl (default: <output-dir>/results.jsonl)")
+    parser.add_argument("--season", "-s", action="store_true", help="Input is a saved Nautiljon season page or its URL; scrape every anime it lists")
     parser.add_argument("--nautiljon-url", "-n", help="Specific Nautiljon URL to scrape (ignored if list is provided)")
     parser.add_argument("--nautiljon-only", "-N", action="store_true", help="Only scrape from Nautiljon (skip MyAnimeList)")
     parser.add_argument("--output-dir", "-o", help="Directory to save JSON results", default="anime_results")
     parser.add_argument("--webdriver-path", "-w", help="Path to ChromeDriver executable")
     parser.add_argument("--no-headless", action="store_true", help="Run Chrome in visible mode (not headless)")
+    parser.add_argument("--workers", "-j", type=int, default=1, help="Number of concurrent scraping workers for a title list (default: 1)")
+    parser.add_argument("--concurrent-sources", action="store_true", help="Fetch Nautiljon and MyAnimeList at the same time for each title")
+    parser.add_argument("--source-timeout", type=float, help="Seconds to wait for each source in --concurrent-sources mode (default: no limit)")
+    parser.add_argument("--cache-dir", default=".scrape_cache", help="Directory of the on-disk scrape cache (default: .scrape_cache)")
+    parser.add_argument("--cache-ttl", type=float, default=24, help="Hours before a cached page is fetched again (default: 24)")
+    parser.add_argument("--cache-max-mb", type=float, default=200, help="Size limit of the cache directory in MB (default: 200)")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the scrape cache")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached entries and fetch everything again (results are still cached)")
+    parser.add_argument("--title-index", default=".mal_title_index.json", help="Title -> MAL URL index file (default: .mal_title_index.json)")
+    parser.add_argument("--no-title-index", action="store_true", help="Always search MyAnimeList instead of using the title index")
+    parser.add_argument("--max-age", type=float, help="Hours after which a title completed in a previous run is scraped again (default: never)")
+    parser.add_argument("--no-resume", action="store_true", help="Scrape every title in the list, ignoring the checkpoint manifest")
+    parser.add_argument("--engine", choices=["selenium", "http"], default="selenium", help="Nautiljon scraping engine; 'http' skips the browser and falls back to Selenium for incomplete pages (default: selenium)")
+    parser.add_argument("--no-driver-pool", action="store_true", help="Start a new browser for every title instead of reusing pooled drivers")
+    parser.add_argument("--driver-max-pages", type=int, default=50, help="Pages a pooled browser serves before it is restarted (default: 50)")
+    parser.add_argument("--job-db", help="Also queue every scraped title in this publishing job database (see job_queue.py)")
 
     args = parser.parse_args()
 
-    scraper = CombinedAnimeScraper(
-        webdriver_path=args.webdriver_path,
-        headless=not args.no_headless
-    )
+    cache = None
+    if not args.no_cache:
+        cache = ScrapeCache(
+            cache_dir=args.cache_dir,
+            ttl=args.cache_ttl * 3600,
+            max_size_mb=args.cache_max_mb,
+            refresh=args.refresh
+        )
+
+    title_index = None if args.no_title_index else TitleResolutionIndex(args.title_index)
+
+    job_store = None
+    if args.job_db:
+        # Imported here: job_queue pulls in the publishing modules
+        from job_queue import JobStore
+        job_store = JobStore(args.job_db)
+
+    driver_pool = None
+    if not args.no_driver_pool:
+        if NAUTILJON_ACCEPTS_DRIVER:
+            driver_pool = WebDriverPool(
+                size=max(1, args.workers),
+                webdriver_path=args.webdriver_path,
+                headless=not args.no_headless,
+                max_pages=args.driver_max_pages
+            )
+        else:
+            print("⚠ nautiljon_scraper does not accept a driver argument, starting one browser per title")
+
+    def make_scraper():
+        return CombinedAnimeScraper(
+            webdriver_path=args.webdriver_path,
+            headless=not args.no_headless,
+            concurrent_sources=args.concurrent_sources,
+            source_timeout=args.source_timeout,
+            cache=cache,
+            driver_pool=driver_pool,
+            engine=args.engine,
+            title_index=title_index
+        )
 
     os.makedirs(args.output_dir, exist_ok=True)
 
-    # Check if input is a file
-    if os.path.isfile(args.input):
-        with open(args.input, 'r', encoding='utf-8') as f:
-            anime_list = []
-            for line in f:
-                line = line.strip()
-                # Remove leading numbers and punctuation
-                cleaned_title = re.sub(r'^\s*\d+\s*[\.\)\:\-\s]*', '', line)
-                if cleaned_title:
-                    anime_list.append(cleaned_title)
+    try:
+        nautiljon_urls = None
+        if args.season:
+            entries = ingest_season(args.input)
+            print(f"Found {len(entries)} anime on the season page")
+            anime_list = [entry["title"] for entry in entries]
+            nautiljon_urls = {entry["title"]: entry["url"] for entry in entries}
+        elif os.path.isfile(args.input):
+            anime_list = load_anime_list(args.input)
+        else:
+            anime_list = None
+
+        # Check if input is a list of anime
+        if anime_list is not None:
+            jsonl_writer = None
+            if args.output_format == "jsonl":
+                jsonl_writer = JsonlWriter(args.jsonl_path or os.path.join(args.output_dir, "results.jsonl"))
+            summary = scrape_batch(
+                anime_list,
+                args.output_dir,
+                make_scraper,
+                workers=args.workers,
+                nautiljon_only=args.nautiljon_only,
+                manifest=ScrapeManifest(args.output_dir),
+                max_age=args.max_age * 3600 if args.max_age is not None else None,
+                resume=not args.no_resume,
+                nautiljon_urls=nautiljon_urls,
+                jsonl_writer=jsonl_writer,
+                job_store=job_store
+            )
+            if jsonl_writer is not None:
+                jsonl_writer.close()
+                print(f"✓ {jsonl_writer.records} records appended to {jsonl_writer.path}")
+            print_batch_summary(summary, len(anime_list))
+            if cache:
+                cache.print_stats()
+            if title_index:
+                title_index.print_stats()
+
+        else:
+            # Single anime mode
+            scraper = make_scraper()
+            try:
+                result = scraper.scrape_anime(
+                    args.input, 
+                    args.nautiljon_url,
+                    nautiljon_only=args.nautiljon_only
+                )
+            finally:
+                scraper.close()
         
-        for anime_name in anime_list:
-            print(f"\n--- Processing: {anime_name} ---")
-            result = scraper.scrape_anime(anime_name, nautiljon_only=args.nautiljon_only)
             if result:
-                output_path = os.path.join(args.output_dir, f"{sanitize_filename(anime_name)}.json")
-                with open(output_path, 'w', encoding='utf-8') as f_out:
-                    json.dump(result, f_out, indent=2, ensure_ascii=False)
-                print(f"✓ Saved to {output_path}")
+                if args.output_format == "jsonl":
+                    jsonl_writer = JsonlWriter(args.jsonl_path or os.path.join(args.output_dir, "results.jsonl"))
+                    jsonl_writer.write(result)
+                    jsonl_writer.close()
+                    output_path = jsonl_writer.path
+                else:
+                    safe_title = sanitize_filename(result['title'])
+                    output_filename = f"{safe_title}.json"
+                    output_path = os.path.join(args.output_dir, output_filename)
+                    with open(output_path, 'w', encoding='utf-8') as f_out:
+                        json.dump(result, f_out, indent=2, ensure_ascii=False)
+                print(f"\n✓ Results saved to {output_path}")
+                if job_store is not None:
+                    job_key = record_file_path(output_path, result) if args.output_format == "jsonl" else output_path
+                    job_store.add(job_key, result)
+                    print(f"✓ Queued in {job_store.path}")
+                if cache:
+                    cache.print_stats()
+                if title_index:
+                    title_index.print_stats()
             else:
-                print(f"× Failed to retrieve information for: {anime_name}")
-
-    else:
-        # Single anime mode
-        result = scraper.scrape_anime(
-            args.input, 
-            args.nautiljon_url,
-            nautiljon_only=args.nautiljon_only
-        )
-        
-        if result:
-            safe_title = sanitize_filename(result['title'])
-            output_filename = f"{safe_title}.json"
-            output_path = os.path.join(args.output_dir, output_filename)
-            with open(output_path, 'w', encoding='utf-8') as f_out:
-                json.dump(result, f_out, indent=2, ensure_ascii=False)
-            print(f"\n✓ Results saved to {output_path}")
-        else:
-            print("\n× Failed to retrieve anime information.")
-            sys.exit(1)
+                print("\n× Failed to retrieve anime information.")
+                sys.exit(1)
+    finally:
+        if driver_pool is not None:
+            driver_pool.shutdown()
+        if job_store is not None:
+            job_store.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
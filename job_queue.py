@@ -0,0 +1,700 @@
+#!/usr/bin/env python3
+"""
+Persistent, stage-based publishing queue.
+
+Every anime is a job in a SQLite database that moves through explicit
+stages: scraped -> created (anime_id known) -> tagged -> staffed. Each step
+between two stages (create, tags, staff) has its own pool of workers, so
+the tags of one anime are selected while the next one is being created and
+the staff of a third is being added. Workers claim a job with a lease; a job
+whose worker died is picked up again once its lease expires, and every step
+is safe to run again:
+
+- create reuses the anime ID saved next to the data if the fiche was
+  already created (the ID file is written before the job advances), and
+  the ID of the existing fiche when the anime catalog knows the title. A
+  form that was submitted without giving an ID is never posted again: the
+  fiche is looked up in the admin listing, or the job is parked for a check
+- staff remembers each member added, so a restart only adds the rest
+
+Failed steps are retried with a growing delay until --max-attempts, then the
+job is parked as failed (see --status and --retry-failed).
+
+    python job_queue.py spring_anime --staff-workers 2
+    python job_queue.py anime_results/results.jsonl --no-run
+    python job_queue.py --status
+"""
+
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from jsonl_stream import iter_jsonl_records, record_file_path
+from anime_record import AnimeRecord
+from anime_form_http import HttpFormBackend
+from form_fill import FILL_MODES
+from rate_limiter import RateLimiter
+from catalog_index import DEFAULT_CATALOG_PATH, AnimeCatalog
+from session_store import DEFAULT_SESSION_PATH, SessionStore
+from browser_profile import BROWSER_PROFILES, BROWSER_STATS
+from role_resolver import ROLE_RESOLVER
+from staff_id_cache import StaffIdCache
+from wait_engine import WAITS, parse_budgets
+from run_anime_automation import (
+    anime_id_file_path, create_driver, fill_anime_form, find_existing_fiche, get_json_files, load_saved_anime_id,
+    process_staff, process_tags, submit_anime_form_http,
+)
+
+DEFAULT_DB_PATH = ".publish_jobs.db"
+
+STAGES = ("scraped", "created", "tagged", "staffed")
+
+# Step -> (stage a job must be in, stage it reaches when the step succeeds)
+STEPS = {
+    "create": ("scraped", "created"),
+    "tags": ("created", "tagged"),
+    "staff": ("tagged", "staffed"),
+}
+
+
+class LeaseLost(Exception):
+    """The lease of a job expired and another worker may have claimed it"""
+
+
+class NeedsManualCheck(Exception):
+    """A retry could duplicate work on the site; the job is parked until someone checks it"""
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_LEASE = 120
+# Delay before the first retry of a failed step, doubled for each further attempt
+RETRY_DELAY = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY,
+    title TEXT,
+    data TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    anime_id TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    lease_owner TEXT,
+    lease_until REAL,
+    retry_at REAL NOT NULL DEFAULT 0,
+    submitted_at REAL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_stage ON jobs (stage, failed, retry_at);
+CREATE TABLE IF NOT EXISTS staff_added (
+    key TEXT NOT NULL,
+    name TEXT NOT NULL,
+    role TEXT NOT NULL,
+    PRIMARY KEY (key, name, role)
+);
+"""
+
+
+class JobStore:
+    def __init__(self, path=DEFAULT_DB_PATH, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        """
+        Args:
+            path (str): SQLite database file, shared by every process of the pipeline
+            max_attempts (int): Attempts of a step before the job is parked as failed
+        """
+        self.path = path
+        self.max_attempts = max_attempts
+        # One connection shared by the worker threads; the scraper and other
+        # runners use their own connections to the same file (WAL mode)
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "submitted_at" not in columns:
+            # Databases created before the submission marker
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN submitted_at REAL")
+        self._lock = threading.Lock()
+
+    def _transaction(self, statements):
+        """Run statements ([(sql, params)]) in one write transaction; returns the last cursor"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = None
+                for sql, params in statements:
+                    cursor = self._conn.execute(sql, params)
+                self._conn.execute("COMMIT")
+                return cursor
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def add(self, key, data):
+        """
+        Queue an anime at the scraped stage
+
+        Adding a key again refreshes its data as long as the fiche has not
+        been created yet; jobs further along are left alone.
+
+        Args:
+            key (str): Per-title JSON path, also used to name the anime ID file
+            data (dict): Scraped anime data
+
+        Returns:
+            bool: True if the job is new
+        """
+        known = bool(self._query("SELECT 1 FROM jobs WHERE key = ?", (key,)))
+        self._transaction([(
+            "INSERT INTO jobs (key, title, data, stage, updated_at) VALUES (?, ?, ?, 'scraped', ?) "
+            "ON CONFLICT (key) DO UPDATE SET title = excluded.title, data = excluded.data, "
+            "updated_at = excluded.updated_at WHERE jobs.stage = 'scraped'",
+            (key, data.get("title"), json.dumps(data, ensure_ascii=False), time.time())
+        )])
+        return not known
+
+    def claim(self, step, owner, lease=DEFAULT_LEASE):
+        """
+        Lease the oldest job that is ready for step
+
+        Returns:
+            dict: The job row with its attempts already counted, or None if no job is ready
+        """
+        from_stage = STEPS[step][0]
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT * FROM jobs WHERE stage = ? AND failed = 0 AND retry_at <= ? "
+                    "AND (lease_until IS NULL OR lease_until < ?) ORDER BY updated_at LIMIT 1",
+                    (from_stage, now, now)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET lease_owner = ?, lease_until = ?, attempts = attempts + 1 WHERE key = ?",
+                        (owner, now + lease, row["key"])
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        if row is None:
+            return None
+        job = dict(row)
+        job["attempts"] += 1
+        return job
+
+    def renew(self, job, owner, lease=DEFAULT_LEASE):
+        """
+        Extend the lease of a job during a long step
+
+        Raises:
+            LeaseLost: If another worker has claimed the job since
+        """
+        cursor = self._transaction([(
+            "UPDATE jobs SET lease_until = ? WHERE key = ? AND lease_owner = ?",
+            (time.time() + lease, job["key"], owner)
+        )])
+        if cursor.rowcount != 1:
+            raise LeaseLost(f"lease of {job['key']} lost to another worker")
+
+    def advance(self, job, owner, stage, anime_id=None):
+        """
+        Move a leased job to stage and reset its retry counter
+
+        Raises:
+            LeaseLost: If another worker has claimed the job since
+        """
+        cursor = self._transaction([(
+            "UPDATE jobs SET stage = ?, anime_id = COALESCE(?, anime_id), attempts = 0, last_error = NULL, "
+            "lease_owner = NULL, lease_until = NULL, retry_at = 0, updated_at = ? "
+            "WHERE key = ? AND lease_owner = ?",
+            (stage, anime_id, time.time(), job["key"], owner)
+        )])
+        if cursor.rowcount != 1:
+            raise LeaseLost(f"lease of {job['key']} lost to another worker")
+
+    def fail(self, job, owner, error):
+        """
+        Release a leased job after a failed step
+
+        Returns:
+            bool: True if the job will be retried, False if it is parked as failed
+
+        Raises:
+            LeaseLost: If another worker has claimed the job since
+        """
+        retry = job["attempts"] < self.max_attempts
+        retry_at = time.time() + RETRY_DELAY * 2 ** (job["attempts"] - 1) if retry else 0
+        cursor = self._transaction([(
+            "UPDATE jobs SET failed = ?, last_error = ?, retry_at = ?, lease_owner = NULL, lease_until = NULL, "
+            "updated_at = ? WHERE key = ? AND lease_owner = ?",
+            (0 if retry else 1, error, retry_at, time.time(), job["key"], owner)
+        )])
+        if cursor.rowcount != 1:
+            raise LeaseLost(f"lease of {job['key']} lost to another worker")
+        return retry
+
+    def mark_submitted(self, job, owner):
+        """
+        Record that the create form of a job is about to be submitted
+
+        Raises:
+            LeaseLost: If another worker has claimed the job since
+        """
+        now = time.time()
+        cursor = self._transaction([(
+            "UPDATE jobs SET submitted_at = ?, updated_at = ? WHERE key = ? AND lease_owner = ?",
+            (now, now, job["key"], owner)
+        )])
+        if cursor.rowcount != 1:
+            raise LeaseLost(f"lease of {job['key']} lost to another worker")
+        job["submitted_at"] = now
+
+    def park(self, job, owner, error):
+        """
+        Release a leased job as failed right away, without further attempts
+
+        Raises:
+            LeaseLost: If another worker has claimed the job since
+        """
+        cursor = self._transaction([(
+            "UPDATE jobs SET failed = 1, last_error = ?, retry_at = 0, lease_owner = NULL, lease_until = NULL, "
+            "updated_at = ? WHERE key = ? AND lease_owner = ?",
+            (error, time.time(), job["key"], owner)
+        )])
+        if cursor.rowcount != 1:
+            raise LeaseLost(f"lease of {job['key']} lost to another worker")
+
+    def staff_done(self, key):
+        """(name, role) pairs already added for a job"""
+        return {(row["name"], row["role"]) for row in
+                self._query("SELECT name, role FROM staff_added WHERE key = ?", (key,))}
+
+    def mark_staff_added(self, key, name, role):
+        self._transaction([(
+            "INSERT OR IGNORE INTO staff_added (key, name, role) VALUES (?, ?, ?)", (key, name, role)
+        )])
+
+    def pending_between(self, first_stage, stage):
+        """Number of live jobs from first_stage to stage included (jobs that may still reach stage)"""
+        stages = STAGES[STAGES.index(first_stage):STAGES.index(stage) + 1]
+        placeholders = ", ".join("?" * len(stages))
+        return self._query(
+            f"SELECT COUNT(*) FROM jobs WHERE failed = 0 AND stage IN ({placeholders})", stages
+        )[0][0]
+
+    def retry_failed(self, resubmit=False):
+        """
+        Give every parked job a new set of attempts; returns their number
+
+        Args:
+            resubmit (bool): Also forget that the create form was submitted, for
+                             jobs checked by hand and known to have no fiche
+        """
+        cursor = self._transaction([(
+            "UPDATE jobs SET failed = 0, attempts = 0, retry_at = 0, updated_at = ?"
+            + (", submitted_at = NULL" if resubmit else "") + " WHERE failed = 1",
+            (time.time(),)
+        )])
+        return cursor.rowcount
+
+    def release_leases(self):
+        """Drop every lease, for a restart after a crash when no other runner is active"""
+        cursor = self._transaction([("UPDATE jobs SET lease_owner = NULL, lease_until = NULL", ())])
+        return cursor.rowcount
+
+    def print_status(self):
+        now = time.time()
+        counts = {stage: {"ready": 0, "running": 0, "retrying": 0, "failed": 0} for stage in STAGES}
+        for job in self._query("SELECT stage, failed, lease_until, retry_at FROM jobs"):
+            if job["failed"]:
+                state = "failed"
+            elif job["lease_until"] is not None and job["lease_until"] >= now:
+                state = "running"
+            elif job["retry_at"] > now:
+                state = "retrying"
+            else:
+                state = "ready"
+            counts[job["stage"]][state] += 1
+
+        print(f"\n{'Stage':<10} {'Ready':>7} {'Running':>8} {'Retrying':>9} {'Failed':>7}")
+        for stage in STAGES[:-1]:
+            stats = counts[stage]
+            print(f"{stage:<10} {stats['ready']:>7} {stats['running']:>8} {stats['retrying']:>9} {stats['failed']:>7}")
+        print(f"Published (staffed): {counts[STAGES[-1]]['ready']}")
+
+        failed_jobs = self._query(
+            "SELECT title, key, stage, last_error FROM jobs WHERE failed = 1 ORDER BY updated_at"
+        )
+        if failed_jobs:
+            print(f"\nFailed jobs ({len(failed_jobs)}, retry with --retry-failed):")
+            for job in failed_jobs:
+                print(f"  × {job['title'] or job['key']} (stuck at {job['stage']}): {job['last_error']}")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def enqueue_path(store, json_path):
+    """
+    Queue every anime of a JSON file, JSONL file or directory of JSON files
+
+    Returns:
+        int: Number of new jobs
+    """
+    added = 0
+    for json_file_path in get_json_files(json_path):
+        if json_file_path.endswith('.jsonl'):
+            for data in iter_jsonl_records(json_file_path):
+                added += store.add(record_file_path(json_file_path, data), data)
+            continue
+        try:
+            with open(json_file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"× Could not read {json_file_path}: {e}")
+            continue
+        added += store.add(json_file_path, data)
+    return added
+
+
+class StageWorker:
+    """Runs one step (create, tags or staff) on the jobs that are ready for it"""
+
+    def __init__(self, step, number, store, args, session_store, form_backend=None, staff_id_cache=None,
+                 rate_limiter=None, first_stage="scraped", catalog=None):
+        """
+        Args:
+            first_stage (str): Earliest stage that has workers in this run; jobs
+                               before it cannot reach this step
+        """
+        self.step = step
+        self.first_stage = first_stage
+        self.name = f"{step}-{number}"
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{self.name}"
+        self.store = store
+        self.args = args
+        self.session_store = session_store
+        self.form_backend = form_backend
+        self.staff_id_cache = staff_id_cache
+        self.rate_limiter = rate_limiter
+        self.catalog = catalog
+        self.page_reader = None
+        self.driver = None
+        self.done = 0
+        self.failed = 0
+        self.lost = 0
+
+    def browser(self):
+        """Logged-in driver of this worker, started on first use"""
+        if self.driver is None:
+            driver = create_driver(self.args.debug, self.rate_limiter, self.args.browser_profile, self.args.headless)
+            print(f"=== LOGGING IN [{self.name}] ===")
+            try:
+                logged_in = self.session_store.login_driver(driver)
+            except Exception:
+                driver.quit()
+                raise
+            if not logged_in:
+                print("⚠ Could not verify successful login. Continuing anyway...")
+            self.driver = driver
+        return self.driver
+
+    def close_browser(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except WebDriverException:
+                pass
+            self.driver = None
+
+    def run(self):
+        from_stage = STEPS[self.step][0]
+        idle_since = time.monotonic()
+        try:
+            while True:
+                job = self.store.claim(self.step, self.owner, self.args.lease)
+                if job is None:
+                    # Nothing left that can still reach this step, unless new
+                    # jobs are expected from a running scraper
+                    idle = time.monotonic() - idle_since
+                    if not self.store.pending_between(self.first_stage, from_stage) and (not self.args.follow or idle > self.args.follow_timeout):
+                        return
+                    time.sleep(self.args.queue_poll)
+                    continue
+                self.process(job)
+                idle_since = time.monotonic()
+        except Exception as e:
+            print(f"✗ Worker {self.name} stopped: {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            if not self.args.debug:
+                self.close_browser()
+
+    def process(self, job):
+        title = job["title"] or os.path.basename(job["key"])
+        print(f"\n--- [{self.name}] {title} (attempt {job['attempts']}) ---")
+        try:
+            try:
+                record = AnimeRecord.from_data(json.loads(job["data"]))
+                anime_id = getattr(self, f"run_{self.step}")(job, record)
+            except LeaseLost:
+                raise
+            except NeedsManualCheck as e:
+                self.store.park(job, self.owner, str(e))
+                self.failed += 1
+                print(f"✗ [{self.name}] {title}: {e}")
+                return
+            except Exception as e:
+                if isinstance(e, WebDriverException):
+                    # The browser may be gone; the retry starts a new one
+                    self.close_browser()
+                error = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+                retry = self.store.fail(job, self.owner, error)
+                self.failed += 1
+                if retry:
+                    print(f"× [{self.name}] {title}: {error} (will retry)")
+                else:
+                    print(f"✗ [{self.name}] {title}: {error} (giving up after {job['attempts']} attempts)")
+                return
+            self.store.advance(job, self.owner, STEPS[self.step][1], anime_id)
+        except LeaseLost:
+            # The job belongs to another worker now: leave it alone
+            self.lost += 1
+            print(f"⚠ [{self.name}] {title}: lease expired and lost to another worker, step left to it")
+            return
+        self.done += 1
+        print(f"✓ [{self.name}] {title} -> {STEPS[self.step][1]}")
+
+    def keep_lease(self, job):
+        """Renew the lease of job before an action on the site; raises LeaseLost if it is gone"""
+        self.store.renew(job, self.owner, self.args.lease)
+
+    def run_create(self, job, record):
+        # A crash between the submission and advance() leaves the saved ID behind
+        anime_id = load_saved_anime_id(job["key"])
+        if anime_id:
+            print(f"✓ Already created with ID {anime_id}")
+            return anime_id
+        anime_id = find_existing_fiche(self.catalog, job["key"], record)
+        if anime_id:
+            return anime_id
+        # A submission without an ID may still have created the fiche: never
+        # post the form twice, look the fiche up on the site instead
+        if job["submitted_at"]:
+            return self.find_submitted_fiche(job, record)
+
+        # Never submit a fiche for a job another worker may be submitting
+        self.keep_lease(job)
+        self.store.mark_submitted(job, self.owner)
+        if self.form_backend:
+            anime_id = submit_anime_form_http(self.form_backend, job["key"], record)
+        else:
+            anime_id = fill_anime_form(self.browser(), job["key"], submit=True, record=record,
+                                       fill_mode=self.args.fill_mode)
+        if not anime_id:
+            return self.find_submitted_fiche(job, record)
+        if self.catalog is not None:
+            self.catalog.add_record(anime_id, record)
+        return anime_id
+
+    def find_submitted_fiche(self, job, record):
+        """
+        Find the fiche of a job whose form was submitted without giving an ID
+
+        The new fiches of the admin listing are added to the catalog and the
+        record is matched against them.
+
+        Raises:
+            NeedsManualCheck: If the fiche cannot be found
+        """
+        hint = (f"form already submitted but no anime ID; check the site, then save the ID in "
+                f"{anime_id_file_path(job['key'])} or use --retry-failed --resubmit if there is no fiche")
+        if self.catalog is None:
+            raise NeedsManualCheck(hint)
+        print("Form was submitted without an anime ID, looking for the fiche in the admin listing")
+        try:
+            self.catalog.refresh(self.http_backend().get_page)
+        except Exception as e:
+            raise NeedsManualCheck(f"{hint} (listing not read: {e})")
+        anime_id = find_existing_fiche(self.catalog, job["key"], record)
+        if not anime_id:
+            raise NeedsManualCheck(hint)
+        return anime_id
+
+    def http_backend(self):
+        """Logged-in HTTP session for reading admin pages (the form backend's, or one started on first use)"""
+        if self.form_backend is not None:
+            return self.form_backend
+        if self.page_reader is None:
+            backend = HttpFormBackend(self.args.username, self.args.password, rate_limiter=self.rate_limiter)
+            if not self.session_store.login_http(backend):
+                print("⚠ Could not verify successful HTTP login. Continuing anyway...")
+            self.page_reader = backend
+        return self.page_reader
+
+    def run_tags(self, job, record):
+        self.keep_lease(job)
+        if not process_tags(self.browser(), job["anime_id"], record, debug=self.args.debug):
+            raise RuntimeError("tags page did not load")
+
+    def run_staff(self, job, record):
+        def on_added(name, role):
+            self.store.mark_staff_added(job["key"], name, role)
+
+        # Staff entries cannot be reviewed while other workers run. The lease
+        # is renewed before every member: failed members cost their waits too
+        added, failed, unresolved = process_staff(self.browser(), job["anime_id"], record, auto_submit=True,
+                                      staff_id_cache=self.staff_id_cache,
+                                      done=self.store.staff_done(job["key"]), on_added=on_added,
+                                      before_member=lambda name, role: self.keep_lease(job))
+        # Names without a business entry are reported and skipped: a retry
+        # cannot add them. Only the other failures are retried
+        if failed:
+            raise RuntimeError(f"{failed} staff members could not be added")
+        if unresolved:
+            print(f"⚠ [{self.name}] {len(unresolved)} staff members skipped, no business entry: {', '.join(unresolved)}")
+
+
+def run_pipeline(store, args):
+    """
+    Run the workers of every step until no job can progress any more
+
+    Returns:
+        list: The StageWorkers, with their done/failed counts
+    """
+    rate_limiter = RateLimiter(args.max_rps)
+    session_store = SessionStore(args.username, args.password, args.session_file, reuse=not args.fresh_login)
+    form_backend = None
+    if args.backend == 'http':
+        form_backend = HttpFormBackend(args.username, args.password, rate_limiter=rate_limiter)
+        print("=== LOGGING IN (HTTP) ===")
+        if not session_store.login_http(form_backend):
+            print("⚠ Could not verify successful HTTP login. Continuing anyway...")
+    staff_id_cache = None if args.no_staff_cache else StaffIdCache()
+    catalog = None
+    if not args.no_catalog_check and os.path.exists(args.catalog):
+        catalog = AnimeCatalog(args.catalog)
+
+    worker_counts = {"create": args.create_workers, "tags": args.tag_workers, "staff": args.staff_workers}
+    first_stage = next((STEPS[step][0] for step, count in worker_counts.items() if count), "scraped")
+    workers = [
+        StageWorker(step, i + 1, store, args, session_store, form_backend, staff_id_cache, rate_limiter,
+                    first_stage, catalog)
+        for step, count in worker_counts.items() for i in range(count)
+    ]
+    # Daemon threads: on Ctrl-C the leases simply expire and the jobs are resumed later
+    threads = [threading.Thread(target=worker.run, name=f"job-{worker.name}", daemon=True) for worker in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print("\n" + "="*80)
+    print("PIPELINE SUMMARY")
+    print("="*80)
+    for step in STEPS:
+        step_workers = [worker for worker in workers if worker.step == step]
+        if step_workers:
+            print(f"{step:<7} {len(step_workers)} workers: {sum(w.done for w in step_workers)} done, "
+                  f"{sum(w.failed for w in step_workers)} failed attempts, "
+                  f"{sum(w.lost for w in step_workers)} leases lost")
+    print("="*80)
+    store.print_status()
+    ROLE_RESOLVER.print_report()
+    if staff_id_cache:
+        staff_id_cache.print_stats()
+    if form_backend:
+        form_backend.print_stats()
+    if catalog is not None:
+        catalog.print_stats()
+    session_store.print_stats()
+    rate_limiter.print_stats()
+    BROWSER_STATS.print_stats()
+    WAITS.print_report(len(workers))
+    return workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Publish anime through a persistent create -> tags -> staff job queue')
+    parser.add_argument('json_path', nargs='?', help='JSON file, JSONL file or directory of anime to add to the queue')
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help=f'Job database (default: {DEFAULT_DB_PATH})')
+    parser.add_argument('--no-run', action='store_true', help='Only add json_path to the queue')
+    parser.add_argument('--status', action='store_true', help='Print the number of jobs per stage and the failed jobs, then exit')
+    parser.add_argument('--retry-failed', action='store_true', help='Give the failed jobs a new set of attempts')
+    parser.add_argument('--resubmit', action='store_true', help='With --retry-failed: submit the create form again for jobs whose submission gave no ID (only after checking that the fiche does not exist)')
+    parser.add_argument('--release-leases', action='store_true', help='Free the jobs held by a crashed run right away (only when no other runner is active)')
+    parser.add_argument('--username', default="*****", help='Username for login')
+    parser.add_argument('--password', default="*****", help='Password for login')
+    parser.add_argument('--browser-profile', choices=BROWSER_PROFILES, default='lean',
+                        help='lean: block images, media, fonts and third-party hosts, eager page loads; full: load everything (default: lean)')
+    parser.add_argument('--headless', action='store_true', help='Run Chrome without a window')
+    parser.add_argument('--session-file', default=DEFAULT_SESSION_PATH,
+                        help=f'Saved login session shared by every worker and script (default: {DEFAULT_SESSION_PATH})')
+    parser.add_argument('--fresh-login', action='store_true', help='Ignore the saved login session and log in with the form')
+    parser.add_argument('--create-workers', type=int, default=1, help='Workers creating fiches (default: 1)')
+    parser.add_argument('--tag-workers', type=int, default=1, help='Workers selecting genres and themes (default: 1)')
+    parser.add_argument('--staff-workers', type=int, default=1, help='Workers adding staff, always auto-submitted (default: 1)')
+    parser.add_argument('--backend', choices=['selenium', 'http'], default='selenium',
+                        help='How the create workers submit the anime form (default: selenium)')
+    parser.add_argument('--fill-mode', choices=FILL_MODES, default='script',
+                        help='How the Selenium backend fills the form fields (default: script)')
+    parser.add_argument('--catalog', default=DEFAULT_CATALOG_PATH,
+                        help=f'Index of the fiches already on the site; matching anime reuse their fiche (default: {DEFAULT_CATALOG_PATH})')
+    parser.add_argument('--no-catalog-check', action='store_true', help='Create every anime without looking for an existing fiche')
+    parser.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS,
+                        help=f'Attempts of a step before the job is parked as failed (default: {DEFAULT_MAX_ATTEMPTS})')
+    parser.add_argument('--lease', type=float, default=DEFAULT_LEASE,
+                        help=f'Seconds a job stays claimed by a worker without progress (default: {DEFAULT_LEASE})')
+    parser.add_argument('--max-rps', type=float, default=2, help='Cap on admin requests per second for all workers together, 0 for no cap (default: 2)')
+    parser.add_argument('--no-staff-cache', action='store_true', help='Always use the autocomplete instead of the cached business IDs')
+    parser.add_argument('--follow', action='store_true', help='Keep waiting for jobs added by a running scraper (get_all_anime_from_json.py --job-db)')
+    parser.add_argument('--follow-timeout', type=int, default=300, help='Stop following after this many seconds without new jobs (default: 300)')
+    parser.add_argument('--queue-poll', type=float, default=2, help='Seconds between two checks of the queue by an idle worker (default: 2)')
+    parser.add_argument('--poll-interval', type=float, help='Seconds between two checks of a wait condition (default: 0.1)')
+    parser.add_argument('--wait-budget', action='append', default=[], metavar='STEP=SECONDS',
+                        help='Timeout of a wait step, e.g. form_submit=30 (repeatable)')
+    parser.add_argument('--debug', action='store_true', help='Run in debug mode (keep browsers open)')
+    args = parser.parse_args()
+    if min(args.create_workers, args.tag_workers, args.staff_workers) < 0:
+        parser.error("worker counts cannot be negative")
+    if args.resubmit and not args.retry_failed:
+        parser.error("--resubmit only applies with --retry-failed")
+    WAITS.configure(parse_budgets(args.wait_budget), args.poll_interval)
+
+    store = JobStore(args.db, args.max_attempts)
+    try:
+        if args.status:
+            store.print_status()
+            return
+        if args.json_path:
+            added = enqueue_path(store, args.json_path)
+            print(f"✓ {added} new jobs queued in {args.db}")
+        if args.retry_failed:
+            print(f"✓ {store.retry_failed(args.resubmit)} failed jobs queued again")
+        if args.release_leases:
+            print(f"✓ {store.release_leases()} leases released")
+        if args.no_run:
+            store.print_status()
+            return
+        run_pipeline(store, args)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
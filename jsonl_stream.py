@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Single-file JSON Lines output for batch scrape results.
+
+The scraper appends one compact record per line as soon as a title finishes;
+the publishing side can read the file record by record, and optionally follow
+it while the scraper is still writing.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+
+
+class JsonlWriter:
+    def __init__(self, path):
+        """
+        Args:
+            path (str): JSONL file to append to (created if missing)
+        """
+        self.path = path
+        self.records = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write(self, record):
+        """
+        Append one record and make sure it reaches the disk
+
+        The line is written in a single call and fsynced, so a reader never
+        sees a record of this writer split across two reads.
+        """
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.records += 1
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def iter_jsonl_records(path, follow=False, poll_interval=1.0, idle_timeout=300):
+    """
+    Yield the records of a JSONL file one at a time
+
+    Args:
+        path (str): JSONL file written by JsonlWriter
+        follow (bool): Keep waiting for new records, like `tail -f`
+        poll_interval (float): Seconds between checks for new data when following
+        idle_timeout (float): Stop following after this many seconds without a new record
+
+    Yields:
+        dict: One scrape result per line
+    """
+    buffer = ""
+    last_record_time = time.time()
+
+    with open(path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.readline()
+            if chunk:
+                buffer += chunk
+                # Only complete lines are parsed; a partial line waits for the rest
+                if not buffer.endswith("\n"):
+                    continue
+                line, buffer = buffer.strip(), ""
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    print(f"⚠ Skipping malformed line in {path}: {e}")
+                    continue
+                last_record_time = time.time()
+                yield record
+                continue
+
+            if not follow or time.time() - last_record_time > idle_timeout:
+                break
+            time.sleep(poll_interval)
+
+    if buffer.strip():
+        print(f"⚠ Ignoring incomplete last line in {path}")
+
+
+def sanitize_filename(name):
+    """
+    Remove invalid filename characters and replace spaces with underscores.
+    """
+    return re.sub(r'[\\/*?:"<>|]', '', name).replace(' ', '_')
+
+
+def record_file_path(jsonl_path, record):
+    """
+    Path a record would have had as a per-title JSON file next to the JSONL file
+
+    Used by the publishing scripts to name the files derived from a record,
+    such as the saved anime ID.
+    """
+    name = sanitize_filename(record.get("title") or "untitled")
+    return os.path.join(os.path.dirname(jsonl_path) or ".", f"{name}.json")
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Persistent title -> MyAnimeList URL resolution index.
+
+Titles are normalized (casefold, accents and punctuation removed) so that
+re-runs and small spelling variants resolve locally instead of running a new
+MAL search. Words in parentheses are kept: "Titre (Saison 2)" and "Titre
+(Film)" are other MAL entries than "Titre". Manual overrides fix titles for
+which the search picks the wrong entry.
+
+    python mal_title_index.py --set "Kaiju n°8" https://myanimelist.net/anime/52588/Kaijuu_8-gou
+    python mal_title_index.py --list
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+
+from title_keys import title_key
+
+DEFAULT_INDEX_PATH = ".mal_title_index.json"
+
+
+class TitleResolutionIndex:
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self.hits = 0
+        self.override_hits = 0
+        self.searches = 0
+        self._lock = threading.Lock()
+        self.entries, self.overrides = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}, {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # Entries are keyed again from their title: older indexes dropped
+            # the words in parentheses and mixed seasons and films together
+            entries = {title_key(entry["title"]): entry for entry in data.get("entries", {}).values()
+                       if entry.get("title")}
+            return entries, data.get("overrides", {})
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠ Could not read title index {self.path}, starting a new one: {e}")
+            return {}, {}
+
+    def _save(self):
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".title_index_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"entries": self.entries, "overrides": self.overrides}, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠ Could not save title index: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def lookup(self, title):
+        """Return the known MAL URL for a title, or None"""
+        key = title_key(title)
+        with self._lock:
+            if key in self.overrides:
+                self.override_hits += 1
+                return self.overrides[key]
+            entry = self.entries.get(key)
+            if entry:
+                self.hits += 1
+                return entry["url"]
+        return None
+
+    def resolve(self, title, search_func):
+        """
+        Return the MAL URL for a title, searching only when it is not indexed
+
+        Args:
+            title (str): Anime title as given to the scraper
+            search_func (callable): Called with no argument on a miss; returns a URL or None
+
+        Returns:
+            str: MAL URL, or None if the search found nothing
+        """
+        url = self.lookup(title)
+        if url:
+            print(f"✓ MAL URL for '{title}' found in title index")
+            return url
+
+        with self._lock:
+            self.searches += 1
+        url = search_func()
+        if url:
+            self.add(title, url)
+        return url
+
+    def add(self, title, url):
+        key = title_key(title)
+        if not key:
+            return
+        with self._lock:
+            self.entries[key] = {"url": url, "title": title, "resolved_at": time.time()}
+            self._save()
+
+    def set_override(self, title, url):
+        with self._lock:
+            self.overrides[title_key(title)] = url
+            self._save()
+
+    def remove(self, title):
+        """Forget a title (both its indexed entry and its override)"""
+        key = title_key(title)
+        with self._lock:
+            removed = self.entries.pop(key, None) is not None
+            removed = self.overrides.pop(key, None) is not None or removed
+            if removed:
+                self._save()
+        return removed
+
+    def print_stats(self):
+        lookups = self.hits + self.override_hits + self.searches
+        print(f"Title index: {self.hits + self.override_hits}/{lookups} titles resolved locally "
+              f"({self.override_hits} overrides), {self.searches} MAL searches run, "
+              f"{self.hits + self.override_hits} searches saved")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the title -> MyAnimeList URL index")
+    parser.add_argument("--index", default=DEFAULT_INDEX_PATH, help=f"Index file (default: {DEFAULT_INDEX_PATH})")
+    parser.add_argument("--set", nargs=2, metavar=("TITLE", "URL"), help="Force TITLE to resolve to URL")
+    parser.add_argument("--remove", metavar="TITLE", help="Forget TITLE so that it is searched again")
+    parser.add_argument("--list", action="store_true", help="List overrides and indexed titles")
+    args = parser.parse_args()
+
+    index = TitleResolutionIndex(args.index)
+
+    if args.set:
+        index.set_override(*args.set)
+        print(f"✓ '{args.set[0]}' now resolves to {args.set[1]}")
+    if args.remove:
+        if index.remove(args.remove):
+            print(f"✓ Removed '{args.remove}'")
+        else:
+            print(f"× '{args.remove}' is not in the index")
+    if args.list:
+        for key, url in sorted(index.overrides.items()):
+            print(f"[override] {key} -> {url}")
+        for key, entry in sorted(index.entries.items()):
+            print(f"{key} -> {entry['url']}")
+        print(f"\n{len(index.overrides)} overrides, {len(index.entries)} indexed titles")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Table-driven merge of the per-source scrape results.
+
+Every merged field is described by a FieldRule: where its value comes from in
+each source, whether the first available source wins ("prefer") or all sources
+are combined, and how combined values are filtered and de-duplicated. Merging
+a record walks each source dict a single time. Combined lists keep first-seen
+order, with sources visited in priority order, so the output is deterministic.
+
+Adding a source means adding its entries to the rules and its name to the
+priority list; no new branching is needed.
+"""
+
+import re
+
+SOURCE_PRIORITY = ("nautiljon", "myanimelist")
+
+# Domains that are never used as the official website
+SOCIAL_MEDIA_DOMAINS = (
+    'twitter.com',
+    'x.com',
+    'facebook.com',
+    'instagram.com',
+    'youtube.com',
+    'tiktok.com',
+    'weibo.com',
+    'linkedin.com',
+    'discord.gg',
+    'discord.com'
+)
+SOCIAL_MEDIA_PATTERN = re.compile("|".join(re.escape(domain) for domain in SOCIAL_MEDIA_DOMAINS))
+
+
+def is_social_media_url(url):
+    """Check if a URL is from a social media platform"""
+    if not url:
+        return False
+    # Lowercasing first is faster than a case-insensitive pattern
+    return SOCIAL_MEDIA_PATTERN.search(url.lower()) is not None
+
+
+def not_social_media(url):
+    """Filter for official websites that reports the URLs it drops"""
+    if is_social_media_url(url):
+        print(f"Excluding social media URL: {url}")
+        return False
+    return True
+
+
+# Value extractors: turn a raw source value into the merged value (prefer) or
+# into the list of values to combine (combine)
+def same(value):
+    return value
+
+
+def one(value):
+    return [value]
+
+
+def non_empty(values):
+    return [value for value in values if value]
+
+
+def comma_separated(value):
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+class FieldRule:
+    """
+    Args:
+        target (str or tuple): Merged key, or (key, sub_key) for nested dicts
+        sources (list): (source name, source key, extractor) in priority order
+        combine (bool): Combine all sources instead of keeping the first one
+        filter (callable, optional): combine only; values returning False are dropped
+        dedup_key (callable, optional): combine only; key used to drop duplicates
+        accept (dict, optional): prefer only; source name -> predicate, raw values
+                                 of that source returning False are skipped
+        skip_if (tuple, optional): Target of another rule; this field is left
+                                   out when that field has a value
+    """
+    __slots__ = ("target", "sources", "combine", "filter", "dedup_key", "accept", "skip_if")
+
+    def __init__(self, target, sources, combine=False, filter=None, dedup_key=None, accept=None, skip_if=None):
+        self.target = target if isinstance(target, tuple) else (target,)
+        self.sources = sources
+        self.combine = combine
+        self.filter = filter
+        self.dedup_key = dedup_key
+        self.accept = accept
+        self.skip_if = skip_if
+
+
+# Merged record template; every key is present even when no source has it
+MERGED_TEMPLATE = (
+    ("title", str),
+    ("alternative_titles", list),
+    ("synopsis", str),
+    ("genres", list),
+    ("themes", list),
+    ("studios", list),
+    ("staff", list),
+    ("episodes", list),
+    ("airing_info", dict),
+    ("streaming", list),
+    ("official_websites", list),
+    ("scores", dict),
+    ("source_urls", dict),
+)
+
+# Nautiljon takes priority over MyAnimeList everywhere
+MERGE_RULES = (
+    FieldRule(("source_urls", "nautiljon"), [("nautiljon", "url", same)]),
+    FieldRule(("source_urls", "myanimelist"), [("myanimelist", "url", same)]),
+    FieldRule("title", [("nautiljon", "title", same), ("myanimelist", "title", same)]),
+    FieldRule("alternative_titles", [("nautiljon", "alternative_titles", non_empty),
+                                     ("myanimelist", "alt_titles", comma_separated)], combine=True),
+    FieldRule("synopsis", [("nautiljon", "synopsis", same), ("myanimelist", "synopsis", same)],
+              accept={"myanimelist": lambda synopsis: synopsis != "No synopsis available"}),
+    FieldRule("genres", [("nautiljon", "genres", same), ("myanimelist", "genres", same)], combine=True),
+    FieldRule("themes", [("nautiljon", "themes", same), ("myanimelist", "themes", same)], combine=True),
+    FieldRule("studios", [("nautiljon", "studio", one), ("myanimelist", "studios", same)], combine=True),
+    FieldRule("staff", [("nautiljon", "staff", same), ("myanimelist", "staff", same)]),
+    FieldRule("episodes", [("nautiljon", "episodes", same)]),
+    FieldRule("episode_count", [("nautiljon", "episodes_count", same), ("myanimelist", "episodes", same)]),
+    FieldRule(("airing_info", "dates"), [("nautiljon", "airing_dates", same)]),
+    FieldRule(("airing_info", "season"), [("nautiljon", "season", same), ("myanimelist", "season", same)]),
+    FieldRule(("airing_info", "status"), [("myanimelist", "status", same)]),
+    FieldRule(("airing_info", "aired"), [("myanimelist", "aired", same)], skip_if=("airing_info", "dates")),
+    FieldRule("streaming", [("nautiljon", "streaming", same)]),
+    FieldRule("official_websites", [("nautiljon", "official_website", non_empty),
+                                    ("myanimelist", "official_site", one)],
+              combine=True, filter=not_social_media),
+    FieldRule(("scores", "nautiljon_popularity"), [("nautiljon", "popularity", same)]),
+    FieldRule(("scores", "nautiljon_trend"), [("nautiljon", "trend", same)]),
+    FieldRule(("scores", "myanimelist"), [("myanimelist", "score", same)]),
+    FieldRule(("scores", "mal_rank"), [("myanimelist", "rank", same)]),
+    FieldRule(("scores", "mal_popularity"), [("myanimelist", "popularity", same)]),
+)
+
+
+def unique(values, key=None):
+    """Drop duplicates, keeping the first occurrence of each value in order"""
+    if key is None:
+        return list(dict.fromkeys(values))
+    seen = {}
+    for value in values:
+        seen.setdefault(key(value), value)
+    return list(seen.values())
+
+
+class MergeEngine:
+    """
+    Merges the per-source results with a rule table.
+
+    The table is arranged once by source: merging a record visits each source
+    dict a single time, in priority order, and applies the rule entries that
+    read from it. A "prefer" field keeps the first value found, and combined
+    fields are de-duplicated once at the end instead of value by value.
+    """
+
+    def __init__(self, rules=MERGE_RULES, source_priority=SOURCE_PRIORITY, template=MERGED_TEMPLATE):
+        self.rules = rules
+        self.source_priority = source_priority
+        self.template = template
+
+        # Source name -> [(rule index, rule, source key, extractor, accept)]
+        self._entries = []
+        for source_name in source_priority:
+            entries = [(index, rule, key, extractor, rule.accept.get(source_name) if rule.accept else None)
+                       for index, rule in enumerate(rules)
+                       for rule_source, key, extractor in rule.sources if rule_source == source_name]
+            self._entries.append((source_name, entries))
+
+        self._skip_index = {index: self._target_index(rule.skip_if)
+                            for index, rule in enumerate(rules) if rule.skip_if is not None}
+        # Template key -> (rules filling it as a nested dict, rule filling it directly)
+        self._layout = []
+        for key, factory in template:
+            nested = [index for index, rule in enumerate(rules) if rule.target[0] == key and len(rule.target) > 1]
+            direct = [index for index, rule in enumerate(rules) if rule.target == (key,)]
+            self._layout.append((key, factory, nested, direct[0] if direct else None))
+        template_keys = {key for key, _ in template}
+        self._extra = [index for index, rule in enumerate(rules) if rule.target[0] not in template_keys]
+
+    def merge(self, sources):
+        """
+        Merge per-source results
+
+        Args:
+            sources (dict): Source name -> scraped dict
+
+        Returns:
+            dict: Merged record, with every template key
+        """
+        values = [[] if rule.combine else None for rule in self.rules]
+        for source_name, entries in self._entries:
+            data = sources.get(source_name)
+            if not data:
+                continue
+            for index, rule, key, extractor, accept in entries:
+                raw = data.get(key)
+                if not raw:
+                    continue
+                if rule.combine:
+                    items = extractor(raw)
+                    if rule.filter is not None:
+                        items = [item for item in items if rule.filter(item)]
+                    values[index] += items
+                elif values[index] is None and (accept is None or accept(raw)):
+                    values[index] = raw
+
+        merged = {}
+        for key, factory, nested, direct in self._layout:
+            if nested:
+                merged[key] = {}
+                for index in nested:
+                    if self._has_value(index, values):
+                        merged[key][self.rules[index].target[1]] = self._result(index, values)
+            elif direct is not None and self._has_value(direct, values):
+                merged[key] = self._result(direct, values)
+            elif direct is not None and self.rules[direct].combine and direct not in self._skip_index:
+                merged[key] = []
+            else:
+                merged[key] = factory()
+
+        for index in self._extra:
+            if self._has_value(index, values):
+                target = self.rules[index].target
+                if len(target) == 1:
+                    merged[target[0]] = self._result(index, values)
+                else:
+                    merged.setdefault(target[0], {})[target[1]] = self._result(index, values)
+        return merged
+
+    def _has_value(self, index, values):
+        value = values[index]
+        has_value = bool(value) if self.rules[index].combine else value is not None
+        if has_value and index in self._skip_index:
+            return values[self._skip_index[index]] is None
+        return has_value
+
+    def _result(self, index, values):
+        rule = self.rules[index]
+        if not rule.combine:
+            return values[index]
+        return unique(values[index], rule.dedup_key)
+
+    def _target_index(self, target):
+        for index, rule in enumerate(self.rules):
+            if rule.target == target:
+                return index
+        raise ValueError(f"No merge rule targets {target}")
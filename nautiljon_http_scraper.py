@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Browser-less Nautiljon scraper.
+
+Nautiljon renders the information block of an anime page on the server, so
+most pages can be scraped with a plain HTTP request and an HTML parser. The
+result has the same shape as nautiljon_scraper.scrape_nautiljon_with_selenium
+so it can be fed directly to CombinedAnimeScraper._merge_info. Pages that are
+missing required fields are handed to the Selenium scraper instead.
+"""
+
+import argparse
+import copy
+import json
+import re
+import sys
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/124.0 Safari/537.36")
+
+# Fields that must be present for an HTTP result to be trusted
+REQUIRED_FIELDS = ("title", "genres", "studio")
+
+# Labels of the information list ("<span class="bold">Label : </span>value")
+INFO_LABELS = {
+    "titre original": "original_title",
+    "titre alternatif": "alternative_titles",
+    "titres alternatifs": "alternative_titles",
+    "genres": "genres",
+    "genre": "genres",
+    "thèmes": "themes",
+    "thème": "themes",
+    "nb épisodes": "episodes_count",
+    "nombre d'épisodes": "episodes_count",
+    "studio d'animation": "studio",
+    "studios d'animation": "studio",
+    "site officiel": "official_website",
+    "sites officiels": "official_website",
+    "simulcast / streaming": "streaming",
+    "streaming": "streaming",
+    "date de début": "airing_dates",
+    "diffusion": "airing_dates",
+    "saison": "season",
+    "popularité": "popularity",
+    "tendance": "trend",
+}
+
+# Labels that are neither information fields nor staff roles
+IGNORED_LABELS = {
+    "pays d'origine", "type", "âge conseillé", "chaîne de diffusion",
+    "chaînes de diffusion", "date de fin", "durée d'un épisode", "public visé",
+    "éditeur", "éditeurs", "licencié", "adaptations", "source",
+}
+
+
+def create_session(pool_size=4):
+    """
+    Create a requests session with a keep-alive connection pool
+
+    Args:
+        pool_size (int): Number of pooled connections per host
+
+    Returns:
+        requests.Session: Session shared by every page fetch of a scraper
+    """
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept-Language": "fr-FR,fr;q=0.9,en;q=0.8",
+    })
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=2)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _clean_text(text):
+    return re.sub(r"\s+", " ", text or "").strip()
+
+
+def _link_texts(value_node):
+    links = [_clean_text(a.get_text()) for a in value_node.find_all("a")]
+    return [link for link in links if link]
+
+
+def _split_values(value_node):
+    """
+    Return the values listed after a label: link texts when there are links,
+    otherwise the text split on the separators Nautiljon uses
+    """
+    links = _link_texts(value_node)
+    if links:
+        return links
+    text = _clean_text(value_node.get_text())
+    return [part.strip() for part in re.split(r"\s+/\s+|\s+-\s+|,\s*", text) if part.strip()]
+
+
+def _split_titles(value_node):
+    """
+    Like _split_values, but titles contain commas and dashes ("Re:Zero -
+    Starting Life in Another World"), so only " / " and line breaks separate them
+    """
+    links = _link_texts(value_node)
+    if links:
+        return links
+    titles = []
+    for line in value_node.get_text("\n").splitlines():
+        titles.extend(_clean_text(part) for part in re.split(r"\s+/\s+", line) if part.strip())
+    return titles
+
+
+def _label_and_value(li):
+    """
+    Split an information list item into its label and a node holding the value
+
+    Returns:
+        tuple: (label, BeautifulSoup node) or (None, None)
+    """
+    label_span = li.find("span", class_="bold")
+    if not label_span:
+        return None, None
+    label = _clean_text(label_span.get_text()).rstrip(":").strip().lower()
+
+    # Work on a copy so that removing the label does not alter the page tree
+    value_node = copy.copy(li)
+    value_node.find("span", class_="bold").decompose()
+    return label, value_node
+
+
+def parse_anime_page(html, url=""):
+    """
+    Parse a Nautiljon anime page
+
+    Args:
+        html (str): Page source
+        url (str): URL of the page, copied into the result
+
+    Returns:
+        dict: Anime information in the Selenium scraper's format
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    info = {
+        "title": "",
+        "url": url,
+        "original_title": "",
+        "alternative_titles": [],
+        "synopsis": "",
+        "genres": [],
+        "themes": [],
+        "studio": "",
+        "staff": [],
+        "episodes_count": "",
+        "airing_dates": "",
+        "season": "",
+        "streaming": [],
+        "official_website": [],
+    }
+
+    title_node = soup.select_one("h1.h1titre span[itemprop='name']") or soup.select_one("h1.h1titre") or soup.find("h1")
+    if title_node:
+        info["title"] = _clean_text(title_node.get_text())
+
+    synopsis_node = soup.select_one("[itemprop='description']") or soup.select_one("div.description")
+    if synopsis_node:
+        info["synopsis"] = _clean_text(synopsis_node.get_text())
+
+    for li in soup.select("ul.mb10 li, div.infos_list li"):
+        label, value_node = _label_and_value(li)
+        if not label or label in IGNORED_LABELS:
+            continue
+
+        field = INFO_LABELS.get(label)
+        if field in ("genres", "themes", "streaming", "alternative_titles"):
+            values = _split_titles(value_node) if field == "alternative_titles" else _split_values(value_node)
+            info[field].extend(value for value in values if value not in info[field])
+        elif field == "official_website":
+            for a in value_node.find_all("a", href=True):
+                if a["href"].startswith("http") and a["href"] not in info["official_website"]:
+                    info["official_website"].append(a["href"])
+        elif field == "studio":
+            studios = _split_values(value_node)
+            info["studio"] = studios[0] if studios else ""
+        elif field == "episodes_count":
+            match = re.search(r"\d+", value_node.get_text())
+            info["episodes_count"] = match.group(0) if match else ""
+        elif field:
+            info[field] = _clean_text(value_node.get_text())
+        else:
+            # Any other labelled row linking to people is a staff role
+            role = _clean_text(li.find("span", class_="bold").get_text()).rstrip(":").strip()
+            people = [a for a in value_node.find_all("a", href=True) if "/people/" in a["href"]]
+            for person in people:
+                name = _clean_text(person.get_text())
+                if name:
+                    info["staff"].append({"name": name, "role": role})
+
+    return info
+
+
+def missing_fields(info, required_fields=REQUIRED_FIELDS):
+    """Return the required fields that are empty in a parsed page"""
+    return [field for field in required_fields if not info.get(field)]
+
+
+class NautiljonHttpScraper:
+    def __init__(self, session=None, timeout=15, required_fields=REQUIRED_FIELDS, selenium_fallback=None):
+        """
+        Args:
+            session (requests.Session, optional): Pooled session, created if not given
+            timeout (float): Request timeout in seconds
+            required_fields (tuple): Fields whose absence triggers the fallback
+            selenium_fallback (callable, optional): Called with the URL when the
+                HTTP result is incomplete; must return the same dict shape
+        """
+        self.session = session or create_session()
+        self.timeout = timeout
+        self.required_fields = required_fields
+        self.selenium_fallback = selenium_fallback
+        self.http_pages = 0
+        self.fallbacks = 0
+
+    def fetch(self, url):
+        """Download a page and return its HTML"""
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        response.encoding = response.encoding or "utf-8"
+        return response.text
+
+    def scrape(self, url):
+        """
+        Scrape an anime page over HTTP, falling back to Selenium if needed
+
+        Args:
+            url (str): Nautiljon anime page URL
+
+        Returns:
+            dict: Anime information, or None on failure
+        """
+        info = None
+        try:
+            info = parse_anime_page(self.fetch(url), url)
+            missing = missing_fields(info, self.required_fields)
+        except requests.RequestException as e:
+            print(f"× HTTP fetch failed for {url}: {e}")
+            missing = list(self.required_fields)
+
+        if not missing:
+            self.http_pages += 1
+            print("✓ Scraped Nautiljon page without a browser")
+            return info
+
+        if self.selenium_fallback is None:
+            print(f"⚠ Missing fields {missing} and no Selenium fallback configured")
+            return info if info and info.get("title") else None
+
+        print(f"⚠ Missing fields {missing}, falling back to Selenium")
+        self.fallbacks += 1
+        return self.selenium_fallback(url)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape a Nautiljon anime page without a browser")
+    parser.add_argument("source", help="Nautiljon URL or path to a saved page")
+    args = parser.parse_args()
+
+    if args.source.startswith("http"):
+        info = NautiljonHttpScraper().scrape(args.source)
+    else:
+        with open(args.source, 'r', encoding='utf-8') as f:
+            info = parse_anime_page(f.read(), args.source)
+
+    if not info:
+        print("× Failed to scrape page")
+        sys.exit(1)
+    print(json.dumps(info, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Global cap on the requests sent to the site's admin.
+
+One RateLimiter is shared by every publishing session of a run. Browser
+sessions are wrapped in an EventFiringWebDriver whose listener takes a slot
+before each navigation and click (the actions that reach the server), and
+the HTTP form backend takes a slot before each request. Slots are spaced
+1/rate seconds apart across all sessions, however many there are; the time
+spent waiting for a slot shows up as "rate_limit" in the wait report.
+"""
+
+import threading
+import time
+
+from selenium.webdriver.support.abstract_event_listener import AbstractEventListener
+from selenium.webdriver.support.event_firing_webdriver import EventFiringWebDriver
+
+from wait_engine import WAITS
+
+
+class RateLimiter:
+    def __init__(self, rate=None):
+        """
+        Args:
+            rate (float, optional): Requests per second for all sessions together;
+                                    None or 0 for no limit
+        """
+        self.rate = rate
+        self.interval = 1.0 / rate if rate else 0.0
+        self.requests = 0
+        self.delayed = 0
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the next request slot"""
+        with self._lock:
+            self.requests += 1
+            if not self.interval:
+                return
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            with self._lock:
+                self.delayed += 1
+            WAITS.sleep("rate_limit", delay)
+
+    def print_stats(self):
+        limit = f"{self.rate:g} requests/second" if self.rate else "no limit"
+        print(f"Admin requests: {self.requests} ({limit}, {self.delayed} delayed)")
+
+
+class RateLimitListener(AbstractEventListener):
+    """Takes a RateLimiter slot before each navigation and click of a driver"""
+
+    def __init__(self, limiter):
+        self.limiter = limiter
+
+    def before_navigate_to(self, url, driver):
+        self.limiter.acquire()
+
+    def before_navigate_back(self, driver):
+        self.limiter.acquire()
+
+    def before_navigate_forward(self, driver):
+        self.limiter.acquire()
+
+    def before_click(self, element, driver):
+        self.limiter.acquire()
+
+
+def rate_limited_driver(driver, limiter):
+    """Wrap a WebDriver so that its navigations and clicks go through limiter"""
+    return EventFiringWebDriver(driver, RateLimitListener(limiter))
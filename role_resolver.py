@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Role resolution for staff entries.
+
+Scraped roles come in many spellings ("Character design", "Chara-Design",
+"Directeur de la photographie"...). RoleResolver maps them to the role labels
+of the site using a precomputed index of ROLE_MAPPING keys and labels:
+
+    1. exact match on ROLE_MAPPING
+    2. match on the normalized form (casefold, accents, punctuation and
+       whitespace folded)
+    3. token-set fuzzy match above a confidence threshold
+
+Results are memoized and roles that could not be resolved are reported, so
+new variants can be added to ROLE_MAPPING.
+"""
+
+import threading
+import unicodedata
+from difflib import SequenceMatcher
+
+# Role mapping dictionary: maps roles from JSON to roles in the form
+ROLE_MAPPING = {
+    # Director/Réalisateur roles
+    "Director": "Réalisation",
+    "Réalisateur": "Réalisation",
+    "Chief Director": "Directeur exécutif",
+    "Assistant Director": "Assistance à la réalisation",
+    "Episode Director": "Directeur d'épisode",
+    "Series Director": "Supervision",
+    
+    # Producer/Production roles
+    "Producer": "Producteur (staff)",
+    "Production": "Production",
+    "Executive Producer": "Producteur délégué",
+    "Line Producer": "Producteur exécutif",
+    "Production Manager": "Production manager",
+    
+    # Animation roles
+    "Animation": "Animation",
+    "Key Animation": "Animation clé",
+    "Animateur clé": "Animation clé",
+    "Chef animateur": "Chef animateur",
+    "Chief animator": "Chef animateur",
+    "Animation Director": "Directeur de l'animation",
+    "In-Between Animation": "Intervaliste",
+    "CGI Director": "Réalisateur 3D",
+    "3D Director": "Réalisateur 3D",
+    "CG Director": "Réalisateur 3D",
+    "CGI": "CGI",
+    "Animation CGI": "Animation CGI",
+    "3D Animation": "Animation CGI",
+    
+    # Design roles
+    "Character Design": "Chara-design",
+    "Character designer": "Chara-design",
+    "Chara-Design": "Chara-design",
+    "Original Character Design": "Chara-design original",
+    "Original character designer": "Chara-design original",
+    "Art Design": "Art design",
+    "Design Work": "Design work",
+    "Mecha Design": "Mecha-design",
+    "Monster Design": "Monster-design",
+    "Prop Design": "Prop-design",
+    "Set Design": "Set design",
+    "Scene Design": "Scene-design",
+    "Background": "Décors",
+    "Décors": "Décors",
+    "Chargé des décors": "Décors",
+    "Layout": "Layout",
+    "Color Design": "Couleurs",
+    "Couleurs": "Couleurs",
+    "Color design": "Couleurs",
+    "Colors": "Couleurs",
+    "Title Design": "Title Design",
+    
+    # Sound/Music roles
+    "Sound Director": "Directeur du son",
+    "Directeur du son": "Directeur du son",
+    "Music": "Musique",
+    "Musique": "Musique",
+    "Composer": "Musique",
+    "Sound Production": "Production du son",
+    "Music Production": "Production de la musique",
+    
+    # Story roles
+    "Original creator": "Auteur",
+    "Créateur original": "Créateur original",
+    "Original Work": "Auteur",
+    "Scenario": "Scénario",
+    "Scénariste": "Scénario",
+    "Screenplay": "Scénario",
+    "Script": "Script",
+    "Series Composition": "Composition de la série",
+    "Story": "Scénario",
+    "Original Story": "Idée originale",
+    "Concept original": "Idée originale",
+    "Original Concept": "Idée originale",
+    "Planning": "Planning",
+    "Storyboard": "Storyboard",
+    
+    # Technical roles
+    "Art Director": "Directeur artistique",
+    "Directeur artistique": "Directeur artistique",
+    "Photography Director": "Directeur de la photographie",
+    "Directeur de la photo": "Directeur de la photographie",
+    "FX Production": "Effets spéciaux",
+    "VFX Supervisor": "Effets spéciaux",
+    "FX": "Effets spéciaux",
+    "Special Effects": "Effets spéciaux",
+    "Effets spéciaux": "Effets spéciaux",
+    "Editing": "Montage",
+    "Montage": "Montage",
+    "Editor": "Montage",
+    
+    # Studio roles
+    "Studio": "Studio d'animation",
+    "Animation Studio": "Studio d'animation",
+    "Animation Production": "Studio d'animation",
+    "Animation Assistance": "Studio d'animation (sous-traitance)",
+    
+    # Other roles
+    "Supervision": "Supervision",
+    "Illustrations originales": "Illustrations originales",
+    "Original Arts": "Illustrations originales",
+    "Original Illustrations": "Illustrations originales",
+    "Distribution": "Distribution",
+    "Broadcaster": "Diffuseur",
+    "Diffuseur": "Diffuseur",
+    "Motion Design": "Motion Design"
+}
+
+# Words ignored when comparing roles token by token
+STOPWORDS = {"de", "la", "le", "les", "du", "des", "d", "l", "of", "the", "and", "et"}
+
+DEFAULT_THRESHOLD = 0.85
+
+
+def normalize_role(role):
+    """
+    Normalize a role for lookups
+
+    "Chara-Design", "chara design" and "CHARA DESIGN " all become "chara design".
+    """
+    if not role:
+        return ""
+    role = unicodedata.normalize("NFKD", role)
+    role = "".join(char for char in role if not unicodedata.combining(char)).casefold()
+    role = "".join(char if char.isalnum() else " " for char in role)
+    return " ".join(role.split())
+
+
+def role_tokens(normalized_role):
+    return frozenset(token for token in normalized_role.split() if token not in STOPWORDS)
+
+
+def _tokens_match(token, other):
+    if token == other:
+        return True
+    # Tolerate small spelling variants ("designer" / "design", "colour" / "color")
+    return SequenceMatcher(None, token, other).ratio() >= 0.8
+
+
+def token_set_similarity(tokens, other_tokens):
+    """
+    Dice coefficient of two token sets, counting near-identical tokens as equal
+
+    Returns:
+        float: 1.0 for the same words in any order, 0.0 for nothing in common
+    """
+    if not tokens or not other_tokens:
+        return 0.0
+    unmatched = set(other_tokens)
+    matched = 0
+    for token in tokens:
+        for other in unmatched:
+            if _tokens_match(token, other):
+                unmatched.discard(other)
+                matched += 1
+                break
+    return 2 * matched / (len(tokens) + len(other_tokens))
+
+
+class RoleResolver:
+    def __init__(self, mapping=ROLE_MAPPING, threshold=DEFAULT_THRESHOLD):
+        """
+        Args:
+            mapping (dict): Scraped role -> site role label
+            threshold (float): Minimum token-set similarity of a fuzzy match
+        """
+        self.mapping = mapping
+        self.threshold = threshold
+
+        # Normalized role -> label, for the mapping keys and the labels themselves
+        self.index = {}
+        for label in mapping.values():
+            self.index.setdefault(normalize_role(label), label)
+        for role, label in mapping.items():
+            self.index[normalize_role(role)] = label
+        self._candidates = [(role_tokens(key), label) for key, label in self.index.items()]
+
+        self._memo = {}
+        self._lock = threading.Lock()
+        self.fuzzy_matches = {}
+        self.unresolved = {}
+
+    def resolve(self, role):
+        """
+        Return the site role label for a scraped role
+
+        Returns:
+            str: The label, or the stripped role itself when it cannot be resolved
+        """
+        role = role.strip()
+        memoized = self._memo.get(role)
+        if memoized is None:
+            label, how = self._resolve(role)
+            memoized = self._memo[role] = (label, how is not None)
+            if how == "fuzzy":
+                with self._lock:
+                    self.fuzzy_matches[role] = label
+
+        label, resolved = memoized
+        if not resolved:
+            with self._lock:
+                self.unresolved[role] = self.unresolved.get(role, 0) + 1
+        return label
+
+    def _resolve(self, role):
+        if role in self.mapping:
+            return self.mapping[role], "exact"
+
+        key = normalize_role(role)
+        if key in self.index:
+            return self.index[key], "normalized"
+
+        tokens = role_tokens(key)
+        best_label, best_score, tied = None, 0.0, False
+        for candidate_tokens, label in self._candidates:
+            score = token_set_similarity(tokens, candidate_tokens)
+            if score > best_score:
+                best_label, best_score, tied = label, score, False
+            elif score == best_score and label != best_label:
+                tied = True
+
+        # An ambiguous match is worse than leaving the role as scraped
+        if best_score >= self.threshold and not tied:
+            return best_label, "fuzzy"
+        return role, None
+
+    def print_report(self):
+        if self.fuzzy_matches:
+            print(f"Roles matched approximately ({len(self.fuzzy_matches)}):")
+            for role, label in sorted(self.fuzzy_matches.items()):
+                print(f"  ~ {role} -> {label}")
+        if self.unresolved:
+            print(f"⚠ Unresolved roles ({len(self.unresolved)}), sent to the site as scraped:")
+            for role, count in sorted(self.unresolved.items(), key=lambda item: -item[1]):
+                print(f"  × {role} ({count}x)")
+
+
+# Shared by every script of the process
+ROLE_RESOLVER = RoleResolver()
+
+
+def resolve_role(role):
+    return ROLE_RESOLVER.resolve(role)
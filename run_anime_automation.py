@@ -8,60 +8,36 @@ import subprocess
 import sys
 import argparse
 import os
-import time
 import glob
-from selenium import webdriver
+import threading
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import json
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from jsonl_stream import iter_jsonl_records, record_file_path
+from anime_record import AnimeRecord, load_anime_record
+from role_resolver import ROLE_RESOLVER
+from staff_id_cache import StaffIdCache
+from staff_prefetch import StaffIdTable, collect_staff_names
+from wait_engine import WAITS, document_ready, parse_budgets
+from anime_form_http import HttpFormBackend, build_form_values
+from form_fill import FILL_MODES, fill_form
+from rate_limiter import RateLimiter
+from browser_profile import BROWSER_PROFILES, BROWSER_STATS, create_browser
+from catalog_index import DEFAULT_CATALOG_PATH, AnimeCatalog, describe_match
+from session_store import DEFAULT_SESSION_PATH, SessionStore
 
-def load_json_data(file_path):
-    """Load JSON data from file"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return json.load(file)
-    except Exception as e:
-        print(f"Error loading JSON data: {e}")
-        return None
-
-def login_to_site(driver, username, password):
-    """Handle login to the site"""
-    try:
-        driver.get("http://www.anime-kun.net/")
-        print("Navigated to the main site")
-        
-        wait = WebDriverWait(driver, 10)
-        username_field = wait.until(EC.presence_of_element_located((By.ID, "user")))
-        
-        username_field.send_keys(username)
-        password_field = driver.find_element(By.ID, "passwrd")
-        password_field.send_keys(password)
-        print("Entered login credentials")
-        
-        submit_button = driver.find_element(By.ID, "llsubmit")
-        submit_button.click()
-        print("Submitted login form")
-        
-        time.sleep(3)
-        
-        if "forums" in driver.current_url:
-            print("✓ Successfully logged in")
-            return True
-        else:
-            print("⚠ Login might have failed")
-            return False
+def fill_anime_form(driver, json_file_path, wait_time=30, submit=True, record=None, fill_mode="script"):
+    """
+    Fill the anime form from an AnimeRecord (loaded from json_file_path if not given)
     
-    except Exception as e:
-        print(f"✗ Error during login: {e}")
-        return False
-
-def fill_anime_form(driver, json_file_path, wait_time=30, submit=True):
-    """Fill the anime form using the existing form filling logic"""
+    fill_mode is "script" (all fields in one execute_script call) or "type" (send_keys)
+    """
     print(f"\n=== FILLING FORM FOR: {os.path.basename(json_file_path)} ===")
     
-    anime_data = load_json_data(json_file_path)
-    if not anime_data:
+    if record is None:
+        record = load_anime_record(json_file_path)
+    if not record:
         print(f"Failed to load JSON data from {json_file_path}")
         return None
     
@@ -71,106 +47,24 @@ def fill_anime_form(driver, json_file_path, wait_time=30, submit=True):
         print("Navigated to the anime addition page")
         
         # Wait for the form to load
-        wait = WebDriverWait(driver, 10)
-        wait.until(EC.presence_of_element_located((By.ID, "informations_principales")))
+        WAITS.until(driver, "page_load", EC.presence_of_element_located((By.ID, "informations_principales")))
         print("Form loaded successfully")
         
-        # Fill in the main title
-        title_field = driver.find_element(By.ID, "titre")
-        title_field.clear()
-        title_field.send_keys(anime_data["title"])
-        print("✓ Title filled:", anime_data["title"])
-        
-        # Select the format (assuming it's a TV series)
-        from selenium.webdriver.support.ui import Select
-        format_select = Select(driver.find_element(By.ID, "format"))
-        format_select.select_by_value("Série TV")
+        # Fill every field (one script call in script mode, typing otherwise)
+        values = build_form_values(record)
+        fill_form(driver, values, fill_mode)
+        print("✓ Title filled:", record.title)
         print("✓ Format selected: Série TV")
-        
-        # Fill in the year
-        year_field = driver.find_element(By.ID, "annee")
-        year_field.clear()
-        year_field.send_keys("2025")
         print("✓ Year field filled: 2025")
-        
-        # Fill in the original title
-        original_title_field = driver.find_element(By.ID, "titre_orig")
-        original_title_field.clear()
-        original_title_field.send_keys(anime_data["title"])
-        print("✓ Original title field filled:", anime_data["title"])
-        
-        # Fill in alternative titles
-        alt_titles_text = ""
-        
-        if "sources" in anime_data:
-            if "nautiljon" in anime_data["sources"] and "alternative_titles" in anime_data["sources"]["nautiljon"]:
-                nautiljon_alt_titles = anime_data["sources"]["nautiljon"]["alternative_titles"]
-                if nautiljon_alt_titles and len(nautiljon_alt_titles) > 0:
-                    alt_titles_text = "\n".join(nautiljon_alt_titles)
-            elif "myanimelist" in anime_data["sources"] and "alt_titles" in anime_data["sources"]["myanimelist"]:
-                mal_alt_titles = anime_data["sources"]["myanimelist"]["alt_titles"]
-                if mal_alt_titles and mal_alt_titles.strip():
-                    alt_titles_text = mal_alt_titles
-        elif "alternative_titles" in anime_data and anime_data["alternative_titles"]:
-            alt_titles_text = "\n".join(anime_data["alternative_titles"])
-        
-        if alt_titles_text:
-            alt_titles_field = driver.find_element(By.ID, "titres_alternatifs")
-            alt_titles_field.clear()
-            alt_titles_field.send_keys(alt_titles_text)
+        print("✓ Original title field filled:", record.title)
+        if "titres_alternatifs" in values:
             print("✓ Alternative titles field filled")
-        
-        # Select license status
-        license_select = Select(driver.find_element(By.ID, "licence"))
-        license_select.select_by_value("0")
         print("✓ License status selected: Not licensed")
-        
-        # Fill episodes
-        episode_count = "NC"
-        if "episode_count" in anime_data and anime_data["episode_count"]:
-            episode_count = str(anime_data["episode_count"])
-        
-        episodes_field = driver.find_element(By.ID, "nb_episodes")
-        episodes_field.clear()
-        episodes_field.send_keys(episode_count)
-        print("✓ Episodes field filled:", episode_count)
-        
-        # Fill official site
-        official_site = ""
-        if "official_websites" in anime_data and anime_data["official_websites"]:
-            # Filter out social media sites
-            social_media = ["twitter", "facebook", "instagram", "youtube", "tiktok", "weibo"]
-            for site in anime_data["official_websites"]:
-                if site and all(social not in site.lower() for social in social_media):
-                    official_site = site
-                    break
-            if not official_site and anime_data["official_websites"]:
-                official_site = anime_data["official_websites"][0]
-        
-        if official_site:
-            site_field = driver.find_element(By.ID, "site_officiel")
-            site_field.clear()
-            site_field.send_keys(official_site)
-            print("✓ Official site field filled:", official_site)
-        
-        # Fill voice actors
-        voice_actors_text = ""
-        if "sources" in anime_data and "myanimelist" in anime_data["sources"]:
-            characters = anime_data["sources"]["myanimelist"].get("characters", [])
-            for character in characters:
-                if "voice_actors" in character and character["voice_actors"]:
-                    for va in character["voice_actors"]:
-                        if "language" in va and va["language"] == "Japanese":
-                            formatted_name = va['name'].replace(", ", " ")
-                            character_name = character['name'].replace(", ", " ")
-                            voice_actors_text += f"{formatted_name} ({character_name}), "
-            
-            if voice_actors_text:
-                voice_actors_text = voice_actors_text[:-2]  # Remove trailing comma
-                doubleurs_field = driver.find_element(By.ID, "doubleurs")
-                doubleurs_field.clear()
-                doubleurs_field.send_keys(voice_actors_text)
-                print("✓ Voice actors field filled")
+        print("✓ Episodes field filled:", record.episode_count)
+        if "site_officiel" in values:
+            print("✓ Official site field filled:", record.official_site)
+        if "doubleurs" in values:
+            print("✓ Voice actors field filled")
         
         # Submit the form if requested
         if submit:
@@ -178,8 +72,12 @@ def fill_anime_form(driver, json_file_path, wait_time=30, submit=True):
             submit_button.click()
             print("✓ Form submitted")
             
-            # Wait for submission to process
-            time.sleep(5)
+            # Wait for the result page: the old form goes stale, then the new page loads
+            try:
+                WAITS.until(driver, "form_submit", EC.staleness_of(submit_button))
+                WAITS.until(driver, "page_load", document_ready)
+            except TimeoutException:
+                print("⚠ No page change after submitting the form")
             
             # Extract anime ID
             anime_id = extract_anime_id_from_page(driver)
@@ -200,6 +98,24 @@ def fill_anime_form(driver, json_file_path, wait_time=30, submit=True):
         traceback.print_exc()
         return None
 
+def submit_anime_form_http(form_backend, json_file_path, record=None):
+    """Create the anime with a direct HTTP POST of the form (no browser)"""
+    print(f"\n=== SUBMITTING FORM OVER HTTP FOR: {os.path.basename(json_file_path)} ===")
+    
+    if record is None:
+        record = load_anime_record(json_file_path)
+    if not record:
+        print(f"Failed to load JSON data from {json_file_path}")
+        return None
+    
+    anime_id = form_backend.create_anime(record)
+    if anime_id:
+        save_anime_id_to_file(anime_id, json_file_path)
+        print(f"✓ Anime ID {anime_id} saved for staff processing")
+    else:
+        print("⚠ Warning: Could not extract anime ID")
+    return anime_id
+
 def extract_anime_id_from_page(driver):
     """Extract anime ID from the current page"""
     try:
@@ -231,14 +147,18 @@ def extract_anime_id_from_page(driver):
     
     return None
 
+def anime_id_file_path(json_file_path):
+    """Path of the text file holding the anime ID created for json_file_path"""
+    base_name = os.path.splitext(os.path.basename(json_file_path))[0]
+    json_dir = os.path.dirname(json_file_path) or "."
+    return os.path.join(json_dir, f"{base_name}_anime_id.txt")
+
 def save_anime_id_to_file(anime_id, json_file_path):
     """Save the anime ID to a text file"""
     if not anime_id:
         return False
     
-    base_name = os.path.splitext(os.path.basename(json_file_path))[0]
-    json_dir = os.path.dirname(json_file_path) or "."
-    id_file_path = os.path.join(json_dir, f"{base_name}_anime_id.txt")
+    id_file_path = anime_id_file_path(json_file_path)
     
     try:
         with open(id_file_path, 'w') as f:
@@ -249,94 +169,141 @@ def save_anime_id_to_file(anime_id, json_file_path):
         print(f"✗ Error saving anime ID: {e}")
         return False
 
-def process_staff_and_tags(driver, json_file_path, anime_id, auto_submit=False):
+def load_saved_anime_id(json_file_path):
+    """Return the anime ID saved for json_file_path, or None if it was never created"""
+    try:
+        with open(anime_id_file_path(json_file_path)) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def process_tags(driver, anime_id, record, debug=False):
+    """
+    Select the genres and themes of record on the Modification page
+    
+    Returns:
+        bool: False if the tags page could not be loaded
+    """
+    from add_staff import extract_genres_and_themes, TagSelector
+    
+    print("\n--- Processing Genres and Themes ---")
+    
+    # Navigate to the modification page for tags
+    modification_url = f"http://www.anime-kun.net/__zone-admin__/anime.php?page=Modification&id_fiche={anime_id}"
+    driver.get(modification_url)
+    print(f"Navigated to modification page for anime ID: {anime_id}")
+    
+    # Initialize tag selector
+    tag_selector = TagSelector(driver, debug=debug)
+    
+    # Wait for page to load
+    if not tag_selector.wait_for_page_load():
+        print("⚠ Failed to load tags page")
+        return False
+    
+    # Extract and process genres and themes
+    genres, themes = extract_genres_and_themes(record)
+    
+    if genres:
+        successful_genres, failed_genres = tag_selector.select_tags(genres, "genres")
+        print(f"✓ Genres: {successful_genres} successful, {len(failed_genres)} failed")
+    
+    if themes:
+        successful_themes, failed_themes = tag_selector.select_tags(themes, "themes")
+        print(f"✓ Themes: {successful_themes} successful, {len(failed_themes)} failed")
+    return True
+
+def process_staff(driver, anime_id, record, auto_submit=False, staff_id_cache=None, done=None, on_added=None,
+                  before_member=None):
+    """
+    Add the staff of record on the Modification2 page
+    
+    Args:
+        done (set, optional): (name, role) pairs already added, skipped (resuming an interrupted run)
+        on_added (callable, optional): Called with (name, role) after each successful addition
+        before_member (callable, optional): Called with (name, role) before each member; an
+                                            exception it raises stops the loop
+    
+    Returns:
+        tuple: (number of members added, number of members that failed, names
+                skipped because they have no business entry on the site)
+    """
+    from add_staff import extract_staff_info, add_staff_member
+    
+    print("\n--- Processing Staff ---")
+    
+    staff_list = extract_staff_info(record)
+    if not staff_list:
+        print("No staff information found")
+        return 0, 0, []
+    if done:
+        staff_list = [member for member in staff_list if (member["name"], member["role"]) not in done]
+        print(f"Skipping {len(done)} staff members already added")
+        if not staff_list:
+            return 0, 0, []
+    
+    print(f"Found {len(staff_list)} staff members to add")
+    
+    # Navigate to staff management page
+    staff_url = f"http://www.anime-kun.net/__zone-admin__/anime.php?page=Modification2&id_fiche={anime_id}"
+    driver.get(staff_url)
+    print(f"Navigated to staff management page for anime ID: {anime_id}")
+    
+    wait = WebDriverWait(driver, 10)
+    WAITS.until(driver, "page_load", EC.presence_of_element_located((By.ID, "name_business")))
+    print("✓ Staff management form loaded successfully")
+    
+    # Pre-resolve the IDs of the whole run from the first staff page, where
+    # the autocomplete endpoint can be read
+    if isinstance(staff_id_cache, StaffIdTable):
+        staff_id_cache.prefetch(driver)
+    
+    successful_additions = 0
+    unresolved = []
+    for i, staff_member in enumerate(staff_list):
+        print(f"\nProcessing staff member {i+1}/{len(staff_list)}: {staff_member['name']} - {staff_member['role']}")
+        if before_member:
+            before_member(staff_member["name"], staff_member["role"])
+        
+        success = add_staff_member(
+            driver=driver,
+            name=staff_member["name"],
+            role=staff_member["role"],
+            wait=wait,
+            auto_submit=auto_submit,
+            id_cache=staff_id_cache
+        )
+        
+        if success:
+            successful_additions += 1
+            if on_added:
+                on_added(staff_member["name"], staff_member["role"])
+        elif success is None:
+            unresolved.append(staff_member["name"])
+    
+    failed = len(staff_list) - successful_additions - len(unresolved)
+    print(f"\n✓ Staff processing completed")
+    print(f"  Successfully added: {successful_additions}")
+    print(f"  Failed: {failed}")
+    if unresolved:
+        print(f"  Skipped, no business entry on the site (may need to be created): {len(unresolved)}")
+        for name in unresolved:
+            print(f"    × {name}")
+    return successful_additions, failed, unresolved
+
+def process_staff_and_tags(driver, json_file_path, anime_id, auto_submit=False, record=None, debug=False, staff_id_cache=None):
     """Process staff and tags using the same browser session"""
     print(f"\n=== PROCESSING STAFF AND TAGS FOR: {os.path.basename(json_file_path)} ===")
     
     try:
-        # Import the necessary modules from add_staff.py
-        sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-        
-        # Import functions we need
-        from add_staff import (
-            extract_staff_info, 
-            extract_genres_and_themes, 
-            TagSelector,
-            add_staff_member,
-            ROLE_MAPPING
-        )
-        
-        anime_data = load_json_data(json_file_path)
-        if not anime_data:
+        if record is None:
+            record = load_anime_record(json_file_path)
+        if not record:
             print("Failed to load JSON data")
             return False
         
-        # === PROCESS GENRES AND THEMES ===
-        print("\n--- Processing Genres and Themes ---")
-        
-        # Navigate to the modification page for tags
-        modification_url = f"http://www.anime-kun.net/__zone-admin__/anime.php?page=Modification&id_fiche={anime_id}"
-        driver.get(modification_url)
-        print(f"Navigated to modification page for anime ID: {anime_id}")
-        
-        # Initialize tag selector
-        tag_selector = TagSelector(driver)
-        
-        # Wait for page to load
-        if tag_selector.wait_for_page_load():
-            # Extract and process genres and themes
-            genres, themes = extract_genres_and_themes(anime_data)
-            
-            if genres:
-                successful_genres, failed_genres = tag_selector.select_tags(genres, "genres")
-                print(f"✓ Genres: {successful_genres} successful, {len(failed_genres)} failed")
-            
-            if themes:
-                successful_themes, failed_themes = tag_selector.select_tags(themes, "themes")
-                print(f"✓ Themes: {successful_themes} successful, {len(failed_themes)} failed")
-        else:
-            print("⚠ Failed to load tags page")
-        
-        # === PROCESS STAFF ===
-        print("\n--- Processing Staff ---")
-        
-        staff_list = extract_staff_info(anime_data)
-        if not staff_list:
-            print("No staff information found")
-            return True
-        
-        print(f"Found {len(staff_list)} staff members to add")
-        
-        # Navigate to staff management page
-        staff_url = f"http://www.anime-kun.net/__zone-admin__/anime.php?page=Modification2&id_fiche={anime_id}"
-        driver.get(staff_url)
-        print(f"Navigated to staff management page for anime ID: {anime_id}")
-        
-        wait = WebDriverWait(driver, 10)
-        wait.until(EC.presence_of_element_located((By.ID, "name_business")))
-        print("✓ Staff management form loaded successfully")
-        
-        successful_additions = 0
-        for i, staff_member in enumerate(staff_list):
-            print(f"\nProcessing staff member {i+1}/{len(staff_list)}: {staff_member['name']} - {staff_member['role']}")
-            
-            success = add_staff_member(
-                driver=driver,
-                name=staff_member["name"],
-                role=staff_member["role"],
-                wait=wait,
-                auto_submit=auto_submit
-            )
-            
-            if success:
-                successful_additions += 1
-            
-            time.sleep(2)  # Wait between staff additions
-        
-        print(f"\n✓ Staff processing completed")
-        print(f"  Successfully added: {successful_additions}")
-        print(f"  Failed: {len(staff_list) - successful_additions}")
-        
+        process_tags(driver, anime_id, record, debug=debug)
+        process_staff(driver, anime_id, record, auto_submit=auto_submit, staff_id_cache=staff_id_cache)
         return True
         
     except Exception as e:
@@ -358,15 +325,221 @@ def get_json_files(json_path):
     elif os.path.isfile(json_path) and json_path.endswith('.json'):
         json_files = [json_path]
         print(f"Processing single JSON file: {json_path}")
+    elif os.path.isfile(json_path) and json_path.endswith('.jsonl'):
+        json_files = [json_path]
+        print(f"Processing JSONL records from: {json_path}")
     else:
-        print(f"Error: {json_path} is not a valid JSON file or directory")
+        print(f"Error: {json_path} is not a valid JSON/JSONL file or directory")
         return []
     
     return json_files
 
+def iter_anime_items(json_files, follow=False, follow_timeout=300):
+    """
+    Yield (json_file_path, record) pairs for every anime to process
+    
+    Each file or JSONL line is parsed once into an AnimeRecord; record is
+    None when a file cannot be loaded.
+    
+    JSONL files are streamed record by record; with follow=True the file is
+    watched for new records while the scraper is still appending to it.
+    For JSONL records, json_file_path is the per-title path the record would
+    have had, so the anime ID file still lands next to the data.
+    """
+    for json_file_path in json_files:
+        if json_file_path.endswith('.jsonl'):
+            for data in iter_jsonl_records(json_file_path, follow=follow, idle_timeout=follow_timeout):
+                yield record_file_path(json_file_path, data), AnimeRecord.from_data(data)
+        else:
+            yield json_file_path, load_anime_record(json_file_path)
+
+def create_driver(debug=False, rate_limiter=None, profile="lean", headless=False):
+    """Start the Chrome used for publishing, with its navigations and clicks rate limited if requested"""
+    return create_browser(profile, headless, debug, rate_limiter)
+
+def find_existing_fiche(catalog, json_file_path, record):
+    """
+    Look the anime up in the catalog of existing fiches
+    
+    Returns:
+        str: ID of the existing fiche (saved like a newly created one), or None
+    """
+    if catalog is None or not record:
+        return None
+    found = catalog.match_record(record)
+    if not found:
+        return None
+    print(f"⚠ {record.title} is already on the site: {describe_match(found)}")
+    save_anime_id_to_file(found["anime_id"], json_file_path)
+    return found["anime_id"]
+
+def process_anime_item(driver, form_backend, json_file_path, record, args, staff_id_cache=None, catalog=None):
+    """
+    Create one anime (or reuse its existing fiche), then add its tags and staff if requested
+    
+    Returns:
+        tuple: ("created", "existing" or None on failure, tags and staff processed)
+    """
+    # Step 1: Fill the form, unless the anime already has a fiche
+    anime_id = find_existing_fiche(catalog, json_file_path, record)
+    if anime_id:
+        outcome = "existing"
+        if args.on_existing == "skip":
+            print(f"Skipping {os.path.basename(json_file_path)} (--on-existing skip)")
+            return outcome, False
+        print(f"Updating the existing fiche {anime_id} instead of creating a new one")
+    else:
+        outcome = "created"
+        if form_backend:
+            anime_id = submit_anime_form_http(form_backend, json_file_path, record)
+        else:
+            anime_id = fill_anime_form(driver, json_file_path, args.wait_time, submit=True, record=record,
+                                       fill_mode=args.fill_mode)
+        
+        if not anime_id:
+            print(f"✗ Form filling failed for {os.path.basename(json_file_path)}")
+            return None, False
+        
+        print(f"✓ Form filling successful for {os.path.basename(json_file_path)}")
+        if catalog is not None and record:
+            catalog.add_record(anime_id, record)
+    
+    if args.no_staff or args.form_only:
+        return outcome, False
+    
+    # Step 2: Process staff and tags
+    staff_success = process_staff_and_tags(
+        driver, 
+        json_file_path, 
+        anime_id, 
+        auto_submit=args.staff_auto_submit,
+        record=record,
+        debug=args.debug,
+        staff_id_cache=staff_id_cache
+    )
+    
+    if staff_success:
+        print(f"✓ Staff processing successful for {os.path.basename(json_file_path)}")
+    else:
+        print(f"⚠ Staff processing had issues for {os.path.basename(json_file_path)}")
+    return outcome, staff_success
+
+def run_sessions(items, args, session_store, form_backend=None, staff_id_cache=None, rate_limiter=None, catalog=None):
+    """
+    Publish items with args.sessions sessions pulling from a shared work queue
+    
+    Each session logs its own browser in through session_store (when a browser
+    is needed; the saved session is reused when still valid) and takes
+    the next item as soon as it is done with the previous one, so a slow title
+    does not hold the others back.
+    
+    Returns:
+        tuple: (counts dict with "total", "forms", "existing" and "staff", list of drivers left open)
+    """
+    needs_browser = form_backend is None or not (args.no_staff or args.form_only)
+    counts = {"total": 0, "forms": 0, "existing": 0, "staff": 0}
+    drivers = []
+    items = iter(items)
+    # Separate locks: with --follow, next() can block until the scraper appends a record
+    items_lock = threading.Lock()
+    results_lock = threading.Lock()
+    
+    def next_item():
+        with items_lock:
+            return next(items, None)
+    
+    def start_driver(label):
+        driver = create_driver(args.debug, rate_limiter, args.browser_profile, args.headless)
+        with results_lock:
+            drivers.append(driver)
+        
+        print(f"=== LOGGING IN{label} ===")
+        login_success = session_store.login_driver(driver)
+        if not login_success:
+            print("⚠ Could not verify successful login. Continuing anyway...")
+        return driver
+    
+    def replace_driver(driver, label):
+        with results_lock:
+            drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        print(f"Restarting the browser{label}...")
+        return start_driver(label)
+    
+    def session(session_id):
+        label = f" [session {session_id}]" if args.sessions > 1 else ""
+        try:
+            driver = None
+            if needs_browser:
+                driver = start_driver(label)
+                
+                # With a known endpoint, pre-resolve before any form is filled
+                if isinstance(staff_id_cache, StaffIdTable) and args.autocomplete_url:
+                    staff_id_cache.prefetch(driver)
+            
+            processed = 0
+            while True:
+                item = next_item()
+                if item is None:
+                    return
+                json_file_path, record = item
+                
+                # Wait between different anime processing (except before the first one)
+                if processed > 0 and args.file_delay > 0:
+                    print(f"Waiting {args.file_delay:g} seconds before processing next file...")
+                    WAITS.sleep("file_delay", args.file_delay)
+                processed += 1
+                
+                print(f"\n{'*'*80}")
+                print(f"PROCESSING{label}: {os.path.basename(json_file_path)}")
+                print(f"{'*'*80}")
+                
+                # A crash is counted as a failure of this item only. The item
+                # is not retried: its form may already have been submitted
+                try:
+                    outcome, staff_success = process_anime_item(
+                        driver, form_backend, json_file_path, record, args, staff_id_cache, catalog
+                    )
+                except Exception as e:
+                    print(f"✗ Processing failed for {os.path.basename(json_file_path)}{label}: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    outcome, staff_success = None, False
+                    if driver is not None and isinstance(e, WebDriverException):
+                        driver = replace_driver(driver, label)
+                
+                with results_lock:
+                    counts["total"] += 1
+                    counts["forms"] += outcome == "created"
+                    counts["existing"] += outcome == "existing"
+                    counts["staff"] += staff_success
+        except Exception as e:
+            # Only the browser start or login gets here, between two items:
+            # the items left are taken by the other sessions
+            print(f"✗ Session{label} stopped: {e}")
+            import traceback
+            traceback.print_exc()
+    
+    if args.sessions == 1:
+        session(1)
+    else:
+        threads = [
+            threading.Thread(target=session, args=(i + 1,), name=f"publish-session-{i + 1}")
+            for i in range(args.sessions)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    
+    return counts, drivers
+
 def main():
     parser = argparse.ArgumentParser(description='Automate anime form filling and staff addition')
-    parser.add_argument('json_file', help='Path to the JSON file or directory containing anime data')
+    parser.add_argument('json_file', help='Path to the JSON file, JSONL file or directory containing anime data')
     parser.add_argument('--username', default="*****", help='Username for login (default: test)')
     parser.add_argument('--password', default="*****", help='Password for login (default: test)')
     parser.add_argument('--wait-time', type=int, default=30, help='Time in seconds to wait after filling the form (default: 30)')
@@ -374,8 +547,43 @@ def main():
     parser.add_argument('--staff-auto-submit', action='store_true', help='Auto-submit staff entries')
     parser.add_argument('--form-only', action='store_true', help='Only run form filling, skip staff processing entirely')
     parser.add_argument('--debug', action='store_true', help='Run in debug mode (keep browser open)')
+    parser.add_argument('--backend', choices=['selenium', 'http'], default='selenium',
+                        help='How the anime form is submitted: in the browser or as a direct HTTP POST (default: selenium)')
+    parser.add_argument('--fill-mode', choices=FILL_MODES, default='script',
+                        help='Selenium backend: set all fields in one script call, or type them one by one (default: script)')
+    parser.add_argument('--sessions', type=int, default=1, help='Number of logged-in sessions publishing in parallel (default: 1)')
+    parser.add_argument('--max-rps', type=float, default=2, help='Cap on admin requests per second for all sessions together, 0 for no cap (default: 2)')
+    parser.add_argument('--no-staff-cache', action='store_true', help='Always use the autocomplete instead of the cached business IDs')
+    parser.add_argument('--prefetch-staff', action='store_true', help='Resolve the staff business IDs of every file over HTTP before the staff loop')
+    parser.add_argument('--autocomplete-url', help='Staff autocomplete endpoint (default: read from the staff page)')
+    parser.add_argument('--prefetch-workers', type=int, default=4, help='Concurrent autocomplete requests when prefetching (default: 4)')
+    parser.add_argument('--follow', action='store_true', help='Keep reading new records appended to a JSONL file while the scraper runs')
+    parser.add_argument('--follow-timeout', type=int, default=300, help='Stop following a JSONL file after this many seconds without new records (default: 300)')
+    parser.add_argument('--file-delay', type=float, default=10, help='Pause in seconds between two anime of a session (default: 10)')
+    parser.add_argument('--poll-interval', type=float, help='Seconds between two checks of a wait condition (default: 0.1)')
+    parser.add_argument('--wait-budget', action='append', default=[], metavar='STEP=SECONDS',
+                        help='Timeout of a wait step, e.g. form_submit=30 (can be repeated)')
+    parser.add_argument('--browser-profile', choices=BROWSER_PROFILES, default='lean',
+                        help='lean: block images, media, fonts and third-party hosts, eager page loads; full: load everything (default: lean)')
+    parser.add_argument('--headless', action='store_true', help='Run Chrome without a window')
+    parser.add_argument('--session-file', default=DEFAULT_SESSION_PATH,
+                        help=f'Saved login session shared by every script and session (default: {DEFAULT_SESSION_PATH})')
+    parser.add_argument('--fresh-login', action='store_true', help='Ignore the saved login session and log in with the form')
+    parser.add_argument('--catalog', default=DEFAULT_CATALOG_PATH,
+                        help=f'Index of the fiches already on the site, built by catalog_index.py (default: {DEFAULT_CATALOG_PATH})')
+    parser.add_argument('--no-catalog-check', action='store_true', help='Create every anime without looking for an existing fiche')
+    parser.add_argument('--on-existing', choices=['update', 'skip'], default='update',
+                        help='Anime that already have a fiche: add their tags and staff to it, or leave them alone (default: update)')
     
     args = parser.parse_args()
+    process_staff = not args.no_staff and not args.form_only
+    if args.sessions < 1:
+        parser.error("--sessions must be at least 1")
+    if args.sessions > 1 and process_staff and not args.staff_auto_submit:
+        parser.error("--sessions > 1 needs --staff-auto-submit (staff entries cannot be reviewed in parallel)")
+    if args.headless and process_staff and not args.staff_auto_submit:
+        parser.error("--headless needs --staff-auto-submit (staff entries are reviewed in the browser)")
+    WAITS.configure(parse_budgets(args.wait_budget), args.poll_interval)
     
     # Get list of JSON files to process
     json_files = get_json_files(args.json_file)
@@ -384,86 +592,90 @@ def main():
         print("No JSON files found to process")
         sys.exit(1)
     
-    # Initialize webdriver with appropriate options
-    options = webdriver.ChromeOptions()
-    options.add_argument("--start-maximized")
-    if not args.debug:
-        options.add_argument("--disable-logging")
-        options.add_argument("--log-level=3")
+    rate_limiter = RateLimiter(args.max_rps)
+    session_store = SessionStore(args.username, args.password, args.session_file, reuse=not args.fresh_login)
+    form_backend = None
+    if args.backend == 'http':
+        form_backend = HttpFormBackend(args.username, args.password, rate_limiter=rate_limiter)
+    staff_id_cache = None if args.no_staff_cache else StaffIdCache()
     
-    driver = webdriver.Chrome(options=options)
+    catalog = None
+    if not args.no_catalog_check:
+        if os.path.exists(args.catalog):
+            catalog = AnimeCatalog(args.catalog)
+            print(f"Checking titles against {len(catalog)} existing fiches from {args.catalog}")
+        else:
+            print(f"⚠ No anime catalog at {args.catalog}, existing fiches are not detected (build it with catalog_index.py --refresh)")
+    
+    items = iter_anime_items(json_files, args.follow, args.follow_timeout)
+    if args.prefetch_staff and process_staff:
+        if args.follow:
+            print("⚠ --prefetch-staff needs every record up front, it is ignored with --follow")
+        else:
+            items = list(items)
+            names = collect_staff_names(record for _, record in items if record)
+            staff_id_cache = StaffIdTable(names, staff_id_cache, args.autocomplete_url, args.prefetch_workers,
+                                          rate_limiter=rate_limiter)
     
+    drivers = []
     try:
-        # Login once at the beginning
-        print("=== LOGGING IN ===")
-        login_success = login_to_site(driver, args.username, args.password)
-        if not login_success:
-            print("⚠ Could not verify successful login. Continuing anyway...")
+        # The HTTP backend logs in once for every session
+        if form_backend:
+            print("=== LOGGING IN (HTTP) ===")
+            if not session_store.login_http(form_backend):
+                print("⚠ Could not verify successful HTTP login. Continuing anyway...")
         
         # Process each JSON file
-        successful_forms = 0
-        successful_staff = 0
-        
-        for json_file_path in json_files:
-            print(f"\n{'*'*80}")
-            print(f"PROCESSING: {os.path.basename(json_file_path)}")
-            print(f"{'*'*80}")
-            
-            # Step 1: Fill the form
-            anime_id = fill_anime_form(driver, json_file_path, args.wait_time, submit=True)
-            
-            if anime_id:
-                successful_forms += 1
-                print(f"✓ Form filling successful for {os.path.basename(json_file_path)}")
-                
-                # Step 2: Process staff and tags if requested
-                if not args.no_staff and not args.form_only:
-                    staff_success = process_staff_and_tags(
-                        driver, 
-                        json_file_path, 
-                        anime_id, 
-                        auto_submit=args.staff_auto_submit
-                    )
-                    
-                    if staff_success:
-                        successful_staff += 1
-                        print(f"✓ Staff processing successful for {os.path.basename(json_file_path)}")
-                    else:
-                        print(f"⚠ Staff processing had issues for {os.path.basename(json_file_path)}")
-            else:
-                print(f"✗ Form filling failed for {os.path.basename(json_file_path)}")
-                continue
-            
-            # Wait between different anime processing (except for the last one)
-            if json_file_path != json_files[-1]:
-                print(f"Waiting 10 seconds before processing next file...")
-                time.sleep(10)
+        counts, drivers = run_sessions(items, args, session_store, form_backend, staff_id_cache, rate_limiter, catalog)
+        total_items = counts["total"]
+        successful_forms = counts["forms"]
+        existing_fiches = counts["existing"]
+        successful_staff = counts["staff"]
+        staff_attempts = successful_forms + (existing_fiches if args.on_existing == 'update' else 0)
         
         # Final summary
         print("\n" + "="*80)
         print("AUTOMATION SUMMARY")
         print("="*80)
-        print(f"Total JSON files found: {len(json_files)}")
+        print(f"Total anime processed: {total_items}")
         print(f"Successful form submissions: {successful_forms}")
+        if catalog is not None:
+            print(f"Already on the site ({'updated' if args.on_existing == 'update' else 'skipped'}): {existing_fiches}")
         
-        if not args.no_staff and not args.form_only:
+        if process_staff:
             print(f"Successful staff additions: {successful_staff}")
         
-        print(f"Failed form submissions: {len(json_files) - successful_forms}")
+        print(f"Failed form submissions: {total_items - successful_forms - existing_fiches}")
         
-        if not args.no_staff and not args.form_only:
-            print(f"Failed staff additions: {successful_forms - successful_staff}")
+        if process_staff:
+            print(f"Failed staff additions: {staff_attempts - successful_staff}")
+        
+        if args.sessions > 1:
+            print(f"Sessions: {args.sessions}")
         
         print("="*80)
         
-        if successful_forms == len(json_files):
+        if process_staff:
+            ROLE_RESOLVER.print_report()
+            if staff_id_cache:
+                staff_id_cache.print_stats()
+        if form_backend:
+            form_backend.print_stats()
+        if catalog is not None:
+            catalog.print_stats()
+        session_store.print_stats()
+        rate_limiter.print_stats()
+        BROWSER_STATS.print_stats()
+        WAITS.print_report(args.sessions)
+        
+        if successful_forms + existing_fiches == total_items:
             print("🎉 All files processed successfully!")
-        elif successful_forms > 0:
+        elif successful_forms + existing_fiches > 0:
             print("⚠ Some files processed successfully, check the logs above for details")
         else:
             print("❌ No files were processed successfully")
         
-        if args.debug:
+        if args.debug and drivers:
             print("\nDEBUG MODE: Keeping browser open for inspection...")
             input("Press Enter to close browser...")
     
@@ -474,7 +686,8 @@ def main():
     
     finally:
         if not args.debug:
-            driver.quit()
+            for driver in drivers:
+                driver.quit()
         print("Script completed.")
 
 if __name__ == "__main__":
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk cache for scraper results (Nautiljon pages, MAL searches
+and MAL pages), keyed by URL or search query.
+
+Entries expire after a configurable TTL and the cache directory is kept under
+a size limit by evicting the least recently used entries first.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+
+class ScrapeCache:
+    def __init__(self, cache_dir=".scrape_cache", ttl=24 * 3600, max_size_mb=200, refresh=False):
+        """
+        Args:
+            cache_dir (str): Directory holding the cache entries
+            ttl (float): Seconds before an entry is considered stale
+            max_size_mb (float): Size limit of the cache directory in MB
+            refresh (bool): If True, ignore existing entries but still store new results
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # filename -> [last access time, size in bytes]
+        self._entries = {}
+        for filename in os.listdir(cache_dir):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                stat = os.stat(os.path.join(cache_dir, filename))
+            except OSError:
+                continue
+            self._entries[filename] = [stat.st_mtime, stat.st_size]
+        self._total_size = sum(size for _, size in self._entries.values())
+
+    def _filename(self, namespace, key):
+        digest = hashlib.sha256(f"{namespace}\n{key}".encode("utf-8")).hexdigest()
+        return f"{namespace}_{digest[:32]}.json"
+
+    def get(self, namespace, key):
+        """
+        Return the cached value for key, or None on a miss or stale entry.
+        """
+        filename = self._filename(namespace, key)
+        path = os.path.join(self.cache_dir, filename)
+
+        with self._lock:
+            if self.refresh or filename not in self._entries:
+                self.misses += 1
+                return None
+
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._remove(filename)
+                self.misses += 1
+                return None
+
+            if entry.get("key") != key or time.time() - entry.get("stored_at", 0) > self.ttl:
+                self._remove(filename)
+                self.misses += 1
+                return None
+
+            # Touch the entry so that it becomes the most recently used
+            now = time.time()
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+            self._entries[filename][0] = now
+            self.hits += 1
+            return entry["value"]
+
+    def set(self, namespace, key, value):
+        """
+        Store value for key, evicting least recently used entries if needed.
+        """
+        filename = self._filename(namespace, key)
+        path = os.path.join(self.cache_dir, filename)
+        entry = {
+            "namespace": namespace,
+            "key": key,
+            "stored_at": time.time(),
+            "value": value
+        }
+        data = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+
+        with self._lock:
+            # Write to a temporary file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"⚠ Could not write cache entry for {key}: {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return
+
+            if filename in self._entries:
+                self._total_size -= self._entries[filename][1]
+            self._entries[filename] = [time.time(), len(data)]
+            self._total_size += len(data)
+            self._evict()
+
+    def fetch(self, namespace, key, fetch_func):
+        """
+        Return the cached value for key, calling fetch_func() on a miss.
+
+        Empty results (None, {}, "") are returned but not cached, so that
+        failed lookups are retried on the next run.
+        """
+        value = self.get(namespace, key)
+        if value is not None:
+            return value
+
+        value = fetch_func()
+        if value:
+            self.set(namespace, key, value)
+        return value
+
+    def _remove(self, filename):
+        entry = self._entries.pop(filename, None)
+        if entry:
+            self._total_size -= entry[1]
+        try:
+            os.remove(os.path.join(self.cache_dir, filename))
+        except OSError:
+            pass
+
+    def _evict(self):
+        if self._total_size <= self.max_size:
+            return
+        for filename, _ in sorted(self._entries.items(), key=lambda item: item[1][0]):
+            if self._total_size <= self.max_size:
+                break
+            self._remove(filename)
+            self.evictions += 1
+
+    def print_stats(self):
+        """Print hit/miss counters for this run"""
+        lookups = self.hits + self.misses
+        hit_rate = (self.hits / lookups * 100) if lookups else 0.0
+        print(f"Cache: {self.hits} hits, {self.misses} misses ({hit_rate:.1f}% hit rate), "
+              f"{self.evictions} evicted, {len(self._entries)} entries "
+              f"({self._total_size / (1024 * 1024):.1f} MB) in {self.cache_dir}")
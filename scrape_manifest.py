@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Checkpoint manifest for batch scraping.
+
+The manifest lives in the output directory and records, for every title, its
+status, output file, source URLs and the time it was scraped, so an
+interrupted batch can be resumed without scraping finished titles again.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+
+# Hidden so that the publishing scripts do not pick it up as an anime JSON file
+MANIFEST_FILENAME = ".scrape_manifest.json"
+
+
+class ScrapeManifest:
+    def __init__(self, output_dir, filename=MANIFEST_FILENAME):
+        self.path = os.path.join(output_dir, filename)
+        self._lock = threading.Lock()
+        self.entries = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data.get("titles", {})
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠ Could not read manifest {self.path}, starting a new one: {e}")
+            return {}
+
+    def _save(self):
+        """Write the manifest atomically (temporary file + rename)"""
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".manifest_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"updated_at": time.time(), "titles": self.entries}, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def is_done(self, anime_name, max_age=None):
+        """
+        Check whether a title was already scraped successfully
+
+        Args:
+            anime_name (str): Title as listed in the batch input
+            max_age (float, optional): Seconds after which a finished title is scraped again
+
+        Returns:
+            bool: True if the title can be skipped
+        """
+        entry = self.entries.get(anime_name)
+        if not entry or entry.get("status") != "done":
+            return False
+        if not entry.get("output_path") or not os.path.exists(entry["output_path"]):
+            return False
+        if max_age is not None and time.time() - entry.get("timestamp", 0) > max_age:
+            return False
+        return True
+
+    def pending(self, anime_list, max_age=None):
+        """Return the titles of anime_list that still need scraping, in order"""
+        return [anime_name for anime_name in anime_list if not self.is_done(anime_name, max_age)]
+
+    def record_success(self, anime_name, output_path, source_urls=None):
+        with self._lock:
+            self.entries[anime_name] = {
+                "status": "done",
+                "output_path": output_path,
+                "source_urls": source_urls or {},
+                "timestamp": time.time()
+            }
+            self._save()
+
+    def record_failure(self, anime_name, reason):
+        with self._lock:
+            previous = self.entries.get(anime_name, {})
+            self.entries[anime_name] = {
+                "status": "failed",
+                "output_path": None,
+                "source_urls": {},
+                "error": reason,
+                "attempts": previous.get("attempts", 0) + 1,
+                "timestamp": time.time()
+            }
+            self._save()
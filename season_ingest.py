@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Season page ingester for Nautiljon.
+
+Python counterpart of get_season_anime_nautiljon.html: extracts the anime of a
+saved or fetched Nautiljon season page, but keeps the link of every entry so
+the scraper gets the exact page URL instead of guessing it from the title.
+The page is parsed in a single streaming pass.
+"""
+
+import argparse
+import json
+import re
+import sys
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+NAUTILJON_BASE_URL = "https://www.nautiljon.com/"
+
+# Elements that never have a closing tag
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input",
+             "link", "meta", "param", "source", "track", "wbr"}
+
+
+def clean_season_title(title):
+    """Remove anything in parentheses from a title, like the HTML tool does"""
+    return re.sub(r"\s*\([^)]*\)", "", title).strip()
+
+
+class SeasonPageParser(HTMLParser):
+    """
+    Collects the `.elt .title h2 a` links of a season page, skipping the
+    `#saison_continue` section (series continuing from a previous season).
+    Every `h2 a` link is also collected as a fallback for pages without
+    `.elt` entries.
+    """
+
+    def __init__(self, base_url=NAUTILJON_BASE_URL):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.entries = []
+        self.fallback_entries = []
+
+        # One (tag, in_continue, in_elt, in_title, in_h2) frame per open element
+        self._stack = []
+        self._link = None
+
+    def _state(self):
+        if self._stack:
+            return self._stack[-1][1:]
+        return (False, False, False, False)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+        in_continue, in_elt, in_title, in_h2 = self._state()
+
+        in_continue = in_continue or attrs.get("id") == "saison_continue"
+        in_elt = in_elt or "elt" in classes
+        in_title = in_title or (in_elt and "title" in classes)
+        in_h2 = in_h2 or tag == "h2"
+
+        if tag == "a" and in_h2 and not in_continue and self._link is None:
+            self._link = {
+                "href": attrs.get("href") or "",
+                "text": [],
+                "in_entry": in_elt and in_title
+            }
+
+        if tag not in VOID_TAGS:
+            self._stack.append((tag, in_continue, in_elt, in_title, in_h2))
+
+    def handle_endtag(self, tag):
+        if tag == "a" and self._link is not None:
+            self._finish_link()
+
+        # Pop up to the matching element, tolerating unclosed tags
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                del self._stack[index:]
+                break
+
+    def handle_data(self, data):
+        if self._link is not None:
+            self._link["text"].append(data)
+
+    def _finish_link(self):
+        link, self._link = self._link, None
+        full_title = " ".join("".join(link["text"]).split())
+        title = clean_season_title(full_title)
+        if not title:
+            return
+        entry = {
+            "title": title,
+            "url": urljoin(self.base_url, link["href"]) if link["href"] else None
+        }
+        # The full title is kept aside to tell apart entries that clean to the same title
+        self.fallback_entries.append((entry, full_title))
+        if link["in_entry"]:
+            self.entries.append((entry, full_title))
+
+    def results(self):
+        """
+        Return the entries in page order, without duplicates
+
+        Titles are used as keys (URL lookup, output file names, manifest), so
+        different pages whose cleaned titles collide, like "X (Saison 2)" and
+        "X (Film)", keep their parentheses; a title still shared after that
+        gets its position on the page appended.
+        """
+        entries = self.entries or self.fallback_entries
+        seen = set()
+        unique = []
+        for entry, full_title in entries:
+            key = entry["url"] or entry["title"]
+            if key not in seen:
+                seen.add(key)
+                unique.append((entry, full_title))
+
+        counts = {}
+        for entry, _ in unique:
+            counts[entry["title"]] = counts.get(entry["title"], 0) + 1
+        results = []
+        used = set()
+        for index, (entry, full_title) in enumerate(unique, 1):
+            title = entry["title"]
+            if counts[title] > 1:
+                title = full_title
+            if title in used:
+                title = f"{title} [{index}]"
+            used.add(title)
+            results.append(dict(entry, title=title))
+        return results
+
+
+def parse_season_chunks(chunks, base_url=NAUTILJON_BASE_URL):
+    """
+    Parse a season page delivered as an iterable of text chunks
+
+    Returns:
+        list: Dicts with "title" and "url" keys
+    """
+    parser = SeasonPageParser(base_url)
+    for chunk in chunks:
+        parser.feed(chunk)
+    parser.close()
+    return parser.results()
+
+
+def ingest_season(source, base_url=NAUTILJON_BASE_URL, chunk_size=64 * 1024):
+    """
+    Extract the anime of a season page
+
+    Args:
+        source (str): Path to a saved season page, or its URL
+        base_url (str): Base used to make relative links absolute
+        chunk_size (int): Size of the chunks fed to the parser
+
+    Returns:
+        list: Dicts with "title" and "url" keys, in page order
+    """
+    if source.startswith("http://") or source.startswith("https://"):
+        from nautiljon_http_scraper import create_session
+
+        response = create_session().get(source, stream=True, timeout=30)
+        response.raise_for_status()
+        response.encoding = response.encoding or "utf-8"
+        return parse_season_chunks(
+            response.iter_content(chunk_size=chunk_size, decode_unicode=True),
+            base_url=source
+        )
+
+    with open(source, 'r', encoding='utf-8') as f:
+        return parse_season_chunks(iter(lambda: f.read(chunk_size), ""), base_url=base_url)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract anime titles and Nautiljon URLs from a season page")
+    parser.add_argument("source", help="Saved Nautiljon season page or its URL")
+    parser.add_argument("--output", "-o", help="Write the entries to this JSON file")
+    args = parser.parse_args()
+
+    entries = ingest_season(args.source)
+    if not entries:
+        print("No anime titles found. Please check the season page.")
+        sys.exit(1)
+
+    for index, entry in enumerate(entries, 1):
+        print(f"{index}. {entry['title']} -> {entry['url']}")
+    print(f"\n{len(entries)} anime titles extracted")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2, ensure_ascii=False)
+        print(f"✓ Saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
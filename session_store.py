@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Shared, persistent login session for the publishing scripts.
+
+After a form login the session cookies are saved to disk (per user and
+site). New browsers and HTTP sessions get those cookies instead of logging
+in again; one load of the site root tells whether they are still accepted,
+and only then is the login form used. The store is thread-safe, so the
+parallel sessions of a run log in once and the others reuse the result.
+
+    python session_store.py --username me --password secret     # log in and save the session
+    python session_store.py --forget
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from anime_form_http import SITE_URL, HttpFormBackend
+from wait_engine import WAITS, document_ready
+
+DEFAULT_SESSION_PATH = ".site_session.json"
+
+# Cookie attributes a WebDriver accepts in add_cookie
+DRIVER_COOKIE_KEYS = ("name", "value", "path", "secure", "httpOnly", "expiry")
+
+
+def login_to_site(driver, username, password, site_url=SITE_URL):
+    """Log the driver in with the login form of the site root"""
+    try:
+        driver.get(site_url)
+        print("Navigated to the main site")
+
+        username_field = WAITS.until(driver, "page_load", EC.presence_of_element_located((By.ID, "user")))
+
+        username_field.send_keys(username)
+        password_field = driver.find_element(By.ID, "passwrd")
+        password_field.send_keys(password)
+        print("Entered login credentials")
+
+        submit_button = driver.find_element(By.ID, "llsubmit")
+        submit_button.click()
+        print("Submitted login form")
+
+        try:
+            WAITS.until(driver, "login", EC.url_contains("forums"))
+            print("✓ Successfully logged in")
+            return True
+        except TimeoutException:
+            print("⚠ Login might have failed")
+            return False
+
+    except Exception as e:
+        print(f"✗ Error during login: {e}")
+        return False
+
+
+def page_has_login_form(html):
+    """The site shows its login form (#user) only to visitors who are not logged in"""
+    return BeautifulSoup(html, "html.parser").find(id="user") is not None
+
+
+class SessionStore:
+    def __init__(self, username, password, path=DEFAULT_SESSION_PATH, site_url=SITE_URL, reuse=True):
+        """
+        Args:
+            username (str): Site username; saved sessions of other users are ignored
+            password (str): Site password, used only when a form login is needed
+            path (str): File keeping the session cookies
+            site_url (str): Site root
+            reuse (bool): If False, ignore the saved session and log in with the form
+        """
+        self.username = username
+        self.password = password
+        self.path = path
+        self.site_url = site_url
+        self.cookies = self._load() if reuse else []
+        self.form_logins = 0
+        self.restored = 0
+        self.expired = 0
+        # Parallel sessions wait for the first login and then reuse its cookies
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠ Could not read saved session {self.path}: {e}")
+            return []
+        if data.get("username") != self.username or data.get("site_url") != self.site_url:
+            return []
+        return data.get("cookies", [])
+
+    def _save(self, cookies):
+        self.cookies = cookies
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".site_session_", suffix=".tmp")
+        try:
+            # The cookies give access to the account: keep them private
+            os.chmod(tmp_path, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"username": self.username, "site_url": self.site_url,
+                           "saved_at": time.time(), "cookies": cookies}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠ Could not save the login session: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def forget(self):
+        """Drop the saved session"""
+        with self._lock:
+            self.cookies = []
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def login_driver(self, driver):
+        """
+        Log a WebDriver in, with the saved session if it is still valid
+
+        Returns:
+            bool: True if the driver is logged in
+        """
+        with self._lock:
+            if self.cookies:
+                try:
+                    # Cookies can only be set on a page of their site
+                    driver.get(self.site_url)
+                    for cookie in self.cookies:
+                        driver.add_cookie({key: cookie[key] for key in DRIVER_COOKIE_KEYS if cookie.get(key) is not None})
+                    driver.refresh()
+                    WAITS.until(driver, "page_load", document_ready)
+                    if not driver.find_elements(By.ID, "user"):
+                        self.restored += 1
+                        print("✓ Logged in with the saved session")
+                        return True
+                    self.expired += 1
+                    print("Saved session expired, logging in again")
+                    driver.delete_all_cookies()
+                except (WebDriverException, TimeoutException) as e:
+                    print(f"⚠ Could not restore the saved session: {e}")
+
+            if not login_to_site(driver, self.username, self.password, self.site_url):
+                return False
+            self.form_logins += 1
+            self._save(driver.get_cookies())
+            return True
+
+    def login_http(self, backend):
+        """
+        Log an HttpFormBackend in, with the saved session if it is still valid
+
+        Returns:
+            bool: True if the backend is logged in
+        """
+        with self._lock:
+            if self.cookies:
+                domain = urlparse(backend.base_url).hostname
+                for cookie in self.cookies:
+                    backend.session.cookies.set(cookie["name"], cookie["value"], domain=domain,
+                                                path=cookie.get("path", "/"))
+                try:
+                    if not page_has_login_form(backend.get_page("").text):
+                        self.restored += 1
+                        print("✓ Logged in with the saved session (HTTP)")
+                        return True
+                    self.expired += 1
+                    print("Saved session expired, logging in again (HTTP)")
+                except requests.RequestException as e:
+                    print(f"⚠ Could not check the saved session: {e}")
+                backend.session.cookies.clear()
+
+            if not backend.login():
+                return False
+            self.form_logins += 1
+            self._save([{"name": cookie.name, "value": cookie.value, "path": cookie.path,
+                         "secure": cookie.secure, "expiry": cookie.expires}
+                        for cookie in backend.session.cookies])
+            return True
+
+    def print_stats(self):
+        print(f"Logins: {self.form_logins} with the form, {self.restored} from the saved session "
+              f"({self.expired} expired sessions)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Log in once and save the session for the publishing scripts")
+    parser.add_argument("--username", default="*****", help="Username for login")
+    parser.add_argument("--password", default="*****", help="Password for login")
+    parser.add_argument("--session-file", default=DEFAULT_SESSION_PATH, help=f"Saved session (default: {DEFAULT_SESSION_PATH})")
+    parser.add_argument("--base-url", default=SITE_URL, help=f"Site root (default: {SITE_URL})")
+    parser.add_argument("--fresh-login", action="store_true", help="Log in with the form even if the saved session is valid")
+    parser.add_argument("--forget", action="store_true", help="Delete the saved session and exit")
+    args = parser.parse_args()
+
+    store = SessionStore(args.username, args.password, args.session_file, args.base_url, reuse=not args.fresh_login)
+    if args.forget:
+        store.forget()
+        print(f"✓ Removed {args.session_file}")
+        return
+
+    if store.login_http(HttpFormBackend(args.username, args.password, base_url=args.base_url)):
+        print(f"✓ Session saved in {args.session_file}")
+    else:
+        print("✗ Login failed")
+    store.print_stats()
+
+
+if __name__ == "__main__":
+    main()
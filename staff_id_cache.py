@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Persistent staff name -> id_business cache.
+
+Every staff entry added successfully teaches the cache the business ID the
+site's autocomplete picked for that name. On the next anime with the same
+person or studio, add_staff_member sets the hidden #id_business field
+directly instead of typing the name and waiting for the autocomplete.
+
+    python staff_id_cache.py --stats
+    python staff_id_cache.py --invalidate "Hiroyuki Sawano"
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+import unicodedata
+
+DEFAULT_CACHE_PATH = ".staff_id_cache.json"
+
+
+def normalize_name(name):
+    """
+    Normalize a person or studio name for lookups
+
+    Casefolded, accents and punctuation removed and words sorted, so that
+    "Sato, Hiroshi" and "Hiroshi SATO" share an entry.
+    """
+    if not name:
+        return ""
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(char for char in name if not unicodedata.combining(char)).casefold()
+    name = "".join(char if char.isalnum() else " " for char in name)
+    return " ".join(sorted(name.split()))
+
+
+class StaffIdCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.learned = 0
+        self._lock = threading.Lock()
+        self.entries = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠ Could not read staff ID cache {self.path}, starting a new one: {e}")
+            return {}
+
+    def _save(self):
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".staff_id_cache_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠ Could not save staff ID cache: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def lookup(self, name):
+        """Return the confirmed id_business of a name, or None"""
+        key = normalize_name(name)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry:
+                self.hits += 1
+                return entry["id"]
+            self.misses += 1
+        return None
+
+    def record(self, name, business_id):
+        """Remember the id_business confirmed for a name"""
+        key = normalize_name(name)
+        if not key or not business_id:
+            return
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry and entry["id"] == business_id:
+                return
+            self.entries[key] = {"id": business_id, "name": name, "confirmed_at": time.time()}
+            self.learned += 1
+            self._save()
+
+    def invalidate(self, name):
+        """Forget a name so that it goes through the autocomplete again"""
+        with self._lock:
+            removed = self.entries.pop(normalize_name(name), None) is not None
+            if removed:
+                self._save()
+        return removed
+
+    def clear(self):
+        with self._lock:
+            count = len(self.entries)
+            self.entries = {}
+            self._save()
+        return count
+
+    def print_stats(self):
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups * 100 if lookups else 0.0
+        print(f"Staff ID cache: {self.hits}/{lookups} names resolved from cache ({rate:.0f}% hit rate), "
+              f"{self.learned} new IDs learned, {len(self.entries)} names known")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the staff name -> id_business cache")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help=f"Cache file (default: {DEFAULT_CACHE_PATH})")
+    parser.add_argument("--invalidate", metavar="NAME", action="append", default=[],
+                        help="Forget NAME (can be repeated)")
+    parser.add_argument("--clear", action="store_true", help="Forget every name")
+    parser.add_argument("--list", action="store_true", help="List the cached names and IDs")
+    parser.add_argument("--stats", action="store_true", help="Show the number of cached names")
+    args = parser.parse_args()
+
+    cache = StaffIdCache(args.cache)
+
+    for name in args.invalidate:
+        if cache.invalidate(name):
+            print(f"✓ Removed '{name}'")
+        else:
+            print(f"× '{name}' is not in the cache")
+    if args.clear:
+        print(f"✓ Removed {cache.clear()} names")
+    if args.list:
+        for entry in sorted(cache.entries.values(), key=lambda entry: entry["name"].casefold()):
+            print(f"{entry['name']} -> {entry['id']}")
+    if args.stats or args.list:
+        print(f"{len(cache.entries)} names cached in {args.cache}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Bulk pre-resolution of staff business IDs.
+
+Before the browser staff loop, every unique staff/studio name of the run is
+looked up on the autocomplete backend of the #name_business field with a
+small pool of concurrent HTTP requests that reuse the browser's login
+cookies. The IDs go into a per-run table that add_staff_member reads like the
+persistent StaffIdCache, so the loop only has to fill and submit the forms.
+Names with no match or several matches are reported up front.
+
+The endpoint can be tried against any stand-in that answers like a jQuery UI
+autocomplete source (GET ?term=... returning a JSON list):
+
+    python staff_prefetch.py spring_anime --autocomplete-url http://localhost:8000/autocomplete.php
+"""
+
+import argparse
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+
+from nautiljon_http_scraper import create_session
+from staff_id_cache import StaffIdCache, normalize_name
+
+# Source option of the jQuery UI autocomplete bound to the business name field
+AUTOCOMPLETE_SOURCE_SCRIPT = """
+if (!window.jQuery) {
+    return null;
+}
+var field = jQuery('#name_business');
+if (!field.length || !field.autocomplete('instance')) {
+    return null;
+}
+var source = field.autocomplete('option', 'source');
+return typeof source === 'string' ? source : null;
+"""
+
+# Keys of an autocomplete item that may hold the business ID
+ID_KEYS = ("id_business", "id")
+
+
+def collect_staff_names(records):
+    """
+    Return the unique staff and studio names of AnimeRecords, in first-seen order
+    """
+    names = {}
+    for record in records:
+        for member in record.staff:
+            names.setdefault(normalize_name(member["name"]), member["name"])
+    return list(names.values())
+
+
+def discover_autocomplete_url(driver):
+    """
+    Read the autocomplete endpoint from the staff page loaded in driver
+
+    Returns:
+        str: Absolute endpoint URL, or None if the page has no remote source
+    """
+    try:
+        source = driver.execute_script(AUTOCOMPLETE_SOURCE_SCRIPT)
+    except Exception as e:
+        print(f"⚠ Could not read the autocomplete source: {e}")
+        return None
+    return urljoin(driver.current_url, source) if source else None
+
+
+def session_from_driver(driver, pool_size=4):
+    """Create an HTTP session carrying the cookies and user agent of the browser"""
+    session = create_session(pool_size)
+    session.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+    return session
+
+
+def item_business_id(item, id_key=None):
+    if not isinstance(item, dict):
+        return None
+    for key in ((id_key,) if id_key else ID_KEYS):
+        if item.get(key) not in (None, ""):
+            return str(item[key])
+    return None
+
+
+def item_label(item):
+    if isinstance(item, dict):
+        return item.get("label") or item.get("value") or ""
+    return str(item)
+
+
+def match_autocomplete_items(name, items, id_key=None):
+    """
+    Pick the business ID of name among autocomplete items
+
+    Only items whose label is the same name (normalized) can resolve it: the
+    autocomplete matches substrings, so a single other result is usually
+    another person or studio. Without exactly one matching ID, the name is
+    left unresolved and every item is returned as a candidate for the report.
+
+    Returns:
+        tuple: (business ID or None, list of candidate labels)
+    """
+    items = [item for item in items if item_business_id(item, id_key)]
+    key = normalize_name(name)
+    exact = [item for item in items if normalize_name(item_label(item)) == key]
+    ids = {item_business_id(item, id_key) for item in exact}
+    if len(ids) == 1:
+        return ids.pop(), [item_label(item) for item in exact]
+    return None, [item_label(item) for item in (exact or items)]
+
+
+class StaffIdTable:
+    """
+    Per-run name -> id_business table, filled before the staff loop
+
+    Names not in the table fall back to the persistent StaffIdCache, and IDs
+    confirmed by the staff loop are recorded there.
+    """
+
+    def __init__(self, names, id_cache=None, autocomplete_url=None, workers=4, timeout=10, id_key=None,
+                 rate_limiter=None):
+        """
+        Args:
+            names (list): Staff and studio names of the run
+            id_cache (StaffIdCache, optional): Persistent cache; names it knows are not queried
+            autocomplete_url (str, optional): Endpoint; read from the staff page when not given
+            workers (int): Concurrent autocomplete requests
+            timeout (float): Timeout of one request in seconds
+            id_key (str, optional): Item key holding the business ID (default: id_business or id)
+            rate_limiter (RateLimiter, optional): Shared cap on admin requests, also applied
+                                                  to the autocomplete requests
+        """
+        self.names = names
+        self.id_cache = id_cache
+        self.autocomplete_url = autocomplete_url
+        self.workers = workers
+        self.timeout = timeout
+        self.id_key = id_key
+        self.rate_limiter = rate_limiter
+        self.ids = {}
+        self.missing = []
+        self.ambiguous = {}
+        self.errors = {}
+        self.prefetched = False
+        self.hits = 0
+        self._lock = threading.Lock()
+
+    def prefetch(self, driver=None, session=None):
+        """
+        Resolve every name of the run that the persistent cache does not know
+
+        Runs once; later calls return immediately, or wait for the first one
+        to finish when several sessions share the table. Without
+        autocomplete_url, driver must be on a page with the #name_business field.
+        """
+        with self._lock:
+            if not self.prefetched:
+                self.prefetched = True
+                self._prefetch(driver, session)
+
+    def _prefetch(self, driver, session):
+        url = self.autocomplete_url or (discover_autocomplete_url(driver) if driver else None)
+        if not url:
+            print("⚠ Autocomplete endpoint not found, staff IDs will be resolved in the browser")
+            return
+
+        known = self.id_cache.entries if self.id_cache else {}
+        names = [name for name in self.names if normalize_name(name) not in known]
+        print(f"\n=== PRE-RESOLVING {len(names)} STAFF NAMES ({len(self.names) - len(names)} already cached) ===")
+        if not names:
+            return
+
+        if session is None:
+            session = session_from_driver(driver, self.workers) if driver else create_session(self.workers)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(lambda name: self._query(session, url, name), names))
+
+        for name, (business_id, candidates, error) in zip(names, results):
+            if error:
+                self.errors[name] = error
+            elif business_id:
+                self.ids[normalize_name(name)] = business_id
+            elif candidates:
+                self.ambiguous[name] = candidates
+            else:
+                self.missing.append(name)
+        self.print_report()
+
+    def _query(self, session, url, name):
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response = session.get(url, params={"term": name}, timeout=self.timeout)
+            response.raise_for_status()
+            items = response.json()
+        except Exception as e:
+            return None, [], str(e)
+        if isinstance(items, dict):
+            items = [items]
+        business_id, candidates = match_autocomplete_items(name, items or [], self.id_key)
+        return business_id, candidates, None
+
+    def print_report(self):
+        print(f"✓ {len(self.ids)} staff IDs pre-resolved")
+        if self.ambiguous:
+            print(f"⚠ {len(self.ambiguous)} names with several or only inexact matches (resolved in the browser):")
+            for name, candidates in self.ambiguous.items():
+                print(f"  ? {name}: {', '.join(candidates[:5])}")
+        if self.missing:
+            print(f"⚠ {len(self.missing)} names with no match (may need a new business entry):")
+            for name in self.missing:
+                print(f"  × {name}")
+        if self.errors:
+            print(f"✗ {len(self.errors)} names could not be queried:")
+            for name, error in self.errors.items():
+                print(f"  × {name}: {error}")
+
+    def lookup(self, name):
+        business_id = self.ids.get(normalize_name(name))
+        if business_id:
+            self.hits += 1
+            return business_id
+        return self.id_cache.lookup(name) if self.id_cache else None
+
+    def record(self, name, business_id):
+        """Save an ID confirmed by the staff loop (pre-resolved or not) in the persistent cache"""
+        if self.id_cache:
+            self.id_cache.record(name, business_id)
+
+    def print_stats(self):
+        print(f"Pre-resolved staff IDs: {self.hits} used, {len(self.ids)} resolved, "
+              f"{len(self.ambiguous)} ambiguous, {len(self.missing)} without match")
+        if self.id_cache:
+            self.id_cache.print_stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-resolve the staff business IDs of a set of anime JSON files")
+    parser.add_argument("json_path", help="JSON file, JSONL file or directory of anime data")
+    parser.add_argument("--autocomplete-url", required=True, help="Autocomplete endpoint behind #name_business")
+    parser.add_argument("--cookie", action="append", default=[], metavar="NAME=VALUE",
+                        help="Session cookie to send (can be repeated)")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent requests (default: 4)")
+    parser.add_argument("--id-key", help="Item key holding the business ID (default: id_business or id)")
+    parser.add_argument("--no-staff-cache", action="store_true", help="Query every name, even the cached ones")
+    args = parser.parse_args()
+
+    # Imported here: run_anime_automation pulls in selenium
+    from run_anime_automation import get_json_files, iter_anime_items
+
+    records = [record for _, record in iter_anime_items(get_json_files(args.json_path)) if record]
+    names = collect_staff_names(records)
+    if not names:
+        print("No staff names found")
+        sys.exit(1)
+
+    session = create_session(args.workers)
+    for cookie in args.cookie:
+        cookie_name, _, value = cookie.partition("=")
+        session.cookies.set(cookie_name, value)
+
+    id_cache = None if args.no_staff_cache else StaffIdCache()
+    table = StaffIdTable(names, id_cache, args.autocomplete_url, args.workers, id_key=args.id_key)
+    table.prefetch(session=session)
+
+
+if __name__ == "__main__":
+    main()
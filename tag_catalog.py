@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Catalog of the tags (genres, themes...) of the anime Modification page.
+
+Every `[id^='t_']` element of the page is read with its label in a single
+script call and saved to disk with a version stamp. The catalog is harvested
+again only when it is older than max_age or when the page shows a different
+number of tags. Terms are looked up on their normalized form (casefold,
+accents and punctuation folded), against the catalog labels and the curated
+FR/EN synonyms of TagSelector.
+
+    python tag_catalog.py --list
+    python tag_catalog.py --lookup "Slice of Life"
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from title_keys import normalize_title
+
+DEFAULT_CATALOG_PATH = ".tag_catalog.json"
+DEFAULT_MAX_AGE = 30 * 24 * 3600
+
+# Bumped when the file format changes; older files are harvested again
+CATALOG_VERSION = 1
+
+HARVEST_SCRIPT = """
+return Array.from(document.querySelectorAll("[id^='t_']")).map(function (element) {
+    return [element.id, (element.textContent || "").trim()];
+});
+"""
+
+COUNT_SCRIPT = "return document.querySelectorAll(\"[id^='t_']\").length;"
+
+
+class TagCatalog:
+    def __init__(self, path=DEFAULT_CATALOG_PATH, max_age=DEFAULT_MAX_AGE):
+        """
+        Args:
+            path (str): Catalog file
+            max_age (float): Seconds after which the catalog is harvested again
+        """
+        self.path = path
+        self.max_age = max_age
+        self.tags = {}
+        self.harvested_at = 0
+        self.index = {}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠ Could not read tag catalog {self.path}: {e}")
+            return
+        if data.get("version") != CATALOG_VERSION:
+            print(f"Tag catalog {self.path} has an old format, it will be harvested again")
+            return
+        self.tags = data.get("tags", {})
+        self.harvested_at = data.get("harvested_at", 0)
+
+    def _save(self):
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tag_catalog_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "version": CATALOG_VERSION,
+                    "harvested_at": self.harvested_at,
+                    "tag_count": len(self.tags),
+                    "tags": self.tags
+                }, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠ Could not save tag catalog: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def is_stale(self, page_tag_count=None):
+        if not self.tags:
+            return True
+        if time.time() - self.harvested_at > self.max_age:
+            return True
+        return page_tag_count is not None and page_tag_count != len(self.tags)
+
+    def ensure(self, driver):
+        """
+        Harvest the catalog from the Modification page loaded in driver if it
+        is missing, too old, or the page has a different number of tags
+
+        Returns:
+            bool: True if the catalog was harvested
+        """
+        page_tag_count = driver.execute_script(COUNT_SCRIPT)
+        if not self.is_stale(page_tag_count):
+            return False
+
+        pairs = driver.execute_script(HARVEST_SCRIPT) or []
+        self.tags = {tag_id: label for tag_id, label in pairs if label}
+        self.harvested_at = time.time()
+        self._save()
+        self.index = {}
+        print(f"✓ Tag catalog harvested: {len(self.tags)} tags saved to {self.path}")
+        return True
+
+    def build_index(self, synonyms=None):
+        """
+        Build the normalized term -> (tag id, label) index
+
+        Args:
+            synonyms (dict): Extra terms, {term: {"id": tag id, "name": label}};
+                             catalog labels take precedence over them
+        """
+        index = {}
+        for term, info in (synonyms or {}).items():
+            index[normalize_title(term)] = (info["id"], info["name"])
+        for tag_id, label in self.tags.items():
+            index[normalize_title(label)] = (tag_id, label)
+        self.index = index
+        return index
+
+    def lookup(self, term):
+        """
+        Return (tag id, label) for a genre or theme, or None
+
+        A trailing plural "s" is ignored when the exact form is unknown.
+        """
+        key = normalize_title(term)
+        match = self.index.get(key)
+        if match is None and key.endswith("s"):
+            match = self.index.get(key[:-1])
+        return match
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect the cached tag catalog")
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG_PATH, help=f"Catalog file (default: {DEFAULT_CATALOG_PATH})")
+    parser.add_argument("--list", action="store_true", help="List every tag of the catalog")
+    parser.add_argument("--lookup", metavar="TERM", help="Show which tag TERM resolves to")
+    args = parser.parse_args()
+
+    catalog = TagCatalog(args.catalog)
+    if not catalog.tags:
+        print(f"No tag catalog in {args.catalog}; it is harvested the next time tags are selected")
+        return
+
+    age_days = (time.time() - catalog.harvested_at) / 86400
+    print(f"{len(catalog.tags)} tags, harvested {age_days:.1f} days ago")
+
+    if args.list:
+        for tag_id, label in sorted(catalog.tags.items(), key=lambda item: item[1].casefold()):
+            print(f"{tag_id}: {label}")
+    if args.lookup:
+        # Imported here to keep the CLI usable without a browser session
+        from add_staff import TagSelector
+
+        catalog.build_index(TagSelector.TAG_SYNONYMS)
+        match = catalog.lookup(args.lookup)
+        print(f"{args.lookup} -> {match[1]} ({match[0]})" if match else f"× '{args.lookup}' not found")
+
+
+if __name__ == "__main__":
+    main()
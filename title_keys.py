@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Title and term normalization shared by the lookup indexes.
+
+normalize_title folds a term for loose lookups (tags, labels), dropping what
+is in parentheses. title_key keeps the words in parentheses: "Titre (Saison 2)",
+"Titre (Film)" and "Titre" are different anime, on the site as on MyAnimeList.
+"""
+
+import re
+import unicodedata
+
+
+def normalize_title(title):
+    """
+    Normalize a title or term for lookups
+
+    "Kaijū n°8 (Saison 2)" and "kaiju n 8" both become "kaiju n 8".
+    """
+    if not title:
+        return ""
+    title = re.sub(r"\s*\([^)]*\)", "", title)
+    title = unicodedata.normalize("NFKD", title)
+    title = "".join(char for char in title if not unicodedata.combining(char))
+    title = title.casefold()
+    title = re.sub(r"[^\w\s]|_", " ", title)
+    return " ".join(title.split())
+
+
+def title_key(title):
+    """
+    Normalized title for exact lookups of an anime
+
+    Like normalize_title, but the words in parentheses are kept:
+    "Kaijū n°8 (Saison 2)" becomes "kaiju n 8 saison 2".
+    """
+    return normalize_title(re.sub(r"[()]", " ", title or ""))
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Condition-based waits for the publishing scripts.
+
+Instead of sleeping a fixed time after each action, the scripts wait for the
+DOM or navigation event that the action triggers (the autocomplete list
+appearing, #id_business getting a value, the page changing after a submit)
+and continue as soon as it happens. Every wait belongs to a named step with
+its own timeout budget, and the time actually spent is recorded per step so
+the run summary shows how much of the run was spent waiting.
+
+Deliberate pauses (between files, review time) go through WaitEngine.sleep
+so that they show up in the same report.
+"""
+
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+DEFAULT_POLL_INTERVAL = 0.1
+
+# Timeout budget of each step, in seconds
+DEFAULT_BUDGETS = {
+    "page_load": 10,
+    "login": 10,
+    "form_submit": 15,
+    "autocomplete": 5,
+    "business_id": 3,
+    "role_options": 3,
+    "staff_submit": 10,
+    "tag_click": 3,
+}
+
+
+def document_ready(driver):
+    """Condition: the current document has finished loading"""
+    return driver.execute_script("return document.readyState;") == "complete"
+
+
+def field_has_value(element_id):
+    """Condition: the field has a non-blank value; returns the value"""
+    def condition(driver):
+        value = driver.find_element(By.ID, element_id).get_attribute("value") or ""
+        return value.strip() or False
+    return condition
+
+
+def field_value_changes(element_id, old_value):
+    """Condition: the field value differs from old_value (also after a reload)"""
+    def condition(driver):
+        return (driver.find_element(By.ID, element_id).get_attribute("value") or "") != old_value
+    return condition
+
+
+def visible_links(element_id):
+    """Condition: the element is displayed and has links; returns the links"""
+    def condition(driver):
+        element = driver.find_element(By.ID, element_id)
+        if not element.is_displayed():
+            return False
+        return element.find_elements(By.TAG_NAME, "a") or False
+    return condition
+
+
+def parse_budgets(specs):
+    """
+    Parse STEP=SECONDS command line values
+
+    Returns:
+        dict: {step: seconds}
+    """
+    budgets = {}
+    for spec in specs or []:
+        step, _, seconds = spec.partition("=")
+        try:
+            budgets[step.strip()] = float(seconds)
+        except ValueError:
+            raise ValueError(f"Invalid wait budget '{spec}', expected STEP=SECONDS")
+    return budgets
+
+
+class WaitEngine:
+    def __init__(self, budgets=None, poll_interval=DEFAULT_POLL_INTERVAL):
+        """
+        Args:
+            budgets (dict, optional): {step: seconds}, overriding DEFAULT_BUDGETS
+            poll_interval (float): Seconds between two checks of a condition
+        """
+        self.budgets = dict(DEFAULT_BUDGETS)
+        self.budgets.update(budgets or {})
+        self.poll_interval = poll_interval
+        self.started_at = time.monotonic()
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def configure(self, budgets=None, poll_interval=None):
+        """Override step budgets and/or the poll interval (e.g. from command line flags)"""
+        self.budgets.update(budgets or {})
+        if poll_interval is not None:
+            self.poll_interval = poll_interval
+
+    def budget(self, step):
+        return self.budgets.get(step, DEFAULT_BUDGETS["page_load"])
+
+    def until(self, driver, step, condition, timeout=None, message=""):
+        """
+        Wait until condition(driver) returns a truthy value
+
+        NoSuchElementException raised by the condition counts as "not yet".
+
+        Args:
+            driver: WebDriver passed to the condition
+            step (str): Step name, for the budget and the report
+            condition (callable): Selenium expected condition or any callable taking the driver
+            timeout (float, optional): Overrides the step budget
+
+        Returns:
+            The value returned by the condition
+
+        Raises:
+            TimeoutException: If the condition is still false after the budget
+        """
+        timeout = self.budget(step) if timeout is None else timeout
+        start = time.monotonic()
+        timed_out = False
+        try:
+            return WebDriverWait(driver, timeout, poll_frequency=self.poll_interval).until(condition, message)
+        except TimeoutException:
+            timed_out = True
+            raise
+        finally:
+            self._record(step, time.monotonic() - start, timed_out)
+
+    def sleep(self, step, seconds):
+        """Deliberate pause, recorded like a wait"""
+        if seconds <= 0:
+            return
+        time.sleep(seconds)
+        self._record(step, seconds, False)
+
+    def _record(self, step, elapsed, timed_out):
+        with self._lock:
+            stats = self.stats.setdefault(step, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+            stats["count"] += 1
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+            stats["timeouts"] += timed_out
+
+    def total_waited(self):
+        with self._lock:
+            return sum(stats["total"] for stats in self.stats.values())
+
+    def print_report(self, sessions=1):
+        """
+        Args:
+            sessions (int): Sessions that waited in parallel; the idle share is
+                            relative to their combined time
+        """
+        if not self.stats:
+            return
+        print(f"\n{'Wait step':<15} {'Waits':>6} {'Total':>9} {'Avg':>7} {'Max':>7} {'Timeouts':>9}")
+        with self._lock:
+            steps = sorted(self.stats.items(), key=lambda item: -item[1]["total"])
+        for step, stats in steps:
+            print(f"{step:<15} {stats['count']:>6} {stats['total']:>8.1f}s "
+                  f"{stats['total'] / stats['count']:>6.2f}s {stats['max']:>6.2f}s {stats['timeouts']:>9}")
+        elapsed = time.monotonic() - self.started_at
+        waited = self.total_waited()
+        share = waited / (elapsed * sessions) * 100 if elapsed else 0.0
+        if sessions > 1:
+            print(f"Waiting: {waited:.1f}s over {sessions} sessions of {elapsed:.1f}s run time ({share:.0f}%)")
+        else:
+            print(f"Waiting: {waited:.1f}s of {elapsed:.1f}s run time ({share:.0f}%)")
+
+
+# Shared by every script of the process
+WAITS = WaitEngine()
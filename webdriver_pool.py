@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Pool of warm Chrome WebDrivers shared by the scrapers of a batch.
+
+Drivers are started lazily, handed out one per caller and returned to the
+pool after each page, so Chrome is not started and torn down for every title.
+A driver is recycled after a fixed number of pages, or right away when it
+crashed, to keep memory growth and broken sessions in check.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+
+
+class WebDriverPool:
+    def __init__(self, size=1, webdriver_path=None, headless=True, max_pages=50):
+        """
+        Args:
+            size (int): Maximum number of live drivers
+            webdriver_path (str, optional): Path to ChromeDriver executable
+            headless (bool): Run Chrome without a visible window
+            max_pages (int): Pages served by a driver before it is recycled
+        """
+        self.size = max(1, size)
+        self.webdriver_path = webdriver_path
+        self.headless = headless
+        self.max_pages = max_pages
+        self.created = 0
+        self.recycled = 0
+
+        self._idle = deque()
+        self._page_counts = {}
+        self._live = 0
+        self._lock = threading.Lock()
+        # Notified when a driver is returned or retired, so waiting callers
+        # can take it or start a replacement
+        self._available = threading.Condition(self._lock)
+        self._closed = False
+
+    def _create_driver(self):
+        options = webdriver.ChromeOptions()
+        if self.headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-logging")
+        options.add_argument("--log-level=3")
+
+        if self.webdriver_path:
+            driver = webdriver.Chrome(service=Service(self.webdriver_path), options=options)
+        else:
+            driver = webdriver.Chrome(options=options)
+
+        with self._lock:
+            self.created += 1
+            self._page_counts[id(driver)] = 0
+        return driver
+
+    def acquire(self, timeout=None):
+        """
+        Take a driver from the pool, starting a new one if the pool is not full
+
+        Args:
+            timeout (float, optional): Seconds to wait for a free driver
+
+        Returns:
+            WebDriver: A driver reserved for the caller until release()
+
+        Raises:
+            TimeoutError: If no driver became free within timeout
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("WebDriverPool has been shut down")
+                if self._idle:
+                    return self._idle.popleft()
+                if self._live < self.size:
+                    self._live += 1
+                    break
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No free driver in the pool after {timeout}s")
+                self._available.wait(remaining)
+
+        try:
+            return self._create_driver()
+        except Exception:
+            with self._available:
+                self._live -= 1
+                self._available.notify()
+            raise
+
+    def release(self, driver, crashed=False):
+        """
+        Return a driver to the pool, quitting it if it crashed or is worn out
+        """
+        with self._available:
+            pages = self._page_counts.get(id(driver), 0) + 1
+            self._page_counts[id(driver)] = pages
+            if not (crashed or self._closed or pages >= self.max_pages):
+                self._idle.append(driver)
+                self._available.notify()
+                return
+
+        self._quit(driver)
+        with self._available:
+            self._live -= 1
+            if not self._closed:
+                self.recycled += 1
+            self._available.notify()
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """
+        Context manager around acquire()/release()
+
+        A WebDriverException raised inside the block marks the driver as
+        crashed so it is replaced instead of being handed out again.
+        """
+        driver = self.acquire(timeout=timeout)
+        crashed = False
+        try:
+            yield driver
+        except WebDriverException:
+            crashed = True
+            raise
+        finally:
+            self.release(driver, crashed=crashed)
+
+    def _quit(self, driver):
+        with self._lock:
+            self._page_counts.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"⚠ Error while closing a pooled driver: {e}")
+
+    def shutdown(self):
+        """Quit every idle driver; drivers still in use are quit on release"""
+        with self._available:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._live -= len(idle)
+            self._available.notify_all()
+        for driver in idle:
+            self._quit(driver)
+        print(f"Driver pool closed: {self.created} drivers started, {self.recycled} recycled")